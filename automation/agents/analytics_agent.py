@@ -26,9 +26,13 @@ class AnalyticsAgent(BaseAgent):
         workflow_type = kwargs.get("workflow_type", "metrics_review")
 
         if workflow_type == "metrics_review":
-            return self.generate_metrics_review(
-                metrics=kwargs.get("metrics", {})
-            )
+            metrics = kwargs.get("metrics", {})
+            if not metrics and kwargs.get("metrics_sheet_id"):
+                metrics = self.load_metrics_from_sheet(
+                    spreadsheet_id=kwargs["metrics_sheet_id"],
+                    range_name=kwargs.get("metrics_range", "Sheet1")
+                )
+            return self.generate_metrics_review(metrics=metrics)
         elif workflow_type == "ab_test_analysis":
             return self.analyze_ab_test(
                 test_name=kwargs.get("test_name", "Unknown Test"),
@@ -37,6 +41,44 @@ class AnalyticsAgent(BaseAgent):
         else:
             return self.generate_metrics_review()
 
+    def load_metrics_from_sheet(
+        self,
+        spreadsheet_id: str,
+        range_name: str = "Sheet1"
+    ) -> Dict[str, Any]:
+        """
+        Load the latest metrics snapshot from a Google Sheet
+
+        Expects one row per period and one column per metric. Numeric columns
+        are summarized column-wise from a DataFrame rather than row by row.
+
+        Args:
+            spreadsheet_id: Metrics spreadsheet ID
+            range_name: A1 range holding the metrics table (with header row)
+
+        Returns:
+            Dictionary of metrics in the format used by generate_metrics_review
+        """
+        from utils.google.sheets_client import sheets_client
+
+        frame = sheets_client.get_frame(spreadsheet_id, range_name)
+        numeric = frame.select_dtypes(include="number").ffill()
+        if numeric.empty:
+            logger.warning(f"No numeric metrics found in {range_name}")
+            return {}
+
+        latest = numeric.iloc[-1]
+        previous = numeric.iloc[-2] if len(numeric) > 1 else latest
+        change = ((latest - previous) / previous.abs().where(previous != 0) * 100).dropna()
+
+        metrics = {}
+        for name in numeric.columns:
+            trend = f"{change[name]:+.1f}%" if name in change.index else "N/A"
+            metrics[name] = {"value": latest[name], "trend": trend}
+
+        logger.info(f"Loaded {len(metrics)} metrics from sheet")
+        return metrics
+
     def generate_metrics_review(
         self,
         metrics: Optional[Dict[str, Any]] = None
@@ -11,13 +11,15 @@ This agent orchestrates the stakeholder discovery workflow:
 7. Generate discovery reports
 """
 
-from typing import List, Optional, Dict, Any
+import threading
+from typing import List, Optional, Dict, Any, Iterator
 from datetime import datetime, timedelta
 from loguru import logger
 
 from skills.document_search import DocumentSearch
 from skills.document_reader import DocumentReader
 from skills.note_synthesis import NoteSynthesis
+from skills.relevance_filter import RelevanceFilter
 from skills.stakeholder_profiler import StakeholderProfiler
 from skills.relationship_mapper import RelationshipMapper
 from skills.insight_aggregator import InsightAggregator
@@ -30,7 +32,11 @@ from models.relationship import InfluenceMatrix
 from models.insight import Theme, Conflict
 from models.report import DiscoveryReport, InsightSummary
 from models.action import ActionItem
+from models.enums import Stance
 
+from utils.discovery_store import DiscoveryStore
+from utils.pipeline import Pipeline, Stage
+from utils.run_checkpoint import RunCheckpoint
 from config import settings
 
 
@@ -46,12 +52,16 @@ class StakeholderDiscoveryAgent:
         self.document_search = DocumentSearch()
         self.document_reader = DocumentReader()
         self.note_synthesis = NoteSynthesis()
+        self.relevance_filter = RelevanceFilter()
         self.stakeholder_profiler = StakeholderProfiler()
         self.relationship_mapper = RelationshipMapper()
         self.insight_aggregator = InsightAggregator()
         self.task_creator = TaskCreator()
         self.report_generator = ReportGenerator()
 
+        # Persisted state for incremental runs
+        self.state_store = DiscoveryStore()
+
         logger.info("Initialized StakeholderDiscoveryAgent")
 
     def run_discovery(
@@ -63,10 +73,15 @@ class StakeholderDiscoveryAgent:
         report_title: str = "Stakeholder Discovery",
         output_folder_id: Optional[str] = None,
         create_tasks: bool = True,
+        update_report: bool = False,
+        incremental: bool = False,
     ) -> DiscoveryReport:
         """
         Run the full stakeholder discovery workflow.
 
+        Each stage's output is checkpointed under a run ID, so a run that
+        fails part way can be continued with resume().
+
         Args:
             folder_id: Folder containing discovery notes
             keywords: Optional keywords to filter documents
@@ -75,93 +90,497 @@ class StakeholderDiscoveryAgent:
             report_title: Title for the generated report
             output_folder_id: Folder to save report to
             create_tasks: Whether to create follow-up tasks
+            update_report: Refresh the last report doc with this title in place
+            incremental: Load the previous run's state for this report title and
+                         only process documents changed since then
 
         Returns:
             DiscoveryReport with all findings
         """
-        logger.info(f"Starting stakeholder discovery: {report_title}")
-
-        # Step 1: Find documents
-        logger.info("Step 1: Searching for documents...")
-        documents = self._gather_documents(
-            folder_id=folder_id,
-            keywords=keywords,
-            date_from=date_from,
-            date_to=date_to,
-        )
-        logger.info(f"Found {len(documents)} documents")
-
-        if not documents:
-            logger.warning("No documents found. Creating empty report.")
-            return DiscoveryReport(title=report_title)
-
-        # Step 2: Read documents
-        logger.info("Step 2: Reading documents...")
-        document_contents = self._read_documents(documents)
-        logger.info(f"Read {len(document_contents)} documents")
+        run = RunCheckpoint.create({
+            "folder_id": folder_id,
+            "keywords": keywords,
+            "date_from": date_from.isoformat() if date_from else None,
+            "date_to": date_to.isoformat() if date_to else None,
+            "report_title": report_title,
+            "output_folder_id": output_folder_id,
+            "create_tasks": create_tasks,
+            "update_report": update_report,
+            "incremental": incremental,
+        })
+        RunCheckpoint.prune(settings.discovery_run_retention)
+
+        logger.info(f"Starting stakeholder discovery: {report_title} (run {run.run_id})")
+        return self._execute_run(run)
+
+    def resume(self, run_id: str) -> Optional[DiscoveryReport]:
+        """
+        Continue a failed or interrupted discovery run.
 
-        # Step 3: Extract insights
-        logger.info("Step 3: Extracting insights...")
-        insights = self._extract_insights(document_contents)
-        logger.info(f"Extracted insights from {len(insights)} documents")
+        Completed stages are restored from the run's checkpoint, and
+        documents already read or extracted are not fetched or sent to
+        the model again.
 
-        # Step 4: Build profiles
-        logger.info("Step 4: Building stakeholder profiles...")
-        profiles = self._build_profiles(insights)
-        logger.info(f"Built {len(profiles)} stakeholder profiles")
+        Args:
+            run_id: Run ID logged when the run started
 
-        # Step 5: Map relationships
-        logger.info("Step 5: Mapping relationships...")
-        influence_matrix = self._map_relationships(profiles)
+        Returns:
+            DiscoveryReport or None if the run does not exist
+        """
+        run = RunCheckpoint.load(run_id)
+        if not run:
+            logger.error(f"No discovery run found with ID {run_id}")
+            return None
 
-        # Step 6: Aggregate insights
-        logger.info("Step 6: Aggregating insights...")
-        themes, conflicts, summary = self._aggregate_insights(profiles, insights)
-        logger.info(f"Found {len(themes)} themes, {len(conflicts)} conflicts")
+        if run.finished:
+            logger.info(f"Discovery run {run_id} already completed")
+            return DiscoveryReport.from_dict(run.load_stage("report"))
+
+        logger.info(f"Resuming discovery run {run_id} after: {', '.join(run.completed) or 'no stages'}")
+        return self._execute_run(run)
+
+    def _execute_run(self, run: RunCheckpoint) -> DiscoveryReport:
+        """Run the discovery steps, skipping stages the checkpoint already holds"""
+        params = run.params
+        report_title = params["report_title"]
+        previous = self._load_state(report_title) if params["incremental"] else None
+
+        if run.is_complete("profiles"):
+            logger.info("Steps 1-4: Restored documents, insights and profiles from checkpoint")
+            documents, document_contents, insights = self._restore_documents(run)
+            stored = run.load_stage("profiles")
+            self.stakeholder_profiler.import_profiles(stored["profiles"])
+            profiles = self.stakeholder_profiler.list_all_profiles()
+            affected = set(stored["affected"])
+            all_insights = self._merge_insights(previous, insights)
+        else:
+            date_from = datetime.fromisoformat(params["date_from"]) if params["date_from"] else None
+            date_to = datetime.fromisoformat(params["date_to"]) if params["date_to"] else None
+            if previous and previous["checkpoint"] and not (params["folder_id"] or params["keywords"]) and not date_from:
+                # Only notes modified since the last run can have changed
+                date_from = previous["checkpoint"] - timedelta(hours=1)
+
+            # Steps 1-4 stream: document N+1 is read while document N is being
+            # extracted, and profiles are updated as each insight arrives
+            logger.info("Steps 1-4: Searching, reading, extracting and building profiles...")
+            documents: List[Dict[str, Any]] = []
+            document_contents: List[DocumentContent] = []
+            insights: List[StakeholderInsight] = []
+            rebuild, affected = set(), set()
+
+            if previous:
+                self.stakeholder_profiler.import_profiles([p.to_dict() for p in previous["profiles"]])
+
+            source = self._iter_documents(
+                documents,
+                previous,
+                run,
+                folder_id=params["folder_id"],
+                keywords=params["keywords"],
+                date_from=date_from,
+                date_to=date_to,
+            )
+            for content, insight, delta, base in self._build_pipeline(run).run(source):
+                document_contents.append(content)
+                insights.append(insight)
+                self._update_profiles(previous, insight, rebuild, affected, delta, base)
+
+            skipped = run.load_records("skipped")
+            logger.info(
+                f"Processed {len(documents)} documents: read {len(document_contents)}, "
+                f"extracted insights from {len(insights)}, skipped {len(skipped)} as not meeting notes"
+            )
+            if skipped:
+                logger.info(f"Skip report: {run.path / 'skipped.jsonl'}")
+
+            if not documents and not previous:
+                logger.warning("No documents found. Creating empty report.")
+                report = DiscoveryReport(title=report_title)
+                run.save_stage("report", report.to_dict())
+                run.finish()
+                return report
+
+            profiles, affected, all_insights = self._finalize_profiles(previous, insights, rebuild, affected)
+            logger.info(f"Updated {len(affected)} of {len(profiles)} stakeholder profiles")
+            run.save_stage("profiles", {
+                "profiles": [p.to_dict() for p in profiles],
+                "affected": sorted(affected),
+            })
+
+        if run.is_complete("analysis"):
+            logger.info("Steps 5-6: Restored analysis from checkpoint")
+            analysis = run.load_stage("analysis")
+            influence_matrix = InfluenceMatrix.from_dict(analysis["influence_matrix"])
+            themes = [Theme.from_dict(t) for t in analysis["themes"]]
+            conflicts = [Conflict.from_dict(c) for c in analysis["conflicts"]]
+            summary = InsightSummary.from_dict(analysis["summary"])
+        else:
+            if previous and not affected and previous["influence_matrix"]:
+                # Nothing changed, so relationships and aggregates still hold
+                logger.info("Steps 5-6: No profile changes, reusing previous analysis")
+                influence_matrix = previous["influence_matrix"]
+                themes, conflicts, summary = previous["themes"], previous["conflicts"], previous["summary"]
+            else:
+                # Step 5: Map relationships
+                logger.info("Step 5: Mapping relationships...")
+                influence_matrix = self._map_relationships(profiles)
+
+                # Step 6: Aggregate insights
+                logger.info("Step 6: Aggregating insights...")
+                themes, conflicts, summary = self._aggregate_insights(profiles, all_insights)
+                logger.info(f"Found {len(themes)} themes, {len(conflicts)} conflicts")
+
+            run.save_stage("analysis", {
+                "influence_matrix": influence_matrix.to_dict(),
+                "themes": [t.to_dict() for t in themes],
+                "conflicts": [c.to_dict() for c in conflicts],
+                "summary": summary.to_dict(),
+            })
 
         # Step 7: Create tasks (if enabled)
-        action_items = []
-        if create_tasks:
-            logger.info("Step 7: Creating follow-up tasks...")
-            action_items = self._create_tasks(profiles, insights)
-            logger.info(f"Created {len(action_items)} tasks")
+        if run.is_complete("tasks"):
+            action_items = [ActionItem.from_dict(a) for a in run.load_stage("tasks")]
+        else:
+            action_items = []
+            if params["create_tasks"]:
+                logger.info("Step 7: Creating follow-up tasks...")
+                action_items = self._create_tasks(
+                    [p for p in profiles if p.id in affected],
+                    insights,
+                )
+                logger.info(f"Created {len(action_items)} tasks")
+            run.save_stage("tasks", [a.to_dict() for a in action_items])
 
         # Step 8: Generate report
-        logger.info("Step 8: Generating report...")
-        report = self._generate_report(
-            title=report_title,
-            profiles=profiles,
-            summary=summary,
-            influence_matrix=influence_matrix,
-            themes=themes,
-            conflicts=conflicts,
-            action_items=action_items,
-            source_documents=document_contents,
-            folder_id=output_folder_id,
-        )
+        if run.is_complete("report"):
+            report = DiscoveryReport.from_dict(run.load_stage("report"))
+        else:
+            logger.info("Step 8: Generating report...")
+            report = self._generate_report(
+                title=report_title,
+                profiles=profiles,
+                summary=summary,
+                influence_matrix=influence_matrix,
+                themes=themes,
+                conflicts=conflicts,
+                action_items=action_items,
+                source_documents=document_contents,
+                folder_id=params["output_folder_id"],
+                update_existing=params["update_report"],
+            )
+            run.save_stage("report", report.to_dict())
+
+        if params["incremental"]:
+            self._save_state(
+                scope=report_title,
+                started_at=run.started_at,
+                documents=documents,
+                pending=self._pending_documents(run, documents, insights),
+                insights=insights,
+                profiles=profiles,
+                influence_matrix=influence_matrix,
+                themes=themes,
+                conflicts=conflicts,
+                summary=summary,
+            )
 
+        run.finish()
         logger.info(f"Discovery complete. Report: {report.google_doc_url or 'Not saved'}")
         return report
 
+    def _restore_documents(self, run: RunCheckpoint) -> tuple:
+        """
+        Restore the document list, contents and insights of a run.
+
+        Returns:
+            (documents, DocumentContent list, StakeholderInsight list) in listing order
+        """
+        documents = run.load_stage("documents") or []
+        contents = run.load_records("contents")
+        insights = run.load_records("insights")
+
+        return (
+            documents,
+            [DocumentContent.from_dict(contents[d["id"]]) for d in documents if d["id"] in contents],
+            [StakeholderInsight.from_dict(insights[d["id"]]) for d in documents if d["id"] in insights],
+        )
+
+    def _load_state(self, scope: str) -> Optional[Dict[str, Any]]:
+        """Load the state persisted by the last incremental run, if any"""
+        checkpoint = self.state_store.get_checkpoint(scope)
+        if not checkpoint:
+            logger.info("No previous discovery state, running a full discovery")
+            return None
+
+        stored = self.state_store.load_insights(scope)
+        matrix = self.state_store.get_state(scope, "influence_matrix")
+        summary = self.state_store.get_state(scope, "summary")
+
+        return {
+            "checkpoint": checkpoint,
+            "insights": {doc_id: insight for doc_id, (insight, _) in stored.items()},
+            "versions": {doc_id: version for doc_id, (_, version) in stored.items()},
+            "pending": self.state_store.get_state(scope, "pending") or [],
+            "profiles": self.state_store.load_profiles(scope),
+            "influence_matrix": InfluenceMatrix.from_dict(matrix) if matrix else None,
+            "themes": [Theme.from_dict(t) for t in self.state_store.get_state(scope, "themes") or []],
+            "conflicts": [Conflict.from_dict(c) for c in self.state_store.get_state(scope, "conflicts") or []],
+            "summary": InsightSummary.from_dict(summary) if summary else InsightSummary(),
+        }
+
+    def _build_pipeline(self, run: RunCheckpoint) -> Pipeline:
+        """
+        Build the read, classify and extract stages of the discovery pipeline.
+
+        Each document's content and insight is checkpointed as soon as it
+        is produced, and documents the run already processed are restored
+        instead of being fetched or extracted again. Documents the relevance
+        filter rejects are recorded in the run's skip report.
+        """
+        contents = run.load_records("contents")
+        extracted = run.load_records("insights")
+        additions = run.load_records("additions")
+        skipped = run.load_records("skipped")
+        if contents or extracted:
+            logger.info(f"Restoring {len(contents)} read and {len(extracted)} extracted documents from checkpoint")
+
+        # Names of stakeholders seen in earlier runs count towards relevance
+        self.relevance_filter.set_known_names(
+            p.name for p in self.stakeholder_profiler.list_all_profiles()
+        )
+
+        kept: set = set()
+        lock = threading.Lock()
+
+        def read(file_info: Dict[str, Any]) -> Optional[DocumentContent]:
+            if file_info["id"] in contents:
+                document = DocumentContent.from_dict(contents[file_info["id"]])
+            else:
+                document = self._read_document(file_info)
+                if document:
+                    run.append_record("contents", file_info["id"], document.to_dict())
+            if not document:
+                return None
+
+            # Catch copies the listing couldn't: new documents signed as they were read
+            with lock:
+                original = self._find_copy_of(document, kept)
+                if original:
+                    logger.info(f"Skipping {document.title}: copy of already processed {original}")
+                    run.append_record("copies", document.id, original)
+                    return None
+                kept.add(document.id)
+            return document
+
+        def classify(document: DocumentContent) -> Optional[DocumentContent]:
+            if document.id in extracted:
+                return document
+            if document.id in skipped:
+                return None
+            result = self.relevance_filter.score(document)
+            if result["relevant"]:
+                return document
+            logger.info(f"Skipping {document.title}: not meeting notes ({result['reason']}, score {result['score']})")
+            run.append_record("skipped", document.id, self.relevance_filter.skip_entry(document, result))
+            return None
+
+        def extract(document: DocumentContent) -> tuple:
+            if document.id in extracted:
+                addition = additions.get(document.id) or {}
+                return (
+                    document,
+                    StakeholderInsight.from_dict(extracted[document.id]),
+                    StakeholderInsight.from_dict(addition["delta"]) if addition.get("delta") else None,
+                    datetime.fromisoformat(addition["base"]) if addition.get("base") else None,
+                )
+            document, insight, delta, base = self._extract_document(document)
+            if base:
+                run.append_record("additions", document.id, {
+                    "delta": delta.to_dict() if delta else None,
+                    "base": base.isoformat(),
+                })
+            run.append_record("insights", document.id, insight.to_dict())
+            return document, insight, delta, base
+
+        return Pipeline(
+            [
+                Stage("read", read, workers=settings.discovery_read_workers),
+                Stage("classify", classify),
+                Stage("extract", extract, workers=settings.discovery_extract_workers),
+            ],
+            queue_size=settings.discovery_queue_size,
+        )
+
+    def _find_copy_of(self, document: DocumentContent, doc_ids: set) -> Optional[str]:
+        """Get the ID of a document in doc_ids that duplicates or contains this one"""
+        for match in self.document_reader.minhash.matches(document.id):
+            if match["doc_id"] in doc_ids and match["relation"] in ("duplicate", "subset"):
+                return match["doc_id"]
+        return None
+
+    def _update_profiles(
+        self,
+        previous: Optional[Dict[str, Any]],
+        insight: StakeholderInsight,
+        rebuild: set,
+        affected: set,
+        delta: Optional[StakeholderInsight] = None,
+        base: Optional[datetime] = None,
+    ) -> None:
+        """
+        Profile-update stage: merge one insight as it arrives.
+
+        Insights from new documents are applied right away. If a changed
+        document only gained sections since the insight the profile holds
+        (base matches its extraction time), just the insight from those
+        sections (delta) is applied. Otherwise the old contribution can't be
+        subtracted, so the stakeholders it touched are only marked for a
+        rebuild once the stream drains.
+        """
+        old = previous["insights"].get(insight.source_doc_id) if previous else None
+        if old and base and old.extracted_at == base:
+            if delta:
+                profile = self.stakeholder_profiler.apply_insight(delta)
+                if profile:
+                    affected.add(profile.id)
+            return
+        if old:
+            rebuild.update(n.lower() for n in (old.stakeholder_name, insight.stakeholder_name) if n)
+            return
+
+        profile = self.stakeholder_profiler.apply_insight(insight)
+        if profile:
+            affected.add(profile.id)
+
+    def _finalize_profiles(
+        self,
+        previous: Optional[Dict[str, Any]],
+        insights: List[StakeholderInsight],
+        rebuild: set,
+        affected: set,
+    ) -> tuple:
+        """
+        Rebuild changed stakeholders and analyze the affected profiles.
+
+        Returns:
+            (all profiles, IDs of affected profiles, merged insight list)
+        """
+        profiler = self.stakeholder_profiler
+
+        if not previous:
+            profiles = [p for p in profiler.list_all_profiles() if p.total_interactions > 0]
+            for profile in profiles:
+                profiler.analyze_profile(profile)
+            return profiler.list_all_profiles(), {p.id for p in profiles}, insights
+
+        merged = self._merge_insights(previous, insights)
+
+        # Group by resolved profile, so insights naming the same person
+        # differently ("Sam Lee", "Samuel Lee") are rebuilt together
+        targets: Dict[str, str] = {}
+        for name in rebuild:
+            existing = profiler.get_profile_by_name(name)
+            targets.setdefault(existing.id if existing else name, name)
+        groups: Dict[str, List[StakeholderInsight]] = {key: [] for key in targets}
+        for insight in merged:
+            if not insight.stakeholder_name:
+                continue
+            existing = profiler.get_profile_by_name(
+                insight.stakeholder_name,
+                insight.stakeholder_email,
+                insight.stakeholder_department,
+            )
+            key = existing.id if existing else insight.stakeholder_name.lower()
+            if key in groups:
+                groups[key].append(insight)
+
+        for key, name in targets.items():
+            profile = profiler.rebuild_profile(name, groups[key])
+            if profile:
+                affected.add(profile.id)
+
+        for profile_id in affected:
+            profiler.analyze_profile(profiler.get_profile(profile_id))
+
+        return profiler.list_all_profiles(), affected, merged
+
+    def _merge_insights(
+        self,
+        previous: Optional[Dict[str, Any]],
+        insights: List[StakeholderInsight],
+    ) -> List[StakeholderInsight]:
+        """Combine the previous run's insights with this run's, newer ones winning"""
+        if not previous:
+            return insights
+
+        merged = dict(previous["insights"])
+        merged.update((i.source_doc_id, i) for i in insights)
+        return list(merged.values())
+
+    def _save_state(
+        self,
+        scope: str,
+        started_at: datetime,
+        documents: List[Dict[str, Any]],
+        pending: List[Dict[str, Any]],
+        insights: List[StakeholderInsight],
+        profiles: List[StakeholderProfile],
+        influence_matrix: InfluenceMatrix,
+        themes: List[Theme],
+        conflicts: List[Conflict],
+        summary: InsightSummary,
+    ) -> None:
+        """
+        Persist this run's results for the next incremental run.
+
+        The checkpoint moves past every listed document, so the listing
+        entries of documents that did not finish (failed reads or
+        extractions) are stored as pending and listed again next run.
+        """
+        versions = {d["id"]: d.get("modifiedTime") for d in documents}
+        self.state_store.save_insights(scope, insights, versions)
+        self.state_store.set_state(scope, "pending", pending)
+        if pending:
+            logger.warning(f"{len(pending)} documents did not finish and will be retried next run")
+        self.state_store.save_profiles(scope, profiles)
+        self.state_store.set_state(scope, "influence_matrix", influence_matrix.to_dict())
+        self.state_store.set_state(scope, "themes", [t.to_dict() for t in themes])
+        self.state_store.set_state(scope, "conflicts", [c.to_dict() for c in conflicts])
+        self.state_store.set_state(scope, "summary", summary.to_dict())
+        self.state_store.set_state(scope, "checkpoint", started_at.isoformat())
+
+    def _pending_documents(
+        self,
+        run: RunCheckpoint,
+        documents: List[Dict[str, Any]],
+        insights: List[StakeholderInsight],
+    ) -> List[Dict[str, Any]]:
+        """Listed documents that produced no insight and were not skipped on purpose"""
+        done = {i.source_doc_id for i in insights}
+        done.update(run.load_records("skipped"))
+        done.update(run.load_records("copies"))
+        return [d for d in documents if d["id"] not in done]
+
     def _gather_documents(
         self,
         folder_id: Optional[str] = None,
         keywords: Optional[str] = None,
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
-    ) -> List[Dict[str, Any]]:
-        """Gather relevant documents from Google Drive"""
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily gather relevant documents from Google Drive"""
 
         if folder_id:
             # Get all documents from folder
-            docs = self.document_search.get_folder_contents(
+            docs = self.document_search.iter_folder_contents(
                 folder_id=folder_id,
                 recursive=True,
                 file_types=["docs", "sheets"],
             )
         elif keywords:
-            # Search by keywords
-            docs = self.document_search.search(
+            # Search Drive by keywords (new notes are not in the local
+            # index until they are read)
+            docs = self.document_search.iter_search(
                 keywords=keywords,
                 file_types=["docs"],
                 date_from=date_from,
@@ -169,40 +588,80 @@ class StakeholderDiscoveryAgent:
             )
         else:
             # Get recent meeting notes
-            docs = self.document_search.find_meeting_notes(
+            docs = self.document_search.iter_meeting_notes(
                 date_from=date_from or (datetime.utcnow() - timedelta(days=30)),
                 date_to=date_to,
             )
 
-        return docs
+        # Copies of the same notes are read and extracted only once
+        return self.document_search.iter_collapse_duplicates(docs)
 
-    def _read_documents(
+    def _iter_documents(
         self,
-        documents: List[Dict[str, Any]],
-    ) -> List[DocumentContent]:
-        """Read and parse document contents"""
-
-        doc_ids = [d["id"] for d in documents]
-        return self.document_reader.read_multiple(doc_ids)
+        seen: List[Dict[str, Any]],
+        previous: Optional[Dict[str, Any]],
+        run: RunCheckpoint,
+        **search: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Search stage: yield the documents to process.
+
+        Documents are yielded as their listing pages arrive, so reading
+        starts before the search has finished. Documents unchanged since
+        the previous run are skipped, and documents that did not finish in
+        the previous run are yielded again after the listing. The list is checkpointed once the
+        listing is complete so a resumed run processes the same documents,
+        and every yielded document is also appended to seen. If the listing
+        fails part way, the error propagates and neither the document list
+        nor the incremental state is saved, so resume() lists again.
+        """
+        if run.is_complete("documents"):
+            documents = run.load_stage("documents")
+            logger.info(f"Restored {len(documents)} documents from checkpoint")
+            for doc in documents:
+                seen.append(doc)
+                yield doc
+            return
+
+        versions = previous["versions"] if previous else {}
+        listed = 0
+        for doc in self._gather_documents(**search):
+            listed += 1
+            if doc.get("modifiedTime") and versions.get(doc["id"]) == doc["modifiedTime"]:
+                continue
+            seen.append(doc)
+            yield doc
+
+        # Documents that did not finish last run are not modified since, so
+        # the narrowed listing misses them
+        seen_ids = {d["id"] for d in seen}
+        retried = [d for d in (previous["pending"] if previous else []) if d["id"] not in seen_ids]
+        for doc in retried:
+            seen.append(doc)
+            yield doc
+
+        logger.info(
+            f"Found {listed} documents, {len(seen) - len(retried)} new or changed, "
+            f"retrying {len(retried)} unfinished"
+        )
+        run.save_stage("documents", list(seen))
 
-    def _extract_insights(
-        self,
-        documents: List[DocumentContent],
-    ) -> List[StakeholderInsight]:
-        """Extract stakeholder insights from documents"""
+    def _read_document(self, file_info: Dict[str, Any]) -> Optional[DocumentContent]:
+        """Read stage: parse one document, served from cache if unchanged"""
 
-        return self.note_synthesis.batch_extract(documents)
+        return self.document_reader.read_listed(file_info)
 
-    def _build_profiles(
-        self,
-        insights: List[StakeholderInsight],
-    ) -> List[StakeholderProfile]:
-        """Build stakeholder profiles from insights"""
+    def _extract_document(self, document: DocumentContent) -> tuple:
+        """
+        Extract stage: get the stakeholder insight of one document.
 
-        return self.stakeholder_profiler.build_profiles_from_insights(
-            insights,
-            analyze=True,
-        )
+        Returns:
+            (document, insight, insight of only the sections added since
+            the last processed revision or None, extraction time of that
+            revision's insight or None)
+        """
+        insight, delta, base = self.note_synthesis.extract_revision(document)
+        return document, insight, delta, base.extracted_at if base else None
 
     def _map_relationships(
         self,
@@ -249,18 +708,22 @@ class StakeholderDiscoveryAgent:
         for insight in insights:
             all_actions.extend(insight.action_items)
 
-        # Create tasks in Google Tasks
-        updated_actions = self.task_creator.batch_create(all_actions)
+        # One index sync covers the dedupe checks for all tasks below
+        self.task_creator.sync_index()
+
+        # Upsert tasks in Google Tasks
+        updated_actions = self.task_creator.batch_create(all_actions, sync=False)
 
         # Also create follow-up tasks for key stakeholders
         for profile in profiles:
-            if profile.stance in ["blocker", "skeptic"]:
+            if profile.stance in [Stance.BLOCKER, Stance.SKEPTIC]:
                 # Create follow-up for skeptics/blockers
                 self.task_creator.create_follow_up(
                     stakeholder=profile.name,
                     topic="Address concerns and build alignment",
                     due_date=datetime.utcnow() + timedelta(days=7),
                     notes=f"Key concerns: {', '.join(c.description for c in profile.top_concerns[:3])}",
+                    sync=False,
                 )
 
         return updated_actions
@@ -276,6 +739,7 @@ class StakeholderDiscoveryAgent:
         action_items: List[ActionItem],
         source_documents: List[DocumentContent],
         folder_id: Optional[str] = None,
+        update_existing: bool = False,
     ) -> DiscoveryReport:
         """Generate the final discovery report"""
 
@@ -287,6 +751,7 @@ class StakeholderDiscoveryAgent:
             themes=themes,
             conflicts=conflicts,
             folder_id=folder_id,
+            update_existing=update_existing,
         )
 
         report.action_plan = action_items
@@ -359,22 +824,34 @@ class StakeholderDiscoveryAgent:
         contents = self.document_reader.read_multiple([d["id"] for d in docs])
         insights = self.note_synthesis.batch_extract(contents)
 
-        # Filter insights for this stakeholder
-        relevant_insights = [
-            i for i in insights
-            if i.stakeholder_name.lower() == stakeholder_name.lower()
-        ]
+        profiler = self.stakeholder_profiler
+        existing = profiler.get_profile_by_name(stakeholder_name)
+        profile = existing or profiler.create_profile(stakeholder_name)
+
+        # Filter insights for this stakeholder, under any spelling of the name
+        relevant_insights = []
+        for insight in insights:
+            if not insight.stakeholder_name:
+                continue
+            match = profiler.get_profile_by_name(
+                insight.stakeholder_name,
+                insight.stakeholder_email,
+                insight.stakeholder_department,
+            )
+            if match and match.id == profile.id:
+                relevant_insights.append(insight)
 
         if not relevant_insights:
+            if not existing:
+                profiler.registry.remove(profile.id)
             logger.warning(f"No insights found for {stakeholder_name}")
             return None
 
         # Build profile
-        profile = self.stakeholder_profiler.get_or_create_profile(stakeholder_name)
         for insight in relevant_insights:
-            self.stakeholder_profiler.update_from_insight(profile, insight)
+            profiler.update_from_insight(profile, insight)
 
-        self.stakeholder_profiler.analyze_profile(profile)
+        profiler.analyze_profile(profile)
 
         return profile
 
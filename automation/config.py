@@ -78,6 +78,26 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite:///personal_os.db"
 
+    # Local store (caches, indexes and sync state; relative to base_dir)
+    local_store_dir: str = "data"
+
+    # Calendar sync
+    calendar_sync_days_back: int = 30               # History kept in the local event store
+    calendar_sync_interval_seconds: int = 60        # Min seconds between delta syncs
+
+    # Document cache
+    document_cache_max_mb: int = 256                # Total compressed size before LRU eviction
+    document_cache_max_doc_mb: int = 16             # Larger documents are not cached
+    document_cache_compression: str = "zlib"        # "zlib" (fast) or "lzma" (smaller)
+
+    # Discovery pipeline (workers per stage)
+    discovery_read_workers: int = 1                 # Google API clients share one connection
+    discovery_extract_workers: int = 4              # Concurrent LLM extraction calls
+    discovery_queue_size: int = 8                   # Items buffered between stages
+    discovery_run_retention: int = 10               # Finished run checkpoints kept for inspection
+    discovery_relevance_threshold: float = 0.4      # Min meeting-notes score for LLM extraction (0 = off)
+    discovery_relevance_min_words: int = 30         # Shorter documents are skipped
+
     # Logging
     log_level: str = "INFO"
     log_file: str = "logs/personal_os.log"
@@ -112,6 +132,12 @@ class Settings(BaseSettings):
             return []
         return [p.strip() for p in self.strategic_priorities.split(",")]
 
+    @property
+    def local_store_path(self) -> Path:
+        """Resolve the local store directory"""
+        path = Path(self.local_store_dir)
+        return path if path.is_absolute() else Path(self.base_dir) / path
+
     def validate_google_config(self) -> bool:
         """Check if Google Workspace is properly configured"""
         # Check if credentials file exists or service account is configured
@@ -124,6 +124,23 @@ class MentionedStakeholder:
     relationship_hint: str = ""        # e.g., "works closely with", "reports to"
     sentiment_toward: Sentiment = Sentiment.NEUTRAL
 
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "context": self.context,
+            "relationship_hint": self.relationship_hint,
+            "sentiment_toward": self.sentiment_toward.value,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MentionedStakeholder":
+        return cls(
+            name=data["name"],
+            context=data.get("context", ""),
+            relationship_hint=data.get("relationship_hint", ""),
+            sentiment_toward=Sentiment(data.get("sentiment_toward", "neutral")),
+        )
+
 
 @dataclass
 class Theme:
@@ -2,9 +2,10 @@
 Stakeholder Models - Stakeholder profiles and insights
 """
 
+import heapq
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Set, Callable, Any
 
 from models.enums import (
     Sentiment,
@@ -80,6 +81,7 @@ class StakeholderInsight:
             "overall_sentiment": self.overall_sentiment.value,
             "sentiment_details": self.sentiment_details,
             "key_quotes": [q.to_dict() for q in self.key_quotes],
+            "mentioned_stakeholders": [m.to_dict() for m in self.mentioned_stakeholders],
             "action_items": [a.to_dict() for a in self.action_items],
             "extraction_confidence": self.extraction_confidence,
             "extracted_at": self.extracted_at.isoformat() if self.extracted_at else None,
@@ -111,12 +113,75 @@ class StakeholderInsight:
             overall_sentiment=Sentiment(data.get("overall_sentiment", "neutral")),
             sentiment_details=data.get("sentiment_details", ""),
             key_quotes=[Quote.from_dict(q) for q in data.get("key_quotes", [])],
+            mentioned_stakeholders=[
+                MentionedStakeholder.from_dict(m) for m in data.get("mentioned_stakeholders", [])
+            ],
             action_items=[ActionItem.from_dict(a) for a in data.get("action_items", [])],
             extraction_confidence=data.get("extraction_confidence", 0.0),
             extracted_at=extracted_at,
         )
 
 
+SEVERITY_RANK = {Severity.LOW: 1, Severity.MEDIUM: 2, Severity.HIGH: 3}
+
+
+class ItemRanking:
+    """
+    Top-k of concerns or needs by how often they come up.
+
+    Items are grouped by lowercased description. Each group keeps its
+    count, its highest severity (if ranked by severity) and its first item,
+    which represents the group. Scores only grow, so the top k is kept in a
+    min-heap where adding an item costs O(log k); stale heap entries are
+    skipped lazily. Ties go to the group seen first.
+    """
+
+    def __init__(self, k: int = 5, severity: Optional[Callable[[Any], int]] = None):
+        self.k = k
+        self._severity = severity
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all counted items"""
+        self.size = 0                                # Items consumed so far
+        self._groups: Dict[str, list] = {}           # key -> [count, severity, order, first item]
+        self._top: Dict[str, tuple] = {}             # key -> current score, for the top k
+        self._heap: List[tuple] = []                 # (score, key), may hold stale scores
+
+    def add(self, item: Any) -> None:
+        """Count an item and update the top k"""
+        key = item.description.lower()
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = [0, 0, len(self._groups), item]
+        group[0] += 1
+        if self._severity:
+            group[1] = max(group[1], self._severity(item))
+        self.size += 1
+
+        score = (group[0], group[1], -group[2])
+        if key in self._top or len(self._top) < self.k:
+            self._top[key] = score
+            heapq.heappush(self._heap, (score, key))
+        else:
+            while self._heap[0][0] != self._top.get(self._heap[0][1]):
+                heapq.heappop(self._heap)
+            if score > self._heap[0][0]:
+                _, dropped = heapq.heappop(self._heap)
+                del self._top[dropped]
+                self._top[key] = score
+                heapq.heappush(self._heap, (score, key))
+
+        if len(self._heap) > 4 * self.k:
+            self._heap = [(score, key) for key, score in self._top.items()]
+            heapq.heapify(self._heap)
+
+    def top(self) -> List[Any]:
+        """Representative items of the top k groups, most frequent first"""
+        ranked = sorted(self._top.items(), key=lambda entry: entry[1], reverse=True)
+        return [self._groups[key][3] for key, _ in ranked]
+
+
 @dataclass
 class StakeholderProfile:
     """Comprehensive profile of a stakeholder (aggregated from multiple sources)"""
@@ -136,9 +201,7 @@ class StakeholderProfile:
 
     # Aggregated insights (from all interactions)
     all_concerns: List[Concern] = field(default_factory=list)
-    top_concerns: List[Concern] = field(default_factory=list)
     all_needs: List[Need] = field(default_factory=list)
-    top_needs: List[Need] = field(default_factory=list)
     goals: List[str] = field(default_factory=list)
     success_metrics: List[str] = field(default_factory=list)
 
@@ -172,19 +235,44 @@ class StakeholderProfile:
     updated_at: Optional[datetime] = None
     last_reviewed_by: str = ""
 
+    # Incremental indexes over the lists above (not serialized)
+    _concern_ranking: ItemRanking = field(init=False, repr=False, compare=False)
+    _need_ranking: ItemRanking = field(init=False, repr=False, compare=False)
+    _goal_set: Set[str] = field(init=False, repr=False, compare=False)
+    _document_set: Set[str] = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Generate ID if not provided"""
         if not self.id and self.name:
             self.id = self.name.lower().replace(" ", "_")
 
+        self._concern_ranking = ItemRanking(severity=lambda c: SEVERITY_RANK.get(c.severity, 0))
+        self._need_ranking = ItemRanking()
+        self._goal_set = set(self.goals)
+        self._document_set = set(self.source_documents)
+
+    @property
+    def top_concerns(self) -> List[Concern]:
+        """Top 5 concerns by frequency, then severity"""
+        return self._ranked(self._concern_ranking, self.all_concerns)
+
+    @property
+    def top_needs(self) -> List[Need]:
+        """Top 5 needs by frequency"""
+        return self._ranked(self._need_ranking, self.all_needs)
+
     def add_insight(self, insight: StakeholderInsight) -> None:
         """Add insights from a new interaction"""
         self.all_concerns.extend(insight.concerns)
         self.all_needs.extend(insight.needs)
-        self.goals.extend([g for g in insight.goals if g not in self.goals])
+        for goal in insight.goals:
+            if goal not in self._goal_set:
+                self._goal_set.add(goal)
+                self.goals.append(goal)
         self.highlight_quotes.extend([q for q in insight.key_quotes if q.is_highlight])
 
-        if insight.source_doc_id not in self.source_documents:
+        if insight.source_doc_id not in self._document_set:
+            self._document_set.add(insight.source_doc_id)
             self.source_documents.append(insight.source_doc_id)
 
         self.total_interactions += 1
@@ -197,41 +285,15 @@ class StakeholderProfile:
 
         self.updated_at = datetime.utcnow()
 
-        # Update top concerns/needs (by frequency and severity)
-        self._update_top_items()
-
-    def _update_top_items(self) -> None:
-        """Update top concerns and needs based on frequency and severity"""
-        # Group concerns by description
-        concern_freq: Dict[str, List[Concern]] = {}
-        for c in self.all_concerns:
-            key = c.description.lower()
-            if key not in concern_freq:
-                concern_freq[key] = []
-            concern_freq[key].append(c)
-
-        # Sort by frequency and take top 5
-        sorted_concerns = sorted(
-            concern_freq.items(),
-            key=lambda x: (len(x[1]), max(c.severity.value for c in x[1])),
-            reverse=True
-        )
-        self.top_concerns = [items[0] for _, items in sorted_concerns[:5]]
-
-        # Same for needs
-        need_freq: Dict[str, List[Need]] = {}
-        for n in self.all_needs:
-            key = n.description.lower()
-            if key not in need_freq:
-                need_freq[key] = []
-            need_freq[key].append(n)
-
-        sorted_needs = sorted(
-            need_freq.items(),
-            key=lambda x: len(x[1]),
-            reverse=True
-        )
-        self.top_needs = [items[0] for _, items in sorted_needs[:5]]
+    @staticmethod
+    def _ranked(ranking: ItemRanking, items: list) -> list:
+        """Feed items added since the last read into a ranking and return its top"""
+        if len(items) < ranking.size:
+            # The list was replaced or trimmed: start over
+            ranking.reset()
+        for item in items[ranking.size:]:
+            ranking.add(item)
+        return ranking.top()
 
     def to_dict(self) -> dict:
         return {
@@ -297,9 +359,7 @@ class StakeholderProfile:
             stance=Stance(data.get("stance", "neutral")),
             stance_confidence=data.get("stance_confidence", 0.5),
             all_concerns=[Concern.from_dict(c) for c in data.get("all_concerns", [])],
-            top_concerns=[Concern.from_dict(c) for c in data.get("top_concerns", [])],
             all_needs=[Need.from_dict(n) for n in data.get("all_needs", [])],
-            top_needs=[Need.from_dict(n) for n in data.get("top_needs", [])],
             goals=data.get("goals", []),
             success_metrics=data.get("success_metrics", []),
             communication_preference=data.get("communication_preference", "detailed"),
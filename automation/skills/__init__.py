@@ -8,6 +8,7 @@ Available Skills:
 - DocumentSearch: Find documents in Google Drive
 - DocumentReader: Extract content from Google Workspace documents
 - NoteSynthesis: AI-powered extraction of insights from notes
+- RelevanceFilter: Skip documents that are not meeting or interview notes
 - StakeholderProfiler: Build and update stakeholder profiles
 - RelationshipMapper: Map relationships and influence between stakeholders
 - InsightAggregator: Aggregate insights across stakeholders
@@ -18,6 +19,7 @@ Available Skills:
 from skills.document_search import DocumentSearch
 from skills.document_reader import DocumentReader
 from skills.note_synthesis import NoteSynthesis
+from skills.relevance_filter import RelevanceFilter
 from skills.stakeholder_profiler import StakeholderProfiler
 from skills.relationship_mapper import RelationshipMapper
 from skills.insight_aggregator import InsightAggregator
@@ -28,6 +30,7 @@ __all__ = [
     "DocumentSearch",
     "DocumentReader",
     "NoteSynthesis",
+    "RelevanceFilter",
     "StakeholderProfiler",
     "RelationshipMapper",
     "InsightAggregator",
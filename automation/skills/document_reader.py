@@ -4,12 +4,18 @@ Document Reader Skill - Extract content from Google Workspace documents
 
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+import io
 from loguru import logger
+from googleapiclient.errors import HttpError
 
 from utils.google.docs_client import docs_client
 from utils.google.sheets_client import sheets_client
 from utils.google.slides_client import slides_client
 from utils.google.drive_client import drive_client
+from utils.document_store import DocumentStore, file_version
+from utils.search_index import SearchIndex
+from utils.vector_index import vector_index
+from utils.minhash_index import MinHashIndex
 from models.document import DocumentContent, TableData
 from models.enums import DocType
 
@@ -22,6 +28,11 @@ class DocumentReader:
     - Google Docs
     - Google Sheets
     - Google Slides
+
+    Extracted content is cached locally by file ID and version, so
+    unchanged documents are served without calling the content APIs.
+    Every document read is also added to the local search, similarity and
+    duplicate-detection indexes.
     """
 
     def __init__(self):
@@ -29,8 +40,17 @@ class DocumentReader:
         self.sheets = sheets_client
         self.slides = slides_client
         self.drive = drive_client
+        self.cache = DocumentStore()
+        self.index = SearchIndex()
+        self.vectors = vector_index
+        self.minhash = MinHashIndex()
 
-    def read(self, document_id: str, doc_type: Optional[str] = None) -> Optional[DocumentContent]:
+    def read(
+        self,
+        document_id: str,
+        doc_type: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> Optional[DocumentContent]:
         """
         Read a document and extract its content.
 
@@ -38,29 +58,71 @@ class DocumentReader:
             document_id: The document ID
             doc_type: Document type ("docs", "sheets", "slides")
                      If not provided, will auto-detect
+            use_cache: Serve unchanged documents from the local cache
 
         Returns:
             DocumentContent object or None
         """
         logger.info(f"Reading document {document_id}")
 
+        # One metadata call serves the cache check, type detection and the reader
+        file_info = self.drive.get_file(document_id)
+        if not file_info:
+            logger.error(f"Could not get file info for {document_id}")
+            return None
+
+        version = file_version(file_info)
+        if use_cache:
+            cached = self._from_cache(file_info)
+            if cached:
+                logger.debug(f"Serving {document_id} from cache")
+                return cached
+
         # Auto-detect type if not provided
         if not doc_type:
-            doc_type = self._detect_type(document_id)
+            doc_type = self._detect_type(document_id, file_info)
 
         if doc_type == "docs":
-            return self._read_doc(document_id)
+            document = self._read_doc(document_id, file_info)
         elif doc_type == "sheets":
-            return self._read_sheet(document_id)
+            document = self._read_sheet(document_id, file_info=file_info)
         elif doc_type == "slides":
-            return self._read_slides(document_id)
+            document = self._read_slides(document_id, file_info)
         else:
             logger.warning(f"Unsupported document type: {doc_type}")
             return None
 
-    def _detect_type(self, document_id: str) -> Optional[str]:
+        if document and use_cache:
+            self.cache.put(document, version)
+            self._index(document, version, file_info)
+        return document
+
+    def _from_cache(self, file_info: Dict[str, Any]) -> Optional[DocumentContent]:
+        """Get an unchanged document from the cache, indexing it if it isn't yet"""
+        version = file_version(file_info)
+        cached = self.cache.get(file_info["id"], version)
+        if cached:
+            self._index(cached, version, file_info)
+        return cached
+
+    def _index(
+        self,
+        document: DocumentContent,
+        version: Optional[str],
+        file_info: Dict[str, Any],
+    ) -> None:
+        """Add a document to the local indexes (no-op if unchanged)"""
+        self.index.add(document, version, file_info)
+        self.vectors.add(document, version)
+        self.minhash.add(document, version)
+
+    def _detect_type(
+        self,
+        document_id: str,
+        file_info: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
         """Detect document type from Drive API"""
-        file_info = self.drive.get_file(document_id)
+        file_info = file_info or self.drive.get_file(document_id)
         if not file_info:
             return None
 
@@ -72,10 +134,14 @@ class DocumentReader:
         }
         return type_map.get(mime_type)
 
-    def _read_doc(self, document_id: str) -> Optional[DocumentContent]:
+    def _read_doc(
+        self,
+        document_id: str,
+        file_info: Optional[Dict[str, Any]] = None,
+    ) -> Optional[DocumentContent]:
         """Read a Google Doc"""
         # Get metadata from Drive
-        file_info = self.drive.get_file(document_id)
+        file_info = file_info or self.drive.get_file(document_id)
         if not file_info:
             logger.error(f"Could not get file info for {document_id}")
             return None
@@ -133,10 +199,18 @@ class DocumentReader:
         spreadsheet_id: str,
         sheet_name: Optional[str] = None,
         range_name: Optional[str] = None,
+        window_rows: int = 1000,
+        file_info: Optional[Dict[str, Any]] = None,
     ) -> Optional[DocumentContent]:
-        """Read a Google Sheet"""
+        """
+        Read a Google Sheet.
+
+        Whole sheets are streamed in row windows, building the table and
+        text content as each window arrives rather than holding the full
+        value grid alongside them.
+        """
         # Get metadata from Drive
-        file_info = self.drive.get_file(spreadsheet_id)
+        file_info = file_info or self.drive.get_file(spreadsheet_id)
         if not file_info:
             logger.error(f"Could not get file info for {spreadsheet_id}")
             return None
@@ -148,30 +222,46 @@ class DocumentReader:
 
         # Get values
         if range_name:
-            values = self.sheets.get_values(spreadsheet_id, range_name)
-        elif sheet_name:
-            values = self.sheets.get_all_values(spreadsheet_id, sheet_name)
+            windows = iter([self.sheets.get_values(spreadsheet_id, range_name)])
         else:
-            # Get first sheet
+            # Default to the first sheet
             sheets_list = spreadsheet.get("sheets", [])
-            if sheets_list:
-                first_sheet = sheets_list[0].get("properties", {}).get("title", "Sheet1")
-                values = self.sheets.get_all_values(spreadsheet_id, first_sheet)
+            properties = {}
+            for sheet in sheets_list:
+                title = sheet.get("properties", {}).get("title")
+                if sheet_name is None or title == sheet_name:
+                    properties = sheet.get("properties", {})
+                    break
+
+            if properties or sheet_name:
+                windows = self.sheets.iter_windows(
+                    spreadsheet_id,
+                    properties.get("title", sheet_name),
+                    window_rows=window_rows,
+                    row_count=properties.get("gridProperties", {}).get("rowCount"),
+                )
             else:
-                values = []
-
-        # Convert to table format
-        tables = []
-        if values:
-            headers = values[0] if values else []
-            rows = values[1:] if len(values) > 1 else []
-            tables.append(TableData(headers=headers, rows=rows))
+                windows = iter([])
+
+        # Build table and text content window by window. A failed window
+        # fails the read, so a partial sheet is never cached as complete
+        table = None
+        text = io.StringIO()
+        try:
+            for window in windows:
+                for row in window:
+                    if table is None:
+                        table = TableData(headers=row)
+                    else:
+                        table.rows.append(row)
+                        text.write("\n")
+                    text.write("\t".join(str(cell) for cell in row))
+        except HttpError as e:
+            logger.error(f"Failed to read sheet {spreadsheet_id}: {e}")
+            return None
 
-        # Convert to text content
-        content_lines = []
-        for row in values:
-            content_lines.append("\t".join(str(cell) for cell in row))
-        content = "\n".join(content_lines)
+        tables = [table] if table is not None else []
+        content = text.getvalue()
 
         # Parse timestamps
         created_at = None
@@ -207,10 +297,14 @@ class DocumentReader:
             folder_path=folder_path,
         )
 
-    def _read_slides(self, presentation_id: str) -> Optional[DocumentContent]:
+    def _read_slides(
+        self,
+        presentation_id: str,
+        file_info: Optional[Dict[str, Any]] = None,
+    ) -> Optional[DocumentContent]:
         """Read a Google Slides presentation"""
         # Get metadata from Drive
-        file_info = self.drive.get_file(presentation_id)
+        file_info = file_info or self.drive.get_file(presentation_id)
         if not file_info:
             logger.error(f"Could not get file info for {presentation_id}")
             return None
@@ -261,29 +355,81 @@ class DocumentReader:
         self,
         document_ids: List[str],
         doc_types: Optional[Dict[str, str]] = None,
+        metadata: Optional[Dict[str, Dict[str, Any]]] = None,
+        use_cache: bool = True,
     ) -> List[DocumentContent]:
         """
         Read multiple documents.
 
+        Versions are checked against a cheap metadata listing first, so
+        only new or modified documents are fetched in full.
+
         Args:
             document_ids: List of document IDs
             doc_types: Optional dict mapping doc_id to doc_type
+            metadata: Drive metadata by doc_id with modifiedTime (e.g. from a
+                      search listing); fetched in one batch if not provided
+            use_cache: Serve unchanged documents from the local cache
 
         Returns:
             List of DocumentContent objects
         """
         logger.info(f"Reading {len(document_ids)} documents")
 
-        results = []
-        for doc_id in document_ids:
+        documents: Dict[str, DocumentContent] = {}
+        stale = list(document_ids)
+
+        if use_cache:
+            if metadata is None:
+                metadata = self.drive.get_files_metadata(document_ids)
+
+            stale = []
+            for doc_id in document_ids:
+                info = metadata.get(doc_id)
+                cached = self._from_cache(info) if info else None
+                if cached:
+                    documents[doc_id] = cached
+                else:
+                    stale.append(doc_id)
+
+            logger.info(f"{len(documents)} documents unchanged, fetching {len(stale)}")
+
+        for doc_id in stale:
             doc_type = doc_types.get(doc_id) if doc_types else None
-            doc = self.read(doc_id, doc_type)
+            doc = self.read(doc_id, doc_type, use_cache=use_cache)
             if doc:
-                results.append(doc)
+                documents[doc_id] = doc
 
+        results = [documents[doc_id] for doc_id in document_ids if doc_id in documents]
         logger.info(f"Successfully read {len(results)} documents")
         return results
 
+    def read_listed(
+        self,
+        file_info: Dict[str, Any],
+        use_cache: bool = True,
+    ) -> Optional[DocumentContent]:
+        """
+        Read a document from its search listing entry.
+
+        The listing already carries the version, so an unchanged document is
+        served from the cache without any API call.
+
+        Args:
+            file_info: Drive metadata with id and modifiedTime
+            use_cache: Serve unchanged documents from the local cache
+
+        Returns:
+            DocumentContent object or None
+        """
+        if use_cache:
+            cached = self._from_cache(file_info)
+            if cached:
+                logger.debug(f"Serving {file_info['id']} from cache")
+                return cached
+
+        return self.read(file_info["id"], use_cache=use_cache)
+
     def extract_text_only(self, document_id: str) -> str:
         """
         Extract just the text content from a document.
@@ -2,11 +2,15 @@
 Document Search Skill - Find documents in Google Drive
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Iterator
 from datetime import datetime, timedelta
 from loguru import logger
 
 from utils.google.drive_client import drive_client
+from utils.document_store import DocumentStore, file_version
+from utils.minhash_index import MinHashIndex
+from utils.search_index import SearchIndex
+from utils.vector_index import vector_index
 from models.document import DocumentContent
 from models.enums import DocType
 
@@ -20,10 +24,28 @@ class DocumentSearch:
     - Filter by folder, file type, date range
     - Find meeting notes and interview transcripts
     - Get recent documents
+
+    Keyword and stakeholder queries are answered from a local BM25 index
+    of every document read so far, falling back to Drive full-text
+    search when the index has no match. Related notes are found with a
+    TF-IDF similarity index over the same documents, and copies of the
+    same notes with a MinHash index.
     """
 
+    # Common meeting note patterns, any of which marks a document as notes
+    MEETING_NOTE_KEYWORDS = [
+        "meeting notes",
+        "interview",
+        "1:1",
+        "discovery",
+        "stakeholder",
+    ]
+
     def __init__(self):
         self.drive = drive_client
+        self.index = SearchIndex()
+        self.vectors = vector_index
+        self.minhash = MinHashIndex()
 
     def search(
         self,
@@ -33,6 +55,8 @@ class DocumentSearch:
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
         max_results: int = 50,
+        use_index: bool = True,
+        require_all: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Search for documents by keywords and filters.
@@ -44,12 +68,28 @@ class DocumentSearch:
             date_from: Modified after this date
             date_to: Modified before this date
             max_results: Maximum results
+            use_index: Answer from the local index, using Drive only if it has no match
+            require_all: Only return indexed documents containing every keyword
 
         Returns:
-            List of document metadata dicts
+            List of document metadata dicts, best match first
         """
         logger.info(f"Searching for documents with keywords: '{keywords}'")
 
+        if use_index:
+            results = self._search_index(
+                keywords=keywords,
+                folder_id=folder_id,
+                file_types=file_types,
+                date_from=date_from,
+                date_to=date_to,
+                max_results=max_results,
+                require_all=require_all,
+            )
+            if results:
+                logger.info(f"Found {len(results)} documents in the local index")
+                return results
+
         results = self.drive.search_files(
             keywords=keywords,
             folder_id=folder_id,
@@ -62,6 +102,43 @@ class DocumentSearch:
         logger.info(f"Found {len(results)} documents")
         return results
 
+    def iter_search(
+        self,
+        keywords: str,
+        folder_id: Optional[str] = None,
+        file_types: Optional[List[str]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        max_results: int = 50,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily search Drive for documents by keywords and filters.
+
+        Unlike search(), this always queries Drive, so it also finds
+        documents that have not been read into the local index yet.
+
+        Args:
+            keywords: Search keywords
+            folder_id: Limit search to folder
+            file_types: List of file types ("docs", "sheets", "slides", "pdf")
+            date_from: Modified after this date
+            date_to: Modified before this date
+            max_results: Maximum results
+
+        Yields:
+            Document metadata dicts as their pages arrive
+        """
+        logger.info(f"Searching Drive for documents with keywords: '{keywords}'")
+
+        yield from self.drive.iter_search(
+            keywords=keywords,
+            folder_id=folder_id,
+            file_types=file_types,
+            date_from=date_from,
+            date_to=date_to,
+            max_results=max_results,
+        )
+
     def search_by_stakeholder(
         self,
         stakeholder_name: str,
@@ -86,7 +163,126 @@ class DocumentSearch:
             folder_id=folder_id,
             file_types=["docs"],
             max_results=max_results,
+            require_all=True,
+        )
+
+    def _search_index(
+        self,
+        keywords: str,
+        folder_id: Optional[str] = None,
+        file_types: Optional[List[str]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        max_results: int = 50,
+        require_all: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Rank indexed documents with BM25 and return their Drive metadata"""
+        ranked = self.index.search(
+            keywords,
+            limit=None if folder_id else max_results,
+            require_all=require_all,
+            doc_types=file_types,
+            date_from=date_from,
+            date_to=date_to,
         )
+        metadata = self.index.get_metadata([doc_id for doc_id, _ in ranked])
+
+        results = []
+        for doc_id, score in ranked:
+            info = metadata.get(doc_id)
+            # Like Drive's "in parents", folder filters match direct children only
+            if not info or (folder_id and folder_id not in info.get("parents", [])):
+                continue
+            results.append({**info, "score": round(score, 4)})
+
+        return results[:max_results]
+
+    def find_similar(
+        self,
+        doc_id: str,
+        k: int = 10,
+        min_score: float = 0.1,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find notes related to a document.
+
+        Args:
+            doc_id: ID of a document that has been read
+            k: Maximum results
+            min_score: Minimum cosine similarity (0-1)
+
+        Returns:
+            List of document metadata dicts with a similarity score, best first
+        """
+        similar = self.vectors.most_similar(doc_id, k=k, min_score=min_score)
+        metadata = self.index.get_metadata([d for d, _ in similar])
+
+        logger.info(f"Found {len(similar)} documents similar to {doc_id}")
+        return [
+            {**metadata.get(d, {"id": d}), "similarity": round(score, 4)}
+            for d, score in similar
+        ]
+
+    def iter_collapse_duplicates(
+        self,
+        documents: Iterable[Dict[str, Any]],
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Skip copied notes in a listing as it streams.
+
+        Only documents signed at their listed version can be compared, so
+        new or edited documents always pass through. A listing is not known
+        in full, so a document is dropped if it is a duplicate or a subset
+        of a document already yielded. A copy listed before the notes it
+        was pasted into is therefore still processed.
+
+        Args:
+            documents: Drive metadata dicts, e.g. from an iter_* listing
+
+        Yields:
+            Documents to process, in listing order
+        """
+        yielded = set()
+        for doc in documents:
+            if yielded and self.minhash.get_version(doc["id"]) == file_version(doc):
+                copy_of = next(
+                    (
+                        m["doc_id"] for m in self.minhash.matches(doc["id"])
+                        if m["doc_id"] in yielded and m["relation"] in ("duplicate", "subset")
+                    ),
+                    None,
+                )
+                if copy_of:
+                    logger.info(f"Skipping '{doc.get('name', doc['id'])}', a copy of {copy_of}")
+                    continue
+            yielded.add(doc["id"])
+            yield doc
+
+    def sync_index(self) -> int:
+        """
+        Index cached documents that are missing or outdated in the search,
+        similarity and duplicate-detection indexes.
+
+        Documents are indexed as they are read, so this is only needed to
+        backfill documents cached before the indexes existed.
+
+        Returns:
+            Number of documents indexed
+        """
+        cache = DocumentStore()
+        indexed = 0
+        for file_id, version in cache.versions().items():
+            if all(i.get_version(file_id) == version for i in (self.index, self.vectors, self.minhash)):
+                continue
+            document = cache.get(file_id, version)
+            if document:
+                self.index.add(document, version)
+                self.vectors.add(document, version)
+                self.minhash.add(document, version)
+                indexed += 1
+
+        logger.info(f"Indexed {indexed} cached documents")
+        return indexed
 
     def find_meeting_notes(
         self,
@@ -109,35 +305,55 @@ class DocumentSearch:
         """
         logger.info("Searching for meeting notes and interviews")
 
-        # Search for common meeting note patterns
-        keywords_list = [
-            "meeting notes",
-            "interview",
-            "1:1",
-            "discovery",
-            "stakeholder",
-        ]
+        # One OR'd query, paginated to max_results (the listing must include
+        # notes that were never read, so the local index is not used)
+        results = self.drive.search_any(
+            keywords=self.MEETING_NOTE_KEYWORDS,
+            folder_id=folder_id,
+            file_types=["docs"],
+            date_from=date_from,
+            date_to=date_to,
+            max_results=max_results,
+        )
 
-        all_results = []
-        seen_ids = set()
+        cost = self.drive.last_query_cost
+        logger.info(
+            f"Found {len(results)} meeting notes/interviews "
+            f"({cost.get('api_calls', 0)} API calls, {cost.get('round_trips', 0)} round trips)"
+        )
+        return results
 
-        for keyword in keywords_list:
-            results = self.search(
-                keywords=keyword,
-                folder_id=folder_id,
-                file_types=["docs"],
-                date_from=date_from,
-                date_to=date_to,
-                max_results=max_results // len(keywords_list),
-            )
+    def iter_meeting_notes(
+        self,
+        folder_id: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        max_results: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily find meeting notes and interview transcripts.
+
+        Args:
+            folder_id: Folder to search in
+            date_from: Start date
+            date_to: End date
+            max_results: Maximum results
 
-            for doc in results:
-                if doc["id"] not in seen_ids:
-                    all_results.append(doc)
-                    seen_ids.add(doc["id"])
+        Yields:
+            Document metadata dicts, most recently modified first
+        """
+        logger.info("Searching for meeting notes and interviews")
 
-        logger.info(f"Found {len(all_results)} meeting notes/interviews")
-        return all_results[:max_results]
+        # One OR'd query, paginated to max_results (the listing must include
+        # notes that were never read, so the local index is not used)
+        yield from self.drive.iter_search_any(
+            keywords=self.MEETING_NOTE_KEYWORDS,
+            folder_id=folder_id,
+            file_types=["docs"],
+            date_from=date_from,
+            date_to=date_to,
+            max_results=max_results,
+        )
 
     def get_recent_documents(
         self,
@@ -213,6 +429,31 @@ class DocumentSearch:
         logger.info(f"Found {len(results)} documents in folder")
         return results
 
+    def iter_folder_contents(
+        self,
+        folder_id: str,
+        recursive: bool = False,
+        file_types: Optional[List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield all documents in a folder.
+
+        Args:
+            folder_id: Folder ID
+            recursive: Include subfolders
+            file_types: Filter by file types
+
+        Yields:
+            Document metadata dicts as their pages arrive
+        """
+        logger.info(f"Getting contents of folder {folder_id}")
+
+        yield from self.drive.iter_folder(
+            folder_id=folder_id,
+            recursive=recursive,
+            file_types=file_types,
+        )
+
     def find_by_title(
         self,
         title_pattern: str,
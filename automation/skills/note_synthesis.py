@@ -2,12 +2,18 @@
 Note Synthesis Skill - AI-powered extraction of insights from notes
 """
 
+from dataclasses import replace
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+import difflib
+import hashlib
 import json
 from loguru import logger
 
 from utils.ai_client import ai_client
+from utils.insight_store import InsightStore
+from utils.revision_store import RevisionStore
+from utils.vector_index import vector_index
 from models.document import DocumentContent
 from models.stakeholder import StakeholderInsight
 from models.insight import Concern, Need, Quote, MentionedStakeholder
@@ -31,8 +37,19 @@ class NoteSynthesis:
     - Capture key quotes
     - Extract action items
     - Analyze sentiment
+
+    Extractions are cached by document, content hash, model and prompt
+    version, so unchanged documents are never sent to the model twice.
+    When a document that was extracted before only gained new sections
+    (running 1:1 notes), just those sections are extracted and merged
+    into the previous insight.
     """
 
+    SYSTEM_PROMPT = "You are a stakeholder research analyst. Extract information precisely and return valid JSON."
+
+    # Characters of document content sent to the model
+    CONTENT_LIMIT = 15000
+
     EXTRACTION_PROMPT = """You are an expert at analyzing meeting notes and extracting stakeholder insights for product management.
 
 Analyze the following meeting notes and extract structured information.
@@ -114,13 +131,60 @@ Guidelines:
 
 Return ONLY the JSON, no other text."""
 
+    # Version of the extraction prompt; changing either prompt invalidates cached insights
+    PROMPT_HASH = hashlib.sha1((EXTRACTION_PROMPT + SYSTEM_PROMPT).encode("utf-8")).hexdigest()[:16]
+
+    # Cosine similarity above which two notes are treated as the same interview
+    DUPLICATE_SIMILARITY = 0.9
+
+    # Share of the new revision that may be new text for a diff to be worth it
+    REVISION_MAX_ADDED = 0.5
+
     def __init__(self):
         self.ai = ai_client
+        self.cache = InsightStore()
+        self.revisions = RevisionStore()
+        self.vectors = vector_index
+
+    def _prompt_fields(self, document: DocumentContent) -> Dict[str, str]:
+        """Values substituted into the extraction prompt"""
+        date_str = ""
+        if document.modified_at:
+            date_str = document.modified_at.strftime("%Y-%m-%d")
+        elif document.created_at:
+            date_str = document.created_at.strftime("%Y-%m-%d")
+
+        return {
+            "content": document.content[:self.CONTENT_LIMIT],
+            "title": document.title,
+            "date": date_str or "Unknown",
+        }
+
+    def _content_hash(self, document: DocumentContent) -> str:
+        """Hash of exactly what the model sees for a document"""
+        fields = self._prompt_fields(document)
+        payload = "\x00".join([fields["title"], fields["date"], fields["content"]])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_cached_insight(self, document: DocumentContent) -> Optional[StakeholderInsight]:
+        """
+        Get the cached insight for a document if nothing relevant changed.
+
+        Args:
+            document: The document
+
+        Returns:
+            StakeholderInsight or None
+        """
+        return self.cache.get(
+            document.id, self._content_hash(document), self.ai.model, self.PROMPT_HASH
+        )
 
     def extract_stakeholder_insights(
         self,
         document: DocumentContent,
         additional_context: Optional[str] = None,
+        cache_result: bool = False,
     ) -> StakeholderInsight:
         """
         Extract stakeholder insights from a document.
@@ -128,25 +192,16 @@ Return ONLY the JSON, no other text."""
         Args:
             document: The document to analyze
             additional_context: Optional additional context
+            cache_result: Store a successful extraction in the insight cache
+                          (ignored when additional_context is given)
 
         Returns:
             StakeholderInsight object
         """
         logger.info(f"Extracting insights from: {document.title}")
 
-        # Format the date
-        date_str = ""
-        if document.modified_at:
-            date_str = document.modified_at.strftime("%Y-%m-%d")
-        elif document.created_at:
-            date_str = document.created_at.strftime("%Y-%m-%d")
-
         # Build prompt
-        prompt = self.EXTRACTION_PROMPT.format(
-            content=document.content[:15000],  # Limit content length
-            title=document.title,
-            date=date_str or "Unknown",
-        )
+        prompt = self.EXTRACTION_PROMPT.format(**self._prompt_fields(document))
 
         if additional_context:
             prompt += f"\n\nAdditional Context:\n{additional_context}"
@@ -154,7 +209,7 @@ Return ONLY the JSON, no other text."""
         # Call AI
         response = self.ai.generate(
             prompt=prompt,
-            system_prompt="You are a stakeholder research analyst. Extract information precisely and return valid JSON.",
+            system_prompt=self.SYSTEM_PROMPT,
             max_tokens=4000,
             temperature=0.1,  # Low temperature for consistent extraction
         )
@@ -170,7 +225,12 @@ Return ONLY the JSON, no other text."""
 
             data = json.loads(json_str.strip())
 
-            return self._build_insight(data, document)
+            insight = self._build_insight(data, document)
+            if cache_result and not additional_context:
+                self.cache.put(
+                    insight, self._content_hash(document), self.ai.model, self.PROMPT_HASH
+                )
+            return insight
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse AI response: {e}")
@@ -325,30 +385,272 @@ Return ONLY the JSON, no other text."""
         insight = self.extract_stakeholder_insights(document)
         return insight.key_quotes
 
+    def extract_or_reuse(
+        self,
+        document: DocumentContent,
+        reuse_cache: bool = True,
+    ) -> StakeholderInsight:
+        """
+        Extract insights from one document, reusing the cached result if unchanged.
+
+        Args:
+            document: Document to analyze
+            reuse_cache: Reload the insight from the cache when valid
+
+        Returns:
+            StakeholderInsight object
+        """
+        return self.extract_revision(document, reuse_cache=reuse_cache)[0]
+
+    def extract_revision(
+        self,
+        document: DocumentContent,
+        reuse_cache: bool = True,
+    ) -> tuple:
+        """
+        Extract insights from a document, only sending what changed since
+        the last processed revision.
+
+        If the document was extracted before and the new revision only
+        adds text (new weekly sections in running notes), only the added
+        text is extracted and merged into the previous insight. A revision
+        that edits or deletes earlier text is extracted in full, since the
+        old text's concerns and quotes cannot be taken back out of the
+        previous insight.
+
+        Args:
+            document: Document to analyze
+            reuse_cache: Reuse cached insights and previous revisions
+
+        Returns:
+            (insight for the whole document, insight from only the added
+            text or None, previous revision's insight the addition was
+            merged into or None)
+        """
+        if not reuse_cache:
+            return self.extract_stakeholder_insights(document), None, None
+
+        revision = self.revisions.get(document.id, self.ai.model, self.PROMPT_HASH)
+        if revision:
+            base = revision["insight"]
+            if revision["content"] == document.content:
+                return base, None, base
+
+            added = self.added_text(revision["content"], document.content)
+            if added == "":
+                # Only whitespace changed: nothing new to extract
+                self.revisions.put(document.content, base, self.ai.model, self.PROMPT_HASH)
+                return base, None, base
+            if added is not None:
+                delta = self._extract_addition(document, added, base)
+                if delta is None:
+                    # Keep the old revision so the addition is retried with the next edit
+                    return base, None, base
+                insight = self.merge_insights(base, delta)
+                self._store_revision(document, insight)
+                return insight, delta, base
+
+        insight = self.get_cached_insight(document)
+        if not insight:
+            insight = self.extract_stakeholder_insights(document)
+            if not insight.extraction_confidence and not insight.stakeholder_name:
+                return insight, None, None
+        self._store_revision(document, insight)
+        return insight, None, None
+
+    def added_text(self, previous: str, current: str) -> Optional[str]:
+        """
+        Get the text a revision added to the previous one.
+
+        Args:
+            previous: Text of the previous revision
+            current: Text of the new revision
+
+        Returns:
+            Added lines ("" if none), or None if the revision edited or
+            deleted any of the previous text, or added too much, to extract
+            as a diff
+        """
+        if current.startswith(previous):
+            added = current[len(previous):].strip()
+        else:
+            # Lines are compared stripped, so whitespace-only edits still count as kept
+            old_lines = [line.strip() for line in previous.splitlines()]
+            new_lines = current.splitlines()
+            matcher = difflib.SequenceMatcher(None, old_lines, [line.strip() for line in new_lines])
+
+            added_lines = []
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                if tag in ("delete", "replace") and any(old_lines[i1:i2]):
+                    return None
+                if tag in ("insert", "replace"):
+                    added_lines.extend(new_lines[j1:j2])
+            added = "\n".join(added_lines).strip()
+
+        if len(added) > self.REVISION_MAX_ADDED * len(current):
+            return None
+        return added
+
+    def merge_insights(
+        self,
+        base: StakeholderInsight,
+        delta: StakeholderInsight,
+    ) -> StakeholderInsight:
+        """
+        Merge the insight from newly added text into a document's insight.
+
+        Lists are appended, identity fields are only filled in when missing,
+        and sentiment follows the latest section.
+
+        Args:
+            base: Insight of the previous revision
+            delta: Insight of the added text
+
+        Returns:
+            Insight for the whole new revision
+        """
+        merged = StakeholderInsight.from_dict(base.to_dict())
+        merged.source_doc_title = delta.source_doc_title or base.source_doc_title
+        merged.meeting_date = delta.meeting_date or base.meeting_date
+
+        for name in ("stakeholder_name", "stakeholder_role", "stakeholder_department", "stakeholder_email"):
+            if not getattr(merged, name):
+                setattr(merged, name, getattr(delta, name))
+
+        merged.concerns.extend(delta.concerns)
+        merged.needs.extend(delta.needs)
+        merged.key_quotes.extend(delta.key_quotes)
+        merged.mentioned_stakeholders.extend(delta.mentioned_stakeholders)
+        merged.action_items.extend(delta.action_items)
+        merged.goals.extend(g for g in delta.goals if g not in merged.goals)
+        merged.constraints.extend(c for c in delta.constraints if c not in merged.constraints)
+
+        merged.overall_sentiment = delta.overall_sentiment
+        merged.sentiment_details = delta.sentiment_details or base.sentiment_details
+        merged.extraction_confidence = min(base.extraction_confidence, delta.extraction_confidence)
+        merged.extracted_at = delta.extracted_at
+        return merged
+
+    def _extract_addition(
+        self,
+        document: DocumentContent,
+        added: str,
+        base: StakeholderInsight,
+    ) -> Optional[StakeholderInsight]:
+        """Extract the added sections of a revision, attributed to the document's stakeholder"""
+        logger.info(
+            f"Extracting {len(added)} new of {len(document.content)} characters from: {document.title}"
+        )
+
+        context = "These are only the sections newly added to a running notes document."
+        if base.stakeholder_name:
+            context += f" Earlier sections are about {base.stakeholder_name}"
+            context += f" ({base.stakeholder_role})." if base.stakeholder_role else "."
+
+        delta = self.extract_stakeholder_insights(
+            replace(document, content=added, tables=[]),
+            additional_context=context,
+        )
+        if not delta.extraction_confidence and not delta.stakeholder_name:
+            logger.warning(f"Could not extract the new sections of {document.title}")
+            return None
+
+        # The document stays about the same stakeholder
+        for name in ("stakeholder_name", "stakeholder_role", "stakeholder_department", "stakeholder_email"):
+            if getattr(base, name):
+                setattr(delta, name, getattr(base, name))
+        return delta
+
+    def _store_revision(self, document: DocumentContent, insight: StakeholderInsight) -> None:
+        """Cache an insight and record the revision it was extracted at"""
+        self.cache.put(insight, self._content_hash(document), self.ai.model, self.PROMPT_HASH)
+        self.revisions.put(document.content, insight, self.ai.model, self.PROMPT_HASH)
+
+    def drop_near_duplicates(
+        self,
+        documents: List[DocumentContent],
+        threshold: Optional[float] = None,
+    ) -> List[DocumentContent]:
+        """
+        Drop documents that are near-duplicates of another one in the list.
+
+        The same interview saved twice under different titles would otherwise
+        be extracted (and counted) twice. Of each duplicate group, the longest
+        document is kept.
+
+        Args:
+            documents: Documents to filter
+            threshold: Cosine similarity above which documents are duplicates
+
+        Returns:
+            Documents to extract, in their original order
+        """
+        if threshold is None:
+            threshold = self.DUPLICATE_SIMILARITY
+
+        for doc in documents:
+            if doc.id not in self.vectors:
+                self.vectors.add(doc)
+
+        # Rank only within the batch, so near-copies elsewhere in the index
+        # cannot crowd an in-batch duplicate out of the top k
+        batch_ids = {doc.id for doc in documents}
+        kept, dropped = set(), {}
+        for doc in sorted(documents, key=lambda d: d.word_count, reverse=True):
+            similar = self.vectors.most_similar(
+                doc.id, k=len(batch_ids), min_score=threshold, among=batch_ids
+            )
+            original = next((d for d, _ in similar if d in kept), None)
+            if original:
+                dropped[doc.id] = original
+            else:
+                kept.add(doc.id)
+
+        for doc_id, original in dropped.items():
+            logger.info(f"Skipping {doc_id}: near-duplicate of {original}")
+
+        return [doc for doc in documents if doc.id in kept]
+
     def batch_extract(
         self,
         documents: List[DocumentContent],
+        reuse_cache: bool = True,
+        drop_duplicates: bool = True,
     ) -> List[StakeholderInsight]:
         """
         Extract insights from multiple documents.
 
         Args:
             documents: List of documents to analyze
+            reuse_cache: Reload insights for unchanged documents from the
+                         cache and only send new or changed ones to the model
+            drop_duplicates: Skip documents that near-duplicate another one
 
         Returns:
             List of StakeholderInsight objects
         """
         logger.info(f"Batch extracting insights from {len(documents)} documents")
 
+        if drop_duplicates:
+            documents = self.drop_near_duplicates(documents)
+
         insights = []
+        reused = 0
         for doc in documents:
             try:
-                insight = self.extract_stakeholder_insights(doc)
+                insight = self.get_cached_insight(doc) if reuse_cache else None
+                if insight:
+                    reused += 1
+                else:
+                    insight = self.extract_stakeholder_insights(doc, cache_result=reuse_cache)
                 insights.append(insight)
             except Exception as e:
                 logger.error(f"Error extracting from {doc.title}: {e}")
 
-        logger.info(f"Successfully extracted {len(insights)} insights")
+        logger.info(
+            f"Successfully extracted {len(insights)} insights "
+            f"({reused} reused from cache, {len(insights) - reused} from the model)"
+        )
         return insights
 
 
@@ -0,0 +1,192 @@
+"""
+Relevance Filter Skill - Cheap local check for meeting and interview notes
+"""
+
+import re
+from typing import List, Optional, Dict, Any, Iterable
+
+from models.document import DocumentContent
+from config import settings
+
+
+class RelevanceFilter:
+    """
+    Skill for scoring whether a document is likely meeting or interview notes.
+
+    Runs before LLM extraction so that templates, roadmaps, specs and empty
+    documents pulled in by a folder listing are not sent to the model. The
+    score adds up four signals:
+
+    - title: meeting-like words raise it, planning-document words lower it
+    - structure: sections such as "Attendees", "Agenda" or "Action items"
+    - speaker turns: share of lines starting with "Name:" (transcripts)
+    - stakeholders: known stakeholder names mentioned in the text
+
+    Documents scoring below settings.discovery_relevance_threshold are
+    skipped; a threshold of 0 disables the scoring, leaving only empty and
+    very short documents skipped.
+    """
+
+    TITLE_PATTERN = re.compile(
+        r"\b(meeting|notes?|interview|1[:\-]1|one[- ]on[- ]one|sync|call|chat|catch[- ]?up|"
+        r"check[- ]?in|standup|stand[- ]up|retro|debrief|discovery|kickoff|kick[- ]off|workshop)\b",
+        re.IGNORECASE,
+    )
+    NEGATIVE_TITLE_PATTERN = re.compile(
+        r"\b(template|roadmap|budget|prd|spec|specification|okrs?|plan|strategy|"
+        r"invoice|contract|policy|handbook|tracker|dashboard|deck)\b",
+        re.IGNORECASE,
+    )
+    SECTION_PATTERN = re.compile(
+        r"^\W*(attendees|participants|present|agenda|discussion|notes|key points|takeaways|"
+        r"action items|next steps|follow[- ]?ups?|decisions|questions|quotes)\b",
+        re.IGNORECASE | re.MULTILINE,
+    )
+    SPEAKER_PATTERN = re.compile(
+        r"^[ \t]*(?:\[?\d{1,2}:\d{2}(?::\d{2})?\]?[ \t]*)?[A-Z][\w.'-]*(?: [A-Z][\w.'-]*){0,2}[ \t]*:[ \t]+\S",
+        re.MULTILINE,
+    )
+
+    # Score weights per signal (the total is capped at 1.0)
+    TITLE_WEIGHT = 0.4
+    NEGATIVE_TITLE_WEIGHT = 0.4
+    SECTION_WEIGHT = 0.1                             # Per distinct section, up to MAX_SECTIONS
+    MAX_SECTIONS = 3
+    SPEAKER_WEIGHT = 0.4
+    SPEAKER_DENSITY = 0.15                           # Share of lines for the full speaker weight
+    NAME_WEIGHT = 0.15                               # Per known stakeholder named, up to MAX_NAMES
+    MAX_NAMES = 2
+
+    def __init__(
+        self,
+        known_names: Optional[Iterable[str]] = None,
+        threshold: Optional[float] = None,
+        min_words: Optional[int] = None,
+    ):
+        """
+        Args:
+            known_names: Stakeholder names counted as hits
+            threshold: Minimum score to keep a document (default from settings)
+            min_words: Shorter documents are skipped (default from settings)
+        """
+        self.threshold = settings.discovery_relevance_threshold if threshold is None else threshold
+        self.min_words = settings.discovery_relevance_min_words if min_words is None else min_words
+        self.set_known_names(known_names or [])
+
+    def set_known_names(self, names: Iterable[str]) -> None:
+        """Set the stakeholder names counted as hits"""
+        names = sorted({n.strip() for n in names if n and len(n.strip()) > 2}, key=len, reverse=True)
+        self._name_pattern = (
+            re.compile(r"\b(" + "|".join(re.escape(n) for n in names) + r")\b", re.IGNORECASE)
+            if names else None
+        )
+
+    def score(self, document: DocumentContent) -> Dict[str, Any]:
+        """
+        Score how likely a document is meeting or interview notes.
+
+        Args:
+            document: Document content
+
+        Returns:
+            Dict with score, relevant, reason and the per-signal features
+        """
+        if document.is_empty:
+            return {"score": 0.0, "relevant": False, "reason": "empty", "features": {}}
+
+        words = document.word_count
+        if words < self.min_words:
+            return {
+                "score": 0.0,
+                "relevant": False,
+                "reason": f"too short ({words} words)",
+                "features": {"words": words},
+            }
+
+        lines = [line for line in document.content.splitlines() if line.strip()]
+        sections = {m.lower() for m in self.SECTION_PATTERN.findall(document.content)}
+        speaker_turns = len(self.SPEAKER_PATTERN.findall(document.content))
+        density = speaker_turns / len(lines) if lines else 0.0
+        names = (
+            {m.lower() for m in self._name_pattern.findall(document.content)}
+            if self._name_pattern else set()
+        )
+
+        features = {
+            "words": words,
+            "title_match": bool(self.TITLE_PATTERN.search(document.title)),
+            "title_negative": bool(self.NEGATIVE_TITLE_PATTERN.search(document.title)),
+            "sections": sorted(sections),
+            "speaker_density": round(density, 3),
+            "stakeholders": sorted(names),
+        }
+
+        score = 0.0
+        if features["title_match"]:
+            score += self.TITLE_WEIGHT
+        if features["title_negative"]:
+            score -= self.NEGATIVE_TITLE_WEIGHT
+        score += self.SECTION_WEIGHT * min(len(sections), self.MAX_SECTIONS)
+        score += self.SPEAKER_WEIGHT * min(density / self.SPEAKER_DENSITY, 1.0)
+        score += self.NAME_WEIGHT * min(len(names), self.MAX_NAMES)
+        score = round(max(min(score, 1.0), 0.0), 3)
+
+        relevant = score >= self.threshold
+        return {
+            "score": score,
+            "relevant": relevant,
+            "reason": self._explain(features) if not relevant else "",
+            "features": features,
+        }
+
+    def is_relevant(self, document: DocumentContent) -> bool:
+        """Check if a document should be sent for extraction"""
+        return self.score(document)["relevant"]
+
+    def filter(self, documents: List[DocumentContent]) -> tuple:
+        """
+        Split documents into relevant ones and skipped ones.
+
+        Args:
+            documents: Documents to check
+
+        Returns:
+            (relevant documents, skip report entries)
+        """
+        relevant, skipped = [], []
+        for document in documents:
+            result = self.score(document)
+            if result["relevant"]:
+                relevant.append(document)
+            else:
+                skipped.append(self.skip_entry(document, result))
+        return relevant, skipped
+
+    def skip_entry(self, document: DocumentContent, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the skip report entry of a filtered document"""
+        return {
+            "id": document.id,
+            "title": document.title,
+            "url": document.url,
+            "folder_path": document.folder_path,
+            "score": result["score"],
+            "threshold": self.threshold,
+            "reason": result["reason"],
+            "features": result["features"],
+        }
+
+    @staticmethod
+    def _explain(features: Dict[str, Any]) -> str:
+        """Summarize why a document scored low"""
+        reasons = []
+        if features["title_negative"]:
+            reasons.append("non-meeting title")
+        elif not features["title_match"]:
+            reasons.append("no meeting title")
+        if not features["sections"]:
+            reasons.append("no meeting sections")
+        if not features["speaker_density"]:
+            reasons.append("no speaker turns")
+        if not features["stakeholders"]:
+            reasons.append("no known stakeholders")
+        return ", ".join(reasons) or "low score"
@@ -1,13 +1,14 @@
 """
-Report Generator Skill - Generate formatted reports in Google Docs
+Report Generator Skill - Generate formatted reports in Google Docs and Slides
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 from loguru import logger
 
 from utils.google.docs_client import docs_client
 from utils.google.drive_client import drive_client
+from utils.google.slides_client import slides_client, SlideDeckBuilder
 from models.stakeholder import StakeholderProfile
 from models.insight import Theme, Conflict, Quote
 from models.relationship import InfluenceMatrix
@@ -25,11 +26,16 @@ class ReportGenerator:
     - Create executive briefs
     - Generate individual stakeholder summaries
     - Format insights for presentation
+    - Build discovery slide decks
     """
 
+    # Bullets per deck slide before the rest are dropped
+    DECK_MAX_BULLETS = 6
+
     def __init__(self):
         self.docs = docs_client
         self.drive = drive_client
+        self.slides = slides_client
 
     def generate_discovery_report(
         self,
@@ -40,10 +46,16 @@ class ReportGenerator:
         themes: Optional[List[Theme]] = None,
         conflicts: Optional[List[Conflict]] = None,
         folder_id: Optional[str] = None,
+        document_id: Optional[str] = None,
+        update_existing: bool = False,
     ) -> DiscoveryReport:
         """
         Generate a complete stakeholder discovery report.
 
+        In update mode the existing report document is refreshed in place:
+        only sections that changed since the last render (e.g. one
+        stakeholder's profile or a new theme) are rewritten.
+
         Args:
             title: Report title
             profiles: List of stakeholder profiles
@@ -52,6 +64,8 @@ class ReportGenerator:
             themes: Optional list of themes
             conflicts: Optional list of conflicts
             folder_id: Folder to save report in
+            document_id: Existing report document to update in place
+            update_existing: Update the last document rendered for this title, if any
 
         Returns:
             DiscoveryReport object with Google Doc reference
@@ -72,42 +86,87 @@ class ReportGenerator:
         # Generate executive summary
         report.executive_summary = report.generate_executive_summary()
 
-        # Build document content
-        content = self._build_report_content(report)
-
-        # Create Google Doc
-        doc_id = self.docs.create_document(
-            title=f"Stakeholder Discovery Report - {title}",
-            content=content,
-            folder_id=folder_id,
-        )
+        sections = self._build_report_sections(report)
+
+        if update_existing and not document_id:
+            document_id = self.docs.sections.find_document(title)
+
+        doc_id = None
+        if document_id:
+            # Refresh the existing Google Doc in place
+            if self.docs.write_sections(document_id, sections, report_key=title):
+                doc_id = document_id
+            elif self.docs.document_exists(document_id) is False:
+                # Deleted or no longer shared: forget it so later runs stop finding it
+                logger.warning(f"Report document {document_id} is gone, creating a new one")
+                self.docs.sections.clear(document_id)
+                document_id = None
+            else:
+                # Possibly transient: keep the document and retry it next run
+                # rather than leaving another copy behind
+                logger.warning(f"Could not update report document {document_id}")
+
+        if not document_id:
+            # Create formatted Google Doc
+            doc_id = self._create_formatted_document(
+                title=f"Stakeholder Discovery Report - {title}",
+                sections=sections,
+                folder_id=folder_id,
+                report_key=title,
+            )
 
         if doc_id:
             report.google_doc_id = doc_id
             report.google_doc_url = f"https://docs.google.com/document/d/{doc_id}"
-            logger.info(f"Created report document: {report.google_doc_url}")
+            logger.info(f"Report document ready: {report.google_doc_url}")
         else:
-            logger.warning("Failed to create Google Doc for report")
+            logger.warning("Failed to write Google Doc for report")
 
         return report
 
     def _build_report_content(self, report: DiscoveryReport) -> str:
         """Build the full report content as text"""
-        sections = []
+        return "\n".join(text for _, text in self._build_report_sections(report))
+
+    def _build_report_sections(self, report: DiscoveryReport) -> List[Tuple[str, str]]:
+        """
+        Build the report content as keyed markdown sections.
+
+        Each stakeholder profile, theme and conflict is its own section, so
+        a section can be located and rewritten independently.
+
+        Args:
+            report: Discovery report
+
+        Returns:
+            List of (section_key, markdown) in document order
+        """
+        keyed: List[Tuple[str, List[str]]] = []
+
+        def new_section(key: str) -> List[str]:
+            existing = {k for k, _ in keyed}
+            unique_key, n = key, 2
+            while unique_key in existing:
+                unique_key, n = f"{key}#{n}", n + 1
+            keyed.append((unique_key, []))
+            return keyed[-1][1]
 
         # Title
+        sections = new_section("header")
         sections.append(f"# {report.title}")
         sections.append(f"\nGenerated: {report.generated_at.strftime('%B %d, %Y')}")
         sections.append(f"Generated by: {report.generated_by}")
         sections.append("\n---\n")
 
         # Executive Summary
+        sections = new_section("executive_summary")
         sections.append("# Executive Summary")
         sections.append(report.executive_summary)
         sections.append("\n---\n")
 
         # Overview
         if report.insight_summary:
+            sections = new_section("overview")
             sections.append("# Overview")
             sections.append(f"\n- **Total Stakeholders:** {report.insight_summary.total_stakeholders}")
             sections.append(f"- **Total Interactions:** {report.insight_summary.total_interactions}")
@@ -121,9 +180,11 @@ class ReportGenerator:
 
         # Stakeholder Profiles
         if report.stakeholder_profiles:
+            sections = new_section("profiles")
             sections.append("# Stakeholder Profiles")
 
             for profile in report.stakeholder_profiles:
+                sections = new_section(f"profile:{profile.name}")
                 sections.append(f"\n## {profile.name}")
                 sections.append(f"**Role:** {profile.role}")
                 sections.append(f"**Department:** {profile.department}")
@@ -149,9 +210,11 @@ class ReportGenerator:
 
         # Themes and Patterns
         if report.themes_and_patterns:
+            sections = new_section("themes")
             sections.append("# Themes and Patterns")
 
             for theme in report.themes_and_patterns:
+                sections = new_section(f"theme:{theme.name}")
                 sections.append(f"\n## {theme.name}")
                 sections.append(f"**Category:** {theme.category}")
                 sections.append(f"**Severity:** {theme.severity.value}")
@@ -170,9 +233,11 @@ class ReportGenerator:
 
         # Conflicts and Risks
         if report.conflicts_and_risks:
+            sections = new_section("conflicts")
             sections.append("# Conflicts and Risks")
 
             for conflict in report.conflicts_and_risks:
+                sections = new_section(f"conflict:{conflict.description}")
                 sections.append(f"\n## {conflict.description}")
                 sections.append(f"**Parties:** {', '.join(conflict.parties)}")
                 sections.append(f"**Type:** {conflict.conflict_type}")
@@ -189,6 +254,7 @@ class ReportGenerator:
 
         # Influence Matrix Summary
         if report.influence_matrix:
+            sections = new_section("influence")
             sections.append("# Influence Analysis")
 
             if report.influence_matrix.power_brokers:
@@ -216,6 +282,7 @@ class ReportGenerator:
 
         # Recommendations
         if report.recommendations or (report.insight_summary and report.insight_summary.strategic_recommendations):
+            sections = new_section("recommendations")
             sections.append("# Recommendations")
 
             recs = report.recommendations or report.insight_summary.strategic_recommendations
@@ -226,6 +293,7 @@ class ReportGenerator:
 
         # Action Plan
         if report.action_plan or (report.insight_summary and report.insight_summary.immediate_actions):
+            sections = new_section("action_plan")
             sections.append("# Action Plan")
 
             actions = report.action_plan or report.insight_summary.immediate_actions
@@ -237,7 +305,190 @@ class ReportGenerator:
                 if action.owner:
                     sections.append(f"  - Owner: {action.owner}")
 
-        return "\n".join(sections)
+        return [(key, "\n".join(lines)) for key, lines in keyed]
+
+    def _create_formatted_document(
+        self,
+        title: str,
+        sections: List[Tuple[str, str]],
+        folder_id: Optional[str] = None,
+        report_key: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Create a document and write formatted markdown sections into it.
+
+        The whole body goes out in one precomputed batchUpdate, so headings,
+        bullets and bold text are applied without per-paragraph round trips.
+        The section ranges are recorded for later in-place updates.
+
+        Args:
+            title: Document title
+            sections: (section_key, markdown) pairs in document order
+            folder_id: Folder to create in
+            report_key: Key to find the document by for updates
+
+        Returns:
+            Document ID or None
+        """
+        doc_id = self.docs.create_document(title=title, folder_id=folder_id)
+        if not doc_id:
+            return None
+
+        if not self.docs.write_sections(doc_id, sections, report_key=report_key, new_document=True):
+            logger.warning(f"Created document {doc_id} but failed to write its content")
+
+        return doc_id
+
+    def generate_discovery_deck(
+        self,
+        report: DiscoveryReport,
+        folder_id: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Generate a slide deck from a discovery report.
+
+        All slides, shapes, text and styles are queued with pre-assigned
+        object IDs and submitted in a single batchUpdate (chunked only for
+        very large decks), instead of several round trips per slide.
+
+        Args:
+            report: Discovery report (see generate_discovery_report)
+            folder_id: Folder to save the deck in
+
+        Returns:
+            Presentation ID or None
+        """
+        logger.info(f"Generating discovery deck: {report.title}")
+
+        presentation_id = self.slides.create_presentation(
+            title=f"Stakeholder Discovery - {report.title}",
+            folder_id=folder_id,
+        )
+        if not presentation_id:
+            logger.warning("Failed to create presentation for deck")
+            return None
+
+        builder = self.slides.deck_builder(presentation_id)
+
+        # New presentations start with a title slide we don't use
+        if not settings.dry_run:
+            presentation = self.slides.get_presentation(presentation_id) or {}
+            for slide in presentation.get("slides", []):
+                builder.delete_object(slide["objectId"])
+
+        self._build_deck(builder, report)
+
+        if not builder.build():
+            logger.warning("Failed to build discovery deck")
+            return None
+
+        logger.info(
+            f"Created deck with {len(builder.slide_ids)} slides: "
+            f"https://docs.google.com/presentation/d/{presentation_id}"
+        )
+        return presentation_id
+
+    def _build_deck(self, builder: SlideDeckBuilder, report: DiscoveryReport) -> None:
+        """Queue the slides for a discovery deck"""
+        limit = self.DECK_MAX_BULLETS
+
+        def bullet_slide(title: str, items: List[str]) -> None:
+            if items:
+                slide_id = builder.add_slide()
+                builder.add_title(slide_id, title)
+                builder.add_bullets(slide_id, items[:limit])
+
+        # Title
+        slide_id = builder.add_slide()
+        builder.add_text_box(
+            slide_id,
+            report.title,
+            x=builder.MARGIN,
+            y=120,
+            width=builder.PAGE_WIDTH - 2 * builder.MARGIN,
+            height=80,
+            font_size=36,
+            bold=True,
+        )
+        builder.add_text_box(
+            slide_id,
+            f"Stakeholder Discovery Report\n{report.generated_at.strftime('%B %d, %Y')}",
+            x=builder.MARGIN,
+            y=210,
+            width=builder.PAGE_WIDTH - 2 * builder.MARGIN,
+            height=60,
+            font_size=16,
+        )
+
+        # Overview
+        summary = report.insight_summary
+        if summary:
+            overview = [
+                f"Stakeholders analyzed: {summary.total_stakeholders}",
+                f"Total interactions: {summary.total_interactions}",
+            ]
+            overview.extend(
+                f"{stance.title()}: {count}"
+                for stance, count in summary.stance_breakdown.items()
+            )
+            bullet_slide("Overview", overview)
+            bullet_slide(
+                "Top Concerns",
+                [f"{c.name}: {c.description}" for c in summary.top_concerns],
+            )
+            bullet_slide(
+                "Top Needs",
+                [f"{n.name}: {n.description}" for n in summary.top_needs],
+            )
+
+        # Stakeholder profiles
+        for profile in report.stakeholder_profiles:
+            details = [
+                f"Role: {profile.role or 'Unknown'}",
+                f"Department: {profile.department or 'Unknown'}",
+                f"Influence: {profile.influence_level.value} | Stance: {profile.stance.value}",
+            ]
+            details.extend(f"Concern: {c.description}" for c in profile.top_concerns[:2])
+            details.extend(f"Need: {n.description}" for n in profile.top_needs[:2])
+            bullet_slide(profile.name, details)
+
+        # Themes, conflicts and influence
+        bullet_slide(
+            "Themes and Patterns",
+            [f"{t.name} ({t.severity.value}): {t.description}" for t in report.themes_and_patterns],
+        )
+        bullet_slide(
+            "Conflicts and Risks",
+            [
+                f"{c.description} ({', '.join(c.parties)}; {c.severity.value})"
+                for c in report.conflicts_and_risks
+            ],
+        )
+
+        if report.influence_matrix:
+            influence = []
+            if report.influence_matrix.power_brokers:
+                influence.append(f"Power brokers: {', '.join(report.influence_matrix.power_brokers)}")
+            if report.influence_matrix.bridge_builders:
+                influence.append(f"Bridge builders: {', '.join(report.influence_matrix.bridge_builders)}")
+            influence.extend(
+                f"{cluster.name}: {', '.join(cluster.members)}"
+                for cluster in report.influence_matrix.clusters
+            )
+            bullet_slide("Influence Analysis", influence)
+
+        # Recommendations and actions
+        recs = report.recommendations or (summary.strategic_recommendations if summary else [])
+        bullet_slide("Recommendations", list(recs))
+
+        actions = report.action_plan or (summary.immediate_actions if summary else [])
+        bullet_slide(
+            "Action Plan",
+            [
+                f"{a.title} (Due: {a.due_date.strftime('%Y-%m-%d') if a.due_date else 'TBD'})"
+                for a in actions
+            ],
+        )
 
     def generate_executive_brief(
         self,
@@ -289,9 +540,9 @@ class ReportGenerator:
 
         content = "\n".join(content_parts)
 
-        return self.docs.create_document(
+        return self._create_formatted_document(
             title=f"Executive Brief - {datetime.utcnow().strftime('%Y-%m-%d')}",
-            content=content,
+            sections=[("brief", content)],
             folder_id=folder_id,
         )
 
@@ -350,9 +601,9 @@ class ReportGenerator:
 
         content = "\n".join(content_parts)
 
-        return self.docs.create_document(
+        return self._create_formatted_document(
             title=f"Stakeholder Profile - {profile.name}",
-            content=content,
+            sections=[("profile", content)],
             folder_id=folder_id,
         )
 
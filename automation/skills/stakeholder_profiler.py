@@ -8,6 +8,7 @@ import json
 from loguru import logger
 
 from utils.ai_client import ai_client
+from utils.stakeholder_registry import StakeholderRegistry, name_department
 from models.stakeholder import StakeholderProfile, StakeholderInsight
 from models.insight import Concern, Need, Quote
 from models.relationship import Relationship
@@ -28,6 +29,10 @@ class StakeholderProfiler:
     - Update existing profiles with new data
     - Determine influence level and stance
     - Track relationships
+
+    Profiles are kept in a StakeholderRegistry, so the same person written
+    as "Sam Lee", "Samuel Lee" or "S. Lee (Finance)" resolves to one
+    profile, and name lookups don't scan every profile.
     """
 
     ANALYSIS_PROMPT = """You are an expert stakeholder analyst for product management.
@@ -90,7 +95,7 @@ Return ONLY the JSON."""
 
     def __init__(self):
         self.ai = ai_client
-        self._profiles: Dict[str, StakeholderProfile] = {}
+        self.registry = StakeholderRegistry()
 
     def create_profile(
         self,
@@ -122,7 +127,7 @@ Return ONLY the JSON."""
             updated_at=datetime.utcnow(),
         )
 
-        self._profiles[profile.id] = profile
+        self.registry.add(profile)
         return profile
 
     def update_from_insight(
@@ -154,7 +159,7 @@ Return ONLY the JSON."""
         profile.add_insight(insight)
 
         # Update in storage
-        self._profiles[profile.id] = profile
+        self.registry.add(profile)
 
         return profile
 
@@ -235,7 +240,7 @@ Return ONLY the JSON."""
             profile.decision_style = data.get("decision_style", "data-driven")
 
             profile.updated_at = datetime.utcnow()
-            self._profiles[profile.id] = profile
+            self.registry.add(profile)
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse AI response: {e}")
@@ -252,29 +257,33 @@ Return ONLY the JSON."""
         Returns:
             StakeholderProfile or None
         """
-        return self._profiles.get(stakeholder_id)
+        return self.registry.get(stakeholder_id)
 
-    def get_profile_by_name(self, name: str) -> Optional[StakeholderProfile]:
+    def get_profile_by_name(
+        self,
+        name: str,
+        email: str = "",
+        department: str = "",
+    ) -> Optional[StakeholderProfile]:
         """
-        Get a profile by name.
+        Get the profile of the person a name refers to.
 
         Args:
-            name: Stakeholder name
+            name: Stakeholder name, as written in notes
+            email: Email address, if known
+            department: Department, if known
 
         Returns:
             StakeholderProfile or None
         """
-        name_lower = name.lower()
-        for profile in self._profiles.values():
-            if profile.name.lower() == name_lower:
-                return profile
-        return None
+        return self.registry.resolve(name, email, department)
 
     def get_or_create_profile(
         self,
         name: str,
         role: str = "",
         department: str = "",
+        email: str = "",
     ) -> StakeholderProfile:
         """
         Get existing profile or create new one.
@@ -283,14 +292,25 @@ Return ONLY the JSON."""
             name: Stakeholder name
             role: Job title
             department: Department
+            email: Email address
 
         Returns:
             StakeholderProfile
         """
-        profile = self.get_profile_by_name(name)
+        # "S. Lee (Finance)" names the department
+        department = department or name_department(name)
+
+        profile = self.registry.resolve(name, email, department, fuzzy=False)
         if profile:
+            # Later lookups of this spelling hit the exact-name index
+            self.registry.add_alias(profile.id, name)
             return profile
-        return self.create_profile(name, role, department)
+
+        # Fuzzy matches are not saved as aliases, so a wrong guess does not stick
+        profile = self.registry.resolve(name, email, department)
+        if profile:
+            return profile
+        return self.create_profile(name, role, department, email)
 
     def list_all_profiles(self) -> List[StakeholderProfile]:
         """
@@ -299,7 +319,7 @@ Return ONLY the JSON."""
         Returns:
             List of all profiles
         """
-        return list(self._profiles.values())
+        return list(self.registry)
 
     def get_profiles_by_stance(self, stance: Stance) -> List[StakeholderProfile]:
         """
@@ -311,7 +331,7 @@ Return ONLY the JSON."""
         Returns:
             List of matching profiles
         """
-        return [p for p in self._profiles.values() if p.stance == stance]
+        return [p for p in self.registry if p.stance == stance]
 
     def get_profiles_by_influence(self, influence: InfluenceLevel) -> List[StakeholderProfile]:
         """
@@ -323,7 +343,7 @@ Return ONLY the JSON."""
         Returns:
             List of matching profiles
         """
-        return [p for p in self._profiles.values() if p.influence_level == influence]
+        return [p for p in self.registry if p.influence_level == influence]
 
     def add_relationship(
         self,
@@ -352,7 +372,7 @@ Return ONLY the JSON."""
         # Create relationship
         relationship = Relationship(
             target_stakeholder_id=target.id,
-            target_stakeholder_name=target_name,
+            target_stakeholder_name=target.name,
             relationship_type=relationship_type,
             strength=strength,
             context=context,
@@ -363,7 +383,80 @@ Return ONLY the JSON."""
         if not existing:
             profile.relationships.append(relationship)
             profile.updated_at = datetime.utcnow()
-            self._profiles[profile.id] = profile
+            self.registry.add(profile)
+
+        return profile
+
+    def apply_insight(self, insight: StakeholderInsight) -> Optional[StakeholderProfile]:
+        """
+        Merge an insight into its stakeholder's profile.
+
+        Creates the profile if needed and records mentioned stakeholders
+        as relationships.
+
+        Args:
+            insight: Insight to apply
+
+        Returns:
+            Updated profile or None if the insight names no stakeholder
+        """
+        if not insight.stakeholder_name:
+            return None
+
+        # Get or create profile
+        profile = self.get_or_create_profile(
+            name=insight.stakeholder_name,
+            role=insight.stakeholder_role,
+            department=insight.stakeholder_department,
+            email=insight.stakeholder_email,
+        )
+
+        # Update with insight
+        self.update_from_insight(profile, insight)
+
+        # Add mentioned stakeholders as relationships
+        for mentioned in insight.mentioned_stakeholders:
+            if mentioned.name:
+                self.add_relationship(
+                    profile=profile,
+                    target_name=mentioned.name,
+                    relationship_type=RelationshipType.COLLABORATES,
+                    context=mentioned.context,
+                )
+
+        return profile
+
+    def rebuild_profile(
+        self,
+        name: str,
+        insights: List[StakeholderInsight],
+    ) -> Optional[StakeholderProfile]:
+        """
+        Rebuild a profile from scratch from all of its insights.
+
+        Used when a source document changed, since its old contribution
+        cannot be subtracted from the aggregated profile.
+
+        Args:
+            name: Stakeholder name
+            insights: Every insight for this stakeholder
+
+        Returns:
+            Rebuilt profile or None if no insights remain
+        """
+        existing = self.get_profile_by_name(name)
+        if existing:
+            self.registry.remove(existing.id)
+            if insights:
+                # Keep the identity, so insights under other spellings resolve to it
+                self.create_profile(existing.name, existing.role, existing.department, existing.email)
+
+        profile = None
+        for insight in sorted(insights, key=lambda i: i.meeting_date.timestamp() if i.meeting_date else 0.0):
+            profile = self.apply_insight(insight) or profile
+
+        if profile and existing:
+            profile.created_at = existing.created_at
 
         return profile
 
@@ -385,32 +478,11 @@ Return ONLY the JSON."""
         logger.info(f"Building profiles from {len(insights)} insights")
 
         for insight in insights:
-            if not insight.stakeholder_name:
-                continue
-
-            # Get or create profile
-            profile = self.get_or_create_profile(
-                name=insight.stakeholder_name,
-                role=insight.stakeholder_role,
-                department=insight.stakeholder_department,
-            )
-
-            # Update with insight
-            self.update_from_insight(profile, insight)
-
-            # Add mentioned stakeholders as relationships
-            for mentioned in insight.mentioned_stakeholders:
-                if mentioned.name:
-                    self.add_relationship(
-                        profile=profile,
-                        target_name=mentioned.name,
-                        relationship_type=RelationshipType.COLLABORATES,
-                        context=mentioned.context,
-                    )
+            self.apply_insight(insight)
 
         # Run analysis on profiles
         if analyze:
-            for profile in self._profiles.values():
+            for profile in self.registry:
                 if profile.total_interactions > 0:
                     self.analyze_profile(profile)
 
@@ -423,7 +495,7 @@ Return ONLY the JSON."""
         Returns:
             List of profile dicts
         """
-        return [p.to_dict() for p in self._profiles.values()]
+        return [p.to_dict() for p in self.registry]
 
     def import_profiles(self, data: List[Dict[str, Any]]) -> int:
         """
@@ -439,7 +511,7 @@ Return ONLY the JSON."""
         for item in data:
             try:
                 profile = StakeholderProfile.from_dict(item)
-                self._profiles[profile.id] = profile
+                self.registry.add(profile)
                 count += 1
             except Exception as e:
                 logger.error(f"Error importing profile: {e}")
@@ -2,11 +2,17 @@
 Task Creator Skill - Create tasks in Google Tasks
 """
 
-from typing import List, Optional
+from typing import List, Optional, Dict
 from datetime import datetime, timedelta
+from difflib import SequenceMatcher
 from loguru import logger
 
 from utils.google.tasks_client import tasks_client
+from utils.google.task_index import (
+    normalize_title,
+    idempotency_key,
+    format_idempotency_marker,
+)
 from models.action import ActionItem
 from models.enums import ActionStatus
 
@@ -20,11 +26,31 @@ class TaskCreator:
     - Create follow-up tasks for stakeholders
     - Batch create multiple tasks
     - Get pending follow-ups
+
+    Creation is idempotent: each task carries a key derived from its source
+    document, stakeholder and normalized title (stored in the task notes and
+    the local task index), so re-running discovery links to existing tasks
+    instead of creating them again.
     """
 
+    # Normalized titles for the same stakeholder at least this similar are merged
+    DUPLICATE_THRESHOLD = 0.85
+
     def __init__(self):
         self.tasks = tasks_client
 
+    def sync_index(self, task_list_id: Optional[str] = None) -> bool:
+        """
+        Refresh the local task index used for dedupe and status checks.
+
+        Args:
+            task_list_id: Task list ID
+
+        Returns:
+            True if the index was refreshed
+        """
+        return self.tasks.sync_task_index(task_list_id)
+
     def create_task(
         self,
         title: str,
@@ -77,20 +103,17 @@ class TaskCreator:
         """
         logger.info(f"Creating task from action item: {action_item.title}")
 
-        # Build notes
-        notes_parts = []
-        if action_item.description:
-            notes_parts.append(action_item.description)
-        if action_item.stakeholder:
-            notes_parts.append(f"Stakeholder: {action_item.stakeholder}")
-        if action_item.source_doc_id:
-            notes_parts.append(f"Source: {action_item.source_doc_id}")
-
-        notes = "\n".join(notes_parts) if notes_parts else None
+        key = self._action_item_key(action_item)
+        self.sync_index(task_list_id)
+        existing = self.tasks.index.find_by_key(key)
+        if existing:
+            action_item.google_task_id = existing["id"]
+            logger.info(f"Action item already linked to Google Task: {existing['id']}")
+            return action_item
 
         task_id = self.tasks.create_task(
             title=action_item.title,
-            notes=notes,
+            notes=self._build_notes(action_item, key),
             due_date=action_item.due_date,
             task_list_id=task_list_id,
         )
@@ -101,6 +124,72 @@ class TaskCreator:
 
         return action_item
 
+    def _action_item_key(self, action_item: ActionItem) -> str:
+        """Idempotency key for an action item"""
+        return idempotency_key(
+            action_item.source_doc_id, action_item.stakeholder, action_item.title
+        )
+
+    def _build_notes(self, action_item: ActionItem, key: Optional[str] = None) -> Optional[str]:
+        """Build task notes from an action item"""
+        notes_parts = []
+        if action_item.description:
+            notes_parts.append(action_item.description)
+        if action_item.stakeholder:
+            notes_parts.append(f"Stakeholder: {action_item.stakeholder}")
+        if action_item.source_doc_id:
+            notes_parts.append(f"Source: {action_item.source_doc_id}")
+        if key:
+            notes_parts.append(format_idempotency_marker(key))
+
+        return "\n".join(notes_parts) if notes_parts else None
+
+    def merge_duplicates(self, action_items: List[ActionItem]) -> List[ActionItem]:
+        """
+        Merge near-identical action items before any API call.
+
+        Items for the same stakeholder whose normalized titles are at least
+        DUPLICATE_THRESHOLD similar collapse into the first one seen, which
+        keeps the earliest due date.
+
+        Args:
+            action_items: Action items, possibly from several documents
+
+        Returns:
+            Representative action items in original order
+        """
+        groups: Dict[str, List[tuple]] = {}
+        unique: List[ActionItem] = []
+
+        for item in action_items:
+            title = normalize_title(item.title)
+            representatives = groups.setdefault(normalize_title(item.stakeholder), [])
+
+            match = None
+            for rep_title, rep in representatives:
+                matcher = SequenceMatcher(None, title, rep_title)
+                if (
+                    title == rep_title
+                    or matcher.quick_ratio() >= self.DUPLICATE_THRESHOLD
+                    and matcher.ratio() >= self.DUPLICATE_THRESHOLD
+                ):
+                    match = rep
+                    break
+
+            if match is None:
+                representatives.append((title, item))
+                unique.append(item)
+                continue
+
+            if item.due_date and (not match.due_date or item.due_date < match.due_date):
+                match.due_date = item.due_date
+            if not match.description and item.description:
+                match.description = item.description
+
+        if len(unique) < len(action_items):
+            logger.info(f"Merged {len(action_items) - len(unique)} duplicate action items")
+        return unique
+
     def create_follow_up(
         self,
         stakeholder: str,
@@ -108,9 +197,10 @@ class TaskCreator:
         due_date: Optional[datetime] = None,
         notes: Optional[str] = None,
         task_list_id: Optional[str] = None,
+        sync: bool = True,
     ) -> Optional[str]:
         """
-        Create a stakeholder follow-up task.
+        Create a stakeholder follow-up task, unless one is still pending.
 
         Args:
             stakeholder: Stakeholder name
@@ -118,21 +208,32 @@ class TaskCreator:
             due_date: Due date (defaults to 1 week from now)
             notes: Additional notes
             task_list_id: Task list ID
+            sync: Refresh the task index first (skip if just synced)
 
         Returns:
             Task ID or None
         """
+        key = idempotency_key("follow-up", stakeholder, topic)
+        if sync:
+            self.sync_index(task_list_id)
+
+        existing = self.tasks.index.find_by_key(key)
+        if existing and existing.get("status") != "completed":
+            logger.info(f"Follow-up for {stakeholder} already pending: {existing['id']}")
+            return existing["id"]
+
         logger.info(f"Creating follow-up task for {stakeholder}: {topic}")
 
         # Default due date to 1 week from now
         if not due_date:
             due_date = datetime.utcnow() + timedelta(days=7)
 
+        marker = format_idempotency_marker(key)
         return self.tasks.create_follow_up_task(
             stakeholder=stakeholder,
             topic=topic,
             due_date=due_date,
-            notes=notes,
+            notes=f"{notes}\n{marker}" if notes else marker,
             task_list_id=task_list_id,
         )
 
@@ -140,28 +241,70 @@ class TaskCreator:
         self,
         action_items: List[ActionItem],
         task_list_id: Optional[str] = None,
+        sync: bool = True,
     ) -> List[ActionItem]:
         """
-        Create multiple tasks from action items.
+        Upsert tasks for multiple action items.
+
+        Near-duplicate items are merged first, so the result may be shorter
+        than the input. Items whose idempotency key already exists in the
+        task index are linked to that task; the rest are sent as batched
+        requests. Items that fail keep google_task_id unset.
 
         Args:
             action_items: List of action items
             task_list_id: Task list ID
+            sync: Refresh the task index first (skip if just synced)
 
         Returns:
             List of updated action items with google_task_ids
         """
         logger.info(f"Batch creating {len(action_items)} tasks")
 
-        updated_items = []
-        for item in action_items:
-            updated = self.create_from_action_item(item, task_list_id)
-            updated_items.append(updated)
+        items = self.merge_duplicates(action_items)
+        if not items:
+            return items
+
+        if sync:
+            self.sync_index(task_list_id)
+
+        to_create = []
+        for item in items:
+            key = self._action_item_key(item)
+            existing = self.tasks.index.find_by_key(key)
+            if existing:
+                item.google_task_id = existing["id"]
+                if existing.get("status") == "completed":
+                    item.status = ActionStatus.COMPLETED
+            else:
+                to_create.append((item, key))
+
+        if len(to_create) < len(items):
+            logger.info(f"{len(items) - len(to_create)} action items already have tasks")
+
+        if not to_create:
+            return items
+
+        task_ids, failures = self.tasks.create_tasks_bulk(
+            [
+                {
+                    "title": item.title,
+                    "notes": self._build_notes(item, key),
+                    "due_date": item.due_date,
+                }
+                for item, key in to_create
+            ],
+            task_list_id=task_list_id,
+        )
 
-        created_count = sum(1 for item in updated_items if item.google_task_id)
-        logger.info(f"Successfully created {created_count}/{len(action_items)} tasks")
+        for (item, _), task_id in zip(to_create, task_ids):
+            if task_id:
+                item.google_task_id = task_id
 
-        return updated_items
+        created_count = len(to_create) - len(failures)
+        logger.info(f"Successfully created {created_count}/{len(to_create)} tasks")
+
+        return items
 
     def get_pending_follow_ups(
         self,
@@ -178,13 +321,12 @@ class TaskCreator:
         """
         logger.info("Getting pending follow-up tasks")
 
-        tasks = self.tasks.get_pending_tasks(task_list_id)
-
-        # Filter for follow-up tasks
-        follow_ups = [
-            t for t in tasks
-            if "follow up" in t.get("title", "").lower()
-        ]
+        # One delta sync, then filter titles in the local index
+        follow_ups = self.tasks.find_tasks(
+            task_list_id,
+            pending_only=True,
+            title_contains="follow up",
+        )
 
         logger.info(f"Found {len(follow_ups)} pending follow-ups")
         return follow_ups
@@ -222,18 +364,40 @@ class TaskCreator:
         Returns:
             Updated action item
         """
-        if not action_item.google_task_id:
-            return action_item
+        return self.sync_action_items([action_item], task_list_id)[0]
 
-        task = self.tasks.get_task(action_item.google_task_id, task_list_id)
-        if task:
-            status = task.get("status", "needsAction")
-            if status == "completed":
-                action_item.status = ActionStatus.COMPLETED
-            else:
-                action_item.status = ActionStatus.PENDING
+    def sync_action_items(
+        self,
+        action_items: List[ActionItem],
+        task_list_id: Optional[str] = None,
+    ) -> List[ActionItem]:
+        """
+        Sync the status of many action items with one delta call.
 
-        return action_item
+        Args:
+            action_items: Action items to sync
+            task_list_id: Task list ID
+
+        Returns:
+            Updated action items
+        """
+        linked = [item for item in action_items if item.google_task_id]
+        if not linked:
+            return action_items
+
+        self.tasks.sync_task_index(task_list_id)
+
+        for item in linked:
+            task = self.tasks.index.get(item.google_task_id)
+            if task:
+                status = task.get("status", "needsAction")
+                if status == "completed":
+                    item.status = ActionStatus.COMPLETED
+                else:
+                    item.status = ActionStatus.PENDING
+
+        logger.info(f"Synced status for {len(linked)} action items")
+        return action_items
 
     def create_task_list(self, title: str) -> Optional[str]:
         """
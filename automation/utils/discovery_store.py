@@ -0,0 +1,125 @@
+"""
+Discovery Store - Persisted stakeholder discovery state for incremental runs
+"""
+
+import json
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple
+
+from utils.local_store import SQLiteStore
+from models.stakeholder import StakeholderInsight, StakeholderProfile
+
+
+class DiscoveryStore(SQLiteStore):
+    """
+    Insights, profiles and aggregates from previous discovery runs.
+
+    State is partitioned by scope (the report title), so separate
+    discovery efforts do not mix. Insights are stored per source document
+    together with the document version they were extracted from.
+    """
+
+    DB_NAME = "discovery.db"
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS insights (
+            scope TEXT NOT NULL,
+            doc_id TEXT NOT NULL,
+            version TEXT,
+            payload TEXT NOT NULL,
+            PRIMARY KEY (scope, doc_id)
+        );
+        CREATE TABLE IF NOT EXISTS profiles (
+            scope TEXT NOT NULL,
+            profile_id TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            PRIMARY KEY (scope, profile_id)
+        );
+        CREATE TABLE IF NOT EXISTS state (
+            scope TEXT NOT NULL,
+            name TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            PRIMARY KEY (scope, name)
+        );
+    """
+
+    def load_insights(self, scope: str) -> Dict[str, Tuple[StakeholderInsight, Optional[str]]]:
+        """
+        Load stored insights.
+
+        Args:
+            scope: Discovery scope
+
+        Returns:
+            Dict mapping doc ID to (insight, document version)
+        """
+        return {
+            row["doc_id"]: (StakeholderInsight.from_dict(json.loads(row["payload"])), row["version"])
+            for row in self.query(
+                "SELECT doc_id, version, payload FROM insights WHERE scope = ?", (scope,)
+            )
+        }
+
+    def save_insights(
+        self,
+        scope: str,
+        insights: List[StakeholderInsight],
+        versions: Dict[str, Optional[str]],
+    ) -> None:
+        """
+        Upsert insights with the document versions they were extracted from.
+
+        Args:
+            scope: Discovery scope
+            insights: Insights to store
+            versions: Doc ID to version (e.g. modifiedTime)
+        """
+        with self.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO insights VALUES (?, ?, ?, ?)",
+                [
+                    (scope, i.source_doc_id, versions.get(i.source_doc_id), json.dumps(i.to_dict()))
+                    for i in insights
+                ],
+            )
+
+    def load_profiles(self, scope: str) -> List[StakeholderProfile]:
+        """Load stored profiles for a scope"""
+        return [
+            StakeholderProfile.from_dict(json.loads(row["payload"]))
+            for row in self.query("SELECT payload FROM profiles WHERE scope = ?", (scope,))
+        ]
+
+    def save_profiles(self, scope: str, profiles: List[StakeholderProfile]) -> None:
+        """Replace the stored profiles for a scope"""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM profiles WHERE scope = ?", (scope,))
+            conn.executemany(
+                "INSERT INTO profiles VALUES (?, ?, ?)",
+                [(scope, p.id, json.dumps(p.to_dict())) for p in profiles],
+            )
+
+    def get_state(self, scope: str, name: str) -> Optional[Any]:
+        """Get a JSON state value (e.g. influence matrix, themes, checkpoint)"""
+        rows = self.query(
+            "SELECT payload FROM state WHERE scope = ? AND name = ?", (scope, name)
+        )
+        return json.loads(rows[0]["payload"]) if rows else None
+
+    def set_state(self, scope: str, name: str, value: Any) -> None:
+        """Store a JSON-serializable state value"""
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO state VALUES (?, ?, ?)",
+                (scope, name, json.dumps(value)),
+            )
+
+    def get_checkpoint(self, scope: str) -> Optional[datetime]:
+        """Get the start time of the last completed run"""
+        value = self.get_state(scope, "checkpoint")
+        return datetime.fromisoformat(value) if value else None
+
+    def clear(self, scope: str) -> None:
+        """Drop all state for a scope"""
+        with self.transaction() as conn:
+            for table in ("insights", "profiles", "state"):
+                conn.execute(f"DELETE FROM {table} WHERE scope = ?", (scope,))
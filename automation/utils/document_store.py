@@ -0,0 +1,177 @@
+"""
+Document Store - Compressed local cache of extracted document content
+"""
+
+import json
+import lzma
+import time
+import zlib
+from typing import Optional, Dict, Any
+from loguru import logger
+
+from utils.local_store import SQLiteStore
+from models.document import DocumentContent
+from config import settings
+
+
+CODECS = {
+    "zlib": (lambda data: zlib.compress(data, 6), zlib.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+
+
+def file_version(file_info: Dict[str, Any]) -> Optional[str]:
+    """
+    Get the version marker of a Drive file.
+
+    Binary files carry a headRevisionId; native Google files only have
+    modifiedTime, which changes on every edit.
+
+    Args:
+        file_info: Drive file metadata
+
+    Returns:
+        Version string or None
+    """
+    return file_info.get("headRevisionId") or file_info.get("modifiedTime")
+
+
+class DocumentStore(SQLiteStore):
+    """
+    LRU cache of DocumentContent keyed by file ID and version.
+
+    Entries are stored compressed. Once the total size exceeds the
+    configured limit, the least recently read entries are evicted.
+    """
+
+    DB_NAME = "documents.db"
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS documents (
+            file_id TEXT PRIMARY KEY,
+            version TEXT NOT NULL,
+            codec TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            last_access REAL NOT NULL,
+            payload BLOB NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_documents_access ON documents (last_access);
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        max_doc_bytes: Optional[int] = None,
+        codec: Optional[str] = None,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            db_path: Path to the SQLite file
+            max_bytes: Total compressed size limit (defaults to settings)
+            max_doc_bytes: Per-document compressed size limit (defaults to settings)
+            codec: "zlib" or "lzma" (defaults to settings)
+        """
+        super().__init__(db_path)
+        self.max_bytes = max_bytes or settings.document_cache_max_mb * 1024 * 1024
+        self.max_doc_bytes = max_doc_bytes or settings.document_cache_max_doc_mb * 1024 * 1024
+        self.codec = codec or settings.document_cache_compression
+        if self.codec not in CODECS:
+            logger.warning(f"Unknown document cache codec '{self.codec}', using zlib")
+            self.codec = "zlib"
+
+    def get(self, file_id: str, version: Optional[str]) -> Optional[DocumentContent]:
+        """
+        Get a cached document if it matches the given version.
+
+        Args:
+            file_id: Drive file ID
+            version: Current version (see file_version)
+
+        Returns:
+            DocumentContent or None if missing or stale
+        """
+        if not version:
+            return None
+
+        rows = self.query(
+            "SELECT codec, payload FROM documents WHERE file_id = ? AND version = ?",
+            (file_id, version),
+        )
+        if not rows:
+            return None
+
+        try:
+            decompress = CODECS[rows[0]["codec"]][1]
+            data = json.loads(decompress(rows[0]["payload"]).decode("utf-8"))
+            document = DocumentContent.from_dict(data)
+        except (KeyError, ValueError, zlib.error, lzma.LZMAError) as e:
+            logger.warning(f"Dropping unreadable cache entry for {file_id}: {e}")
+            self.delete(file_id)
+            return None
+
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE documents SET last_access = ? WHERE file_id = ?",
+                (time.time(), file_id),
+            )
+        return document
+
+    def put(self, document: DocumentContent, version: Optional[str]) -> bool:
+        """
+        Cache a document under its version, evicting old entries if needed.
+
+        Args:
+            document: Extracted document content
+            version: Version the content was read at
+
+        Returns:
+            True if cached
+        """
+        if not version:
+            return False
+
+        compress = CODECS[self.codec][0]
+        payload = compress(json.dumps(document.to_dict()).encode("utf-8"))
+        if len(payload) > self.max_doc_bytes:
+            logger.debug(f"Not caching {document.id}: {len(payload)} bytes exceeds per-document limit")
+            return False
+
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?)",
+                (document.id, version, self.codec, len(payload), time.time(), payload),
+            )
+            self._evict(conn)
+        return True
+
+    def _evict(self, conn) -> None:
+        """Delete least recently read entries until under the size limit"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM documents").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        for row in conn.execute("SELECT file_id, size FROM documents ORDER BY last_access").fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM documents WHERE file_id = ?", (row["file_id"],))
+            total -= row["size"]
+            evicted += 1
+
+        logger.debug(f"Evicted {evicted} cached documents")
+
+    def delete(self, file_id: str) -> None:
+        """Remove a document from the cache"""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM documents WHERE file_id = ?", (file_id,))
+
+    def versions(self) -> Dict[str, str]:
+        """Get the cached version of every entry, by file ID"""
+        return {row["file_id"]: row["version"] for row in self.query("SELECT file_id, version FROM documents")}
+
+    def stats(self) -> Dict[str, int]:
+        """Get entry count and total compressed size"""
+        row = self.query("SELECT COUNT(*) AS entries, COALESCE(SUM(size), 0) AS bytes FROM documents")[0]
+        return {"entries": row["entries"], "bytes": row["bytes"]}
@@ -12,9 +12,9 @@ This module provides clients for interacting with Google Workspace APIs:
 
 from utils.google.base_client import GoogleBaseClient
 from utils.google.drive_client import DriveClient, drive_client
-from utils.google.docs_client import DocsClient, docs_client
-from utils.google.sheets_client import SheetsClient, sheets_client
-from utils.google.slides_client import SlidesClient, slides_client
+from utils.google.docs_client import DocsClient, DocumentBuilder, docs_client
+from utils.google.sheets_client import SheetsClient, SheetsWriter, sheets_client
+from utils.google.slides_client import SlidesClient, SlideDeckBuilder, slides_client
 from utils.google.calendar_client import CalendarClient, calendar_client
 from utils.google.tasks_client import TasksClient, tasks_client
 
@@ -23,10 +23,13 @@ __all__ = [
     "DriveClient",
     "drive_client",
     "DocsClient",
+    "DocumentBuilder",
     "docs_client",
     "SheetsClient",
+    "SheetsWriter",
     "sheets_client",
     "SlidesClient",
+    "SlideDeckBuilder",
     "slides_client",
     "CalendarClient",
     "calendar_client",
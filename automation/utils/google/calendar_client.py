@@ -2,14 +2,23 @@
 Google Calendar Client - Event and scheduling management
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Tuple
 from datetime import datetime, timedelta
+import time
 from loguru import logger
 
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from utils.google.base_client import google_base_client
+from utils.google.calendar_store import CalendarEventStore
+from utils.google.free_busy import (
+    to_utc,
+    merge_intervals,
+    working_windows,
+    free_intervals,
+    split_into_slots,
+)
 from config import settings
 
 
@@ -18,6 +27,8 @@ class CalendarClient:
 
     def __init__(self):
         self._service = None
+        self.store = CalendarEventStore()
+        self._last_sync: Dict[str, float] = {}
 
     @property
     def service(self):
@@ -61,6 +72,89 @@ class CalendarClient:
             logger.error(f"Failed to list calendars: {e}")
             return []
 
+    def _list_all_events(self, **params) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Page through events.list and return (events, nextSyncToken)"""
+        events = []
+        page_token = None
+
+        while True:
+            if page_token:
+                params["pageToken"] = page_token
+
+            response = self.service.events().list(**params).execute()
+            events.extend(response.get("items", []))
+            page_token = response.get("nextPageToken")
+
+            if not page_token:
+                return events, response.get("nextSyncToken")
+
+    def sync_events(self, calendar_id: Optional[str] = None, force: bool = False) -> bool:
+        """
+        Bring the local event store up to date.
+
+        Uses the stored syncToken for a single delta call. Falls back to a
+        full sync of the last calendar_sync_days_back days when there is no
+        token or it has expired (HTTP 410).
+
+        Args:
+            calendar_id: Calendar ID (defaults to primary)
+            force: Sync even if the last sync is within the sync interval
+
+        Returns:
+            True if the store is current, False if the API was unreachable
+        """
+        if not self.service:
+            return False
+
+        cal_id = calendar_id or settings.google_calendar_id or "primary"
+
+        last_sync = self._last_sync.get(cal_id)
+        if (
+            not force
+            and last_sync is not None
+            and time.monotonic() - last_sync < settings.calendar_sync_interval_seconds
+        ):
+            return True
+
+        try:
+            state = self.store.get_sync_state(cal_id)
+            sync_token = state.get("sync_token") if state else None
+
+            if sync_token:
+                try:
+                    events, next_token = self._list_all_events(
+                        calendarId=cal_id,
+                        singleEvents=True,
+                        syncToken=sync_token,
+                    )
+                    self.store.apply_changes(cal_id, events, next_token)
+                    logger.info(f"Synced {len(events)} changed events for {cal_id}")
+                except HttpError as e:
+                    if e.resp.status != 410:
+                        raise
+                    logger.info(f"Sync token expired for {cal_id}, running full sync")
+                    sync_token = None
+
+            if not sync_token:
+                window_start = datetime.utcnow() - timedelta(days=settings.calendar_sync_days_back)
+                events, next_token = self._list_all_events(
+                    calendarId=cal_id,
+                    singleEvents=True,
+                    timeMin=window_start.isoformat() + "Z",
+                    maxResults=2500,
+                )
+                self.store.apply_changes(
+                    cal_id, events, next_token, window_start=window_start, full_sync=True
+                )
+                logger.info(f"Full sync stored {len(events)} events for {cal_id}")
+
+        except Exception as e:
+            logger.warning(f"Calendar sync failed for {cal_id}, using local events: {e}")
+            return False
+
+        self._last_sync[cal_id] = time.monotonic()
+        return True
+
     def get_events(
         self,
         calendar_id: Optional[str] = None,
@@ -69,10 +163,15 @@ class CalendarClient:
         max_results: int = 100,
         single_events: bool = True,
         order_by: str = "startTime",
+        use_cache: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         Get events from a calendar.
 
+        Expanded (single_events) queries are answered from the local event
+        store after at most one delta sync. If the API is unreachable, the
+        last synced events are returned.
+
         Args:
             calendar_id: Calendar ID (defaults to primary)
             time_min: Start of time range (defaults to now)
@@ -80,20 +179,30 @@ class CalendarClient:
             max_results: Maximum number of events
             single_events: Expand recurring events
             order_by: Sort order (startTime or updated)
+            use_cache: Serve from the local event store when it covers the range
 
         Returns:
             List of event dicts
         """
+        cal_id = calendar_id or settings.google_calendar_id or "primary"
+
+        # Default time range
+        if time_min is None:
+            time_min = datetime.utcnow()
+
+        if use_cache and single_events:
+            synced = self.sync_events(cal_id)
+            if (synced or self.store.get_sync_state(cal_id)) and self.store.covers(cal_id, time_min):
+                events = self.store.get_events(cal_id, time_min, time_max, max_results)
+                if order_by == "updated":
+                    events.sort(key=lambda e: e.get("updated", ""))
+                logger.info(f"Retrieved {len(events)} events from local store")
+                return events
+
         if not self.service:
             return []
 
         try:
-            cal_id = calendar_id or settings.google_calendar_id or "primary"
-
-            # Default time range
-            if time_min is None:
-                time_min = datetime.utcnow()
-
             params = {
                 "calendarId": cal_id,
                 "timeMin": time_min.isoformat() + "Z",
@@ -267,6 +376,7 @@ class CalendarClient:
 
             event_id = event.get("id")
             logger.info(f"Created event '{summary}' with ID: {event_id}")
+            self._last_sync.pop(cal_id, None)
             return event_id
 
         except HttpError as e:
@@ -323,6 +433,7 @@ class CalendarClient:
             ).execute()
 
             logger.info(f"Updated event {event_id}")
+            self._last_sync.pop(cal_id, None)
             return True
 
         except HttpError as e:
@@ -360,12 +471,108 @@ class CalendarClient:
             ).execute()
 
             logger.info(f"Deleted event {event_id}")
+            self._last_sync.pop(cal_id, None)
             return True
 
         except HttpError as e:
             logger.error(f"Failed to delete event: {e}")
             return False
 
+    def query_free_busy(
+        self,
+        calendar_ids: List[str],
+        time_min: datetime,
+        time_max: datetime,
+    ) -> Dict[str, List[tuple]]:
+        """
+        Get busy intervals for many calendars via freebusy.query.
+
+        Calendars are sent in batches of 50 (the API limit), so a dozen
+        attendees cost a single request. Calendars whose free/busy is
+        unavailable (not found, no access) are left out of the result
+        rather than reported as free, and a failed request raises
+        HttpError, so callers never mistake unknown for free.
+
+        Args:
+            calendar_ids: Calendar IDs or attendee emails
+            time_min: Start of range
+            time_max: End of range
+
+        Returns:
+            Dict mapping calendar ID to list of (start, end) UTC datetimes
+        """
+        if not self.service:
+            return {}
+
+        busy_by_calendar: Dict[str, List[tuple]] = {}
+        time_min, time_max = to_utc(time_min), to_utc(time_max)
+
+        for offset in range(0, len(calendar_ids), 50):
+            batch = calendar_ids[offset:offset + 50]
+            response = self.service.freebusy().query(body={
+                "timeMin": time_min.isoformat(),
+                "timeMax": time_max.isoformat(),
+                "items": [{"id": cal_id} for cal_id in batch],
+            }).execute()
+
+            for cal_id, data in response.get("calendars", {}).items():
+                if data.get("errors"):
+                    reasons = ", ".join(e.get("reason", "") for e in data["errors"])
+                    logger.warning(f"Free/busy unavailable for {cal_id}: {reasons}")
+                    continue
+                busy_by_calendar[cal_id] = [
+                    (
+                        datetime.fromisoformat(b["start"].replace("Z", "+00:00")),
+                        datetime.fromisoformat(b["end"].replace("Z", "+00:00")),
+                    )
+                    for b in data.get("busy", [])
+                ]
+
+        logger.info(f"Retrieved free/busy for {len(busy_by_calendar)} of {len(calendar_ids)} calendars")
+        return busy_by_calendar
+
+    def _free_intervals(
+        self,
+        calendar_ids: List[str],
+        duration_minutes: int,
+        time_min: Optional[datetime],
+        time_max: Optional[datetime],
+        working_hours: tuple,
+        time_zone: Optional[str],
+        include_weekends: bool,
+        optional_ids: Iterable[str] = (),
+    ) -> List[tuple]:
+        """
+        Free intervals shared by all calendars within working hours.
+
+        Calendars in optional_ids whose free/busy is unavailable are left
+        out with a warning; any other unavailable calendar raises ValueError.
+        """
+        time_min = to_utc(time_min or datetime.utcnow())
+        time_max = to_utc(time_max or time_min + timedelta(days=7))
+
+        busy_by_calendar = self.query_free_busy(calendar_ids, time_min, time_max)
+        unavailable = [cal_id for cal_id in calendar_ids if cal_id not in busy_by_calendar]
+        required = [cal_id for cal_id in unavailable if cal_id not in set(optional_ids)]
+        if required or not busy_by_calendar:
+            raise ValueError(f"Free/busy unavailable for {', '.join(required or unavailable)}")
+        if unavailable:
+            logger.warning(f"Leaving out calendars without free/busy: {', '.join(unavailable)}")
+
+        busy = merge_intervals([
+            interval
+            for intervals in busy_by_calendar.values()
+            for interval in intervals
+        ])
+        windows = working_windows(
+            time_min,
+            time_max,
+            working_hours=working_hours,
+            time_zone=time_zone or settings.timezone,
+            include_weekends=include_weekends,
+        )
+        return free_intervals(busy, windows, min_minutes=duration_minutes)
+
     def find_free_time(
         self,
         duration_minutes: int,
@@ -373,6 +580,8 @@ class CalendarClient:
         time_max: Optional[datetime] = None,
         calendar_id: Optional[str] = None,
         working_hours: tuple = (9, 17),
+        time_zone: Optional[str] = None,
+        include_weekends: bool = False,
     ) -> List[Dict[str, datetime]]:
         """
         Find free time slots.
@@ -382,74 +591,100 @@ class CalendarClient:
             time_min: Start of search range
             time_max: End of search range
             calendar_id: Calendar ID
-            working_hours: Tuple of (start_hour, end_hour)
+            working_hours: Tuple of (start_hour, end_hour) in local time
+            time_zone: Time zone for working hours (defaults to settings.timezone)
+            include_weekends: Consider Saturday and Sunday
 
         Returns:
-            List of {start, end} dicts for free slots
+            List of {start, end} dicts (UTC) for free periods
         """
         if not self.service:
             return []
 
         try:
-            if time_min is None:
-                time_min = datetime.utcnow()
-            if time_max is None:
-                time_max = time_min + timedelta(days=7)
-
-            events = self.get_events(
-                calendar_id=calendar_id,
-                time_min=time_min,
-                time_max=time_max,
+            cal_id = calendar_id or settings.google_calendar_id or "primary"
+            free = self._free_intervals(
+                [cal_id],
+                duration_minutes,
+                time_min,
+                time_max,
+                working_hours,
+                time_zone,
+                include_weekends,
             )
-
-            # Build busy periods
-            busy = []
-            for event in events:
-                start = event.get("start", {})
-                end = event.get("end", {})
-
-                start_dt = start.get("dateTime") or start.get("date")
-                end_dt = end.get("dateTime") or end.get("date")
-
-                if start_dt and end_dt:
-                    busy.append({
-                        "start": datetime.fromisoformat(start_dt.replace("Z", "+00:00")),
-                        "end": datetime.fromisoformat(end_dt.replace("Z", "+00:00")),
-                    })
-
-            # Sort by start time
-            busy.sort(key=lambda x: x["start"])
-
-            # Find gaps
-            free_slots = []
-            current = time_min
-
-            for period in busy:
-                # Check if there's a gap before this event
-                if period["start"] > current:
-                    gap_duration = (period["start"] - current).total_seconds() / 60
-                    if gap_duration >= duration_minutes:
-                        free_slots.append({
-                            "start": current,
-                            "end": period["start"],
-                        })
-                current = max(current, period["end"])
-
-            # Check remaining time
-            if time_max > current:
-                gap_duration = (time_max - current).total_seconds() / 60
-                if gap_duration >= duration_minutes:
-                    free_slots.append({
-                        "start": current,
-                        "end": time_max,
-                    })
-
-            return free_slots
+            return [{"start": start, "end": end} for start, end in free]
 
         except Exception as e:
             logger.error(f"Failed to find free time: {e}")
             return []
 
+    def find_meeting_slots(
+        self,
+        attendees: List[str],
+        duration_minutes: int,
+        count: int = 5,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        working_hours: tuple = (9, 17),
+        time_zone: Optional[str] = None,
+        include_weekends: bool = False,
+        step_minutes: int = 30,
+        include_self: bool = True,
+    ) -> List[Dict[str, datetime]]:
+        """
+        Find N meeting slots when all attendees are free.
+
+        Attendees whose free/busy is unavailable (e.g. external or unshared
+        calendars) are left out with a warning. If the user's own calendar
+        is unavailable, or no calendar is, no slots are returned.
+
+        Args:
+            attendees: Attendee emails or calendar IDs
+            duration_minutes: Meeting length in minutes
+            count: Number of slots to return
+            time_min: Start of search range (defaults to now)
+            time_max: End of search range (defaults to 7 days later)
+            working_hours: Tuple of (start_hour, end_hour) in local time
+            time_zone: Time zone for working hours (defaults to settings.timezone)
+            include_weekends: Consider Saturday and Sunday
+            step_minutes: Spacing between candidate start times
+            include_self: Also require the user's own calendar to be free
+
+        Returns:
+            List of {start, end} dicts (UTC), earliest first
+        """
+        if not self.service:
+            return []
+
+        calendar_ids = list(dict.fromkeys(attendees))
+        optional_ids = set(calendar_ids)
+        if include_self:
+            own_id = settings.google_calendar_id or "primary"
+            optional_ids.discard(own_id)
+            if own_id not in calendar_ids:
+                calendar_ids.insert(0, own_id)
+
+        try:
+            # Attendees whose calendars are not shared are left out; the
+            # user's own calendar must be known
+            free = self._free_intervals(
+                calendar_ids,
+                duration_minutes,
+                time_min,
+                time_max,
+                working_hours,
+                time_zone,
+                include_weekends,
+                optional_ids=optional_ids,
+            )
+            slots = split_into_slots(free, duration_minutes, count=count, step_minutes=step_minutes)
+            logger.info(f"Found {len(slots)} slots for {len(calendar_ids)} calendars")
+            return slots
+
+        except Exception as e:
+            logger.error(f"Failed to find meeting slots: {e}")
+            return []
+
 
 # Global Calendar client instance
 calendar_client = CalendarClient()
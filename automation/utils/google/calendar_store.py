@@ -0,0 +1,188 @@
+"""
+Calendar Event Store - Local SQLite copy of calendar events kept current via syncTokens
+"""
+
+import json
+from typing import Optional, List, Dict, Any
+from datetime import datetime, timezone
+
+from utils.local_store import SQLiteStore
+
+
+def event_timestamp(when: Dict[str, Any]) -> Optional[float]:
+    """
+    Convert an event start/end dict to a UTC epoch timestamp.
+
+    All-day events ("date") are treated as starting at UTC midnight.
+
+    Args:
+        when: Event "start" or "end" dict
+
+    Returns:
+        Epoch seconds or None
+    """
+    value = when.get("dateTime") or when.get("date")
+    if not value:
+        return None
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def to_timestamp(dt: datetime) -> float:
+    """Convert a datetime (naive values are UTC) to an epoch timestamp"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+class CalendarEventStore(SQLiteStore):
+    """
+    Local event store indexed by start/end time.
+
+    Holds expanded (singleEvents) instances per calendar together with the
+    syncToken and the earliest time covered by the last full sync.
+    """
+
+    DB_NAME = "calendar_events.db"
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS events (
+            calendar_id TEXT NOT NULL,
+            event_id TEXT NOT NULL,
+            start_ts REAL,
+            end_ts REAL,
+            payload TEXT NOT NULL,
+            PRIMARY KEY (calendar_id, event_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_events_start ON events (calendar_id, start_ts);
+        CREATE INDEX IF NOT EXISTS idx_events_end ON events (calendar_id, end_ts);
+        CREATE TABLE IF NOT EXISTS sync_state (
+            calendar_id TEXT PRIMARY KEY,
+            sync_token TEXT,
+            window_start_ts REAL,
+            synced_at TEXT
+        );
+    """
+
+    def apply_changes(
+        self,
+        calendar_id: str,
+        events: List[Dict[str, Any]],
+        sync_token: Optional[str],
+        window_start: Optional[datetime] = None,
+        full_sync: bool = False,
+    ) -> None:
+        """
+        Apply a page set of events.list results.
+
+        Cancelled events are removed; everything else is upserted.
+
+        Args:
+            calendar_id: Calendar ID
+            events: Event resources from events.list
+            sync_token: nextSyncToken from the final page
+            window_start: Start of the synced window (full sync only)
+            full_sync: Replace all stored events for the calendar
+        """
+        with self.transaction() as conn:
+            if full_sync:
+                conn.execute("DELETE FROM events WHERE calendar_id = ?", (calendar_id,))
+
+            for event in events:
+                if event.get("status") == "cancelled":
+                    conn.execute(
+                        "DELETE FROM events WHERE calendar_id = ? AND event_id = ?",
+                        (calendar_id, event["id"]),
+                    )
+                    continue
+
+                conn.execute(
+                    "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?)",
+                    (
+                        calendar_id,
+                        event["id"],
+                        event_timestamp(event.get("start", {})),
+                        event_timestamp(event.get("end", {})),
+                        json.dumps(event),
+                    ),
+                )
+
+            if full_sync:
+                conn.execute(
+                    "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?)",
+                    (
+                        calendar_id,
+                        sync_token,
+                        to_timestamp(window_start) if window_start else None,
+                        datetime.utcnow().isoformat(),
+                    ),
+                )
+            else:
+                conn.execute(
+                    "UPDATE sync_state SET sync_token = ?, synced_at = ? WHERE calendar_id = ?",
+                    (sync_token, datetime.utcnow().isoformat(), calendar_id),
+                )
+
+    def get_sync_state(self, calendar_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the sync token and covered window for a calendar.
+
+        Args:
+            calendar_id: Calendar ID
+
+        Returns:
+            Dict with sync_token, window_start_ts, synced_at or None if never synced
+        """
+        rows = self.query(
+            "SELECT sync_token, window_start_ts, synced_at FROM sync_state WHERE calendar_id = ?",
+            (calendar_id,),
+        )
+        return dict(rows[0]) if rows else None
+
+    def covers(self, calendar_id: str, time_min: datetime) -> bool:
+        """Check whether a synced window for the calendar includes time_min"""
+        state = self.get_sync_state(calendar_id)
+        if not state:
+            return False
+        window_start = state["window_start_ts"]
+        return window_start is None or to_timestamp(time_min) >= window_start
+
+    def get_events(
+        self,
+        calendar_id: str,
+        time_min: datetime,
+        time_max: Optional[datetime] = None,
+        max_results: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get stored events overlapping a time window, ordered by start time.
+
+        Args:
+            calendar_id: Calendar ID
+            time_min: Window start
+            time_max: Window end (None for open-ended)
+            max_results: Maximum number of events
+
+        Returns:
+            List of event dicts
+        """
+        sql = "SELECT payload FROM events WHERE calendar_id = ? AND end_ts > ?"
+        params: List[Any] = [calendar_id, to_timestamp(time_min)]
+
+        if time_max is not None:
+            sql += " AND start_ts < ?"
+            params.append(to_timestamp(time_max))
+
+        sql += " ORDER BY start_ts"
+        if max_results:
+            sql += " LIMIT ?"
+            params.append(max_results)
+
+        return [json.loads(row["payload"]) for row in self.query(sql, params)]
+
+    def clear(self, calendar_id: str) -> None:
+        """Drop stored events and sync state for a calendar"""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM events WHERE calendar_id = ?", (calendar_id,))
+            conn.execute("DELETE FROM sync_state WHERE calendar_id = ?", (calendar_id,))
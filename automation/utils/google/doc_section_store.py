@@ -0,0 +1,127 @@
+"""
+Doc Section Store - Section-to-range map of rendered documents for in-place updates
+"""
+
+from typing import Optional, List, Dict, Any
+from datetime import datetime
+
+from utils.local_store import SQLiteStore
+
+
+class DocSectionStore(SQLiteStore):
+    """
+    Local record of how a document was last rendered.
+
+    For each document it keeps the ordered sections (key, content hash and
+    index range) plus the body end index expected after the last write, so
+    the next render can diff sections and detect manual edits.
+    """
+
+    DB_NAME = "doc_sections.db"
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS documents (
+            document_id TEXT PRIMARY KEY,
+            report_key TEXT,
+            body_end_index INTEGER NOT NULL,
+            rendered_at TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_documents_key ON documents (report_key);
+        CREATE TABLE IF NOT EXISTS sections (
+            document_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            section_key TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            start_index INTEGER NOT NULL,
+            end_index INTEGER NOT NULL,
+            PRIMARY KEY (document_id, position)
+        );
+    """
+
+    def save(
+        self,
+        document_id: str,
+        sections: List[Dict[str, Any]],
+        body_end_index: int,
+        report_key: Optional[str] = None,
+    ) -> None:
+        """
+        Replace the stored render state of a document.
+
+        Args:
+            document_id: The document ID
+            sections: Dicts with key, hash, start and end in document order
+            body_end_index: Body end index expected after the write
+            report_key: Optional key (e.g. report title) to find the document by
+        """
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM sections WHERE document_id = ?", (document_id,))
+            conn.executemany(
+                "INSERT INTO sections VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (document_id, i, s["key"], s["hash"], s["start"], s["end"])
+                    for i, s in enumerate(sections)
+                ],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?)",
+                (document_id, report_key, body_end_index, datetime.utcnow().isoformat()),
+            )
+
+    def get_state(self, document_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored render state of a document.
+
+        Args:
+            document_id: The document ID
+
+        Returns:
+            Dict with body_end_index and sections, or None if never rendered
+        """
+        rows = self.query(
+            "SELECT body_end_index FROM documents WHERE document_id = ?", (document_id,)
+        )
+        if not rows:
+            return None
+
+        sections = [
+            {
+                "key": row["section_key"],
+                "hash": row["content_hash"],
+                "start": row["start_index"],
+                "end": row["end_index"],
+            }
+            for row in self.query(
+                "SELECT section_key, content_hash, start_index, end_index "
+                "FROM sections WHERE document_id = ? ORDER BY position",
+                (document_id,),
+            )
+        ]
+        return {"body_end_index": rows[0]["body_end_index"], "sections": sections}
+
+    def find_document(self, report_key: str) -> Optional[str]:
+        """Get the most recently rendered document for a report key"""
+        rows = self.query(
+            "SELECT document_id FROM documents WHERE report_key = ? "
+            "ORDER BY rendered_at DESC LIMIT 1",
+            (report_key,),
+        )
+        return rows[0]["document_id"] if rows else None
+
+    def clear(self, document_id: str) -> None:
+        """Forget the render state of a document"""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM sections WHERE document_id = ?", (document_id,))
+            conn.execute("DELETE FROM documents WHERE document_id = ?", (document_id,))
+
+    def invalidate(self, document_id: str) -> None:
+        """
+        Forget a document's section ranges but keep it findable by report key.
+
+        The stored body end index can never match again, so the next render
+        rewrites the whole body in place.
+        """
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM sections WHERE document_id = ?", (document_id,))
+            conn.execute(
+                "UPDATE documents SET body_end_index = -1 WHERE document_id = ?", (document_id,)
+            )
@@ -2,7 +2,10 @@
 Google Docs Client - Document creation and editing
 """
 
-from typing import Optional, List, Dict, Any
+import re
+import hashlib
+from difflib import SequenceMatcher
+from typing import Optional, List, Dict, Any, Tuple
 from loguru import logger
 
 from googleapiclient.discovery import build
@@ -10,6 +13,7 @@ from googleapiclient.errors import HttpError
 
 from utils.google.base_client import google_base_client
 from utils.google.drive_client import drive_client
+from utils.google.doc_section_store import DocSectionStore
 from config import settings
 
 
@@ -18,6 +22,7 @@ class DocsClient:
 
     def __init__(self):
         self._service = None
+        self.sections = DocSectionStore()
 
     @property
     def service(self):
@@ -28,6 +33,167 @@ class DocsClient:
             )
         return self._service
 
+    def batch_update(
+        self,
+        document_id: str,
+        requests: List[Dict[str, Any]],
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Apply a list of requests in a single documents.batchUpdate.
+
+        Args:
+            document_id: The document ID
+            requests: Docs API request dicts
+
+        Returns:
+            List of replies or None on failure
+        """
+        if settings.dry_run:
+            logger.info(f"[DRY RUN] Would apply {len(requests)} requests to {document_id}")
+            return []
+
+        if not self.service:
+            return None
+
+        try:
+            response = self.service.documents().batchUpdate(
+                documentId=document_id,
+                body={"requests": requests},
+            ).execute()
+            return response.get("replies", [])
+
+        except HttpError as e:
+            logger.error(f"Failed to update document {document_id}: {e}")
+            return None
+
+    def document_builder(self, document_id: str, **kwargs) -> "DocumentBuilder":
+        """
+        Get a builder that writes formatted content in one batchUpdate.
+
+        Args:
+            document_id: The document ID
+            **kwargs: DocumentBuilder options (start_index, max_requests)
+
+        Returns:
+            DocumentBuilder bound to this client
+        """
+        return DocumentBuilder(document_id, client=self, **kwargs)
+
+    def write_sections(
+        self,
+        document_id: str,
+        sections: List[Tuple[str, str]],
+        report_key: Optional[str] = None,
+        new_document: bool = False,
+    ) -> bool:
+        """
+        Render keyed markdown sections, rewriting only what changed.
+
+        The stored section-to-range map from the last render is diffed
+        against the new sections by key and content hash. Changed, added
+        and removed sections become targeted deleteContentRange and
+        formatted inserts, applied from the end of the document backwards
+        so earlier ranges stay valid. If the document was edited since the
+        last render (its length no longer matches), the body is rewritten.
+
+        Args:
+            document_id: The document ID
+            sections: (section_key, markdown) pairs in document order
+            report_key: Optional key (e.g. report title) to find the document by later
+            new_document: The document is freshly created and empty
+
+        Returns:
+            True if successful
+        """
+        if settings.dry_run:
+            logger.info(f"[DRY RUN] Would write {len(sections)} sections to {document_id}")
+            return True
+
+        new = [
+            {"key": key, "hash": hashlib.sha1(markdown.encode("utf-8")).hexdigest(), "markdown": markdown}
+            for key, markdown in sections
+        ]
+
+        if new_document:
+            body_end = 2
+            old: List[Dict[str, Any]] = []
+        else:
+            doc = self.get_document(document_id)
+            if not doc:
+                return False
+            content = doc.get("body", {}).get("content", [])
+            body_end = content[-1].get("endIndex", 2) if content else 2
+
+            state = self.sections.get_state(document_id)
+            if state and state["body_end_index"] == body_end:
+                old = state["sections"]
+            else:
+                if state:
+                    logger.warning(f"Document {document_id} changed since last render, rewriting body")
+                old = [{"key": None, "hash": None, "start": 1, "end": body_end - 1}] if body_end > 2 else []
+
+        old_ids = [(s["key"], s["hash"]) for s in old]
+        new_ids = [(s["key"], s["hash"]) for s in new]
+        opcodes = SequenceMatcher(None, old_ids, new_ids, autojunk=False).get_opcodes()
+
+        requests: List[Dict[str, Any]] = []
+        lengths: Dict[int, int] = {}
+        changed = 0
+
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag == "equal":
+                for offset in range(j2 - j1):
+                    section = old[i1 + offset]
+                    lengths[j1 + offset] = section["end"] - section["start"]
+                continue
+
+            if i1 < len(old):
+                start = old[i1]["start"]
+            else:
+                start = old[-1]["end"] if old else 1
+            end = old[i2 - 1]["end"] if i2 > i1 else start
+
+            if end > start:
+                requests.append({"deleteContentRange": {"range": {"startIndex": start, "endIndex": end}}})
+
+            builder = DocumentBuilder(document_id, client=self, start_index=start)
+            for j in range(j1, j2):
+                range_start, range_end = builder.add_markdown(new[j]["markdown"])
+                lengths[j] = range_end - range_start
+            requests.extend(builder.build_requests())
+            changed += max(i2 - i1, j2 - j1)
+
+        if not requests:
+            logger.info(f"Document {document_id} is up to date")
+            return True
+
+        for start in range(0, len(requests), DocumentBuilder.MAX_REQUESTS):
+            if self.batch_update(document_id, requests[start:start + DocumentBuilder.MAX_REQUESTS]) is None:
+                # Ranges are unknown after a partial write; force a rewrite next time
+                self.sections.invalidate(document_id)
+                return False
+
+        # Recompute ranges from section lengths in the new order
+        cursor = 1
+        for j, section in enumerate(new):
+            section["start"] = cursor
+            cursor += lengths[j]
+            section["end"] = cursor
+
+        old_length = (old[-1]["end"] - 1) if old else 0
+        self.sections.save(
+            document_id,
+            new,
+            body_end_index=body_end + (cursor - 1) - old_length,
+            report_key=report_key,
+        )
+
+        logger.info(
+            f"Updated document {document_id}: {changed} section(s) rewritten, "
+            f"{len(requests)} requests"
+        )
+        return True
+
     def get_document(self, document_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a document by ID.
@@ -50,6 +216,30 @@ class DocsClient:
             logger.error(f"Failed to get document {document_id}: {e}")
             return None
 
+    def document_exists(self, document_id: str) -> Optional[bool]:
+        """
+        Check whether a document still exists and is accessible.
+
+        Args:
+            document_id: The document ID
+
+        Returns:
+            True if accessible, False if deleted or no longer shared (404/403),
+            None if it could not be determined (e.g. a transient error)
+        """
+        if not self.service:
+            return None
+
+        try:
+            self.service.documents().get(documentId=document_id, fields="documentId").execute()
+            return True
+        except HttpError as e:
+            rate_limited = b"ratelimitexceeded" in (e.content or b"").lower()
+            if e.resp.status == 404 or (e.resp.status == 403 and not rate_limited):
+                return False
+            logger.error(f"Failed to check document {document_id}: {e}")
+            return None
+
     def get_document_content(self, document_id: str) -> str:
         """
         Extract plain text content from a document.
@@ -387,6 +577,272 @@ class DocsClient:
 docs_client = DocsClient()
 
 
+BOLD_MARKUP = re.compile(r"\*\*(.+?)\*\*")
+NUMBERED_ITEM = re.compile(r"^\d+\.\s+")
+
+
+def utf16_len(text: str) -> int:
+    """Length of text in UTF-16 code units, the unit of Docs API indexes"""
+    return len(text.encode("utf-16-le")) // 2
+
+
+class DocumentBuilder:
+    """
+    Builder that renders formatted paragraphs into one batchUpdate.
+
+    Paragraph text is concatenated into a single insertText, and heading,
+    bullet and bold/italic styles are applied by range. All index
+    arithmetic is done locally (in UTF-16 code units, as the API counts),
+    so no get_document round trips are needed between writes.
+
+    add_markdown() understands the subset the report generator emits:
+    "#" headings, "- " and "- [ ] " bullets, "1. " numbered items,
+    "> " quotes, "**bold**" spans and "---" separators (dropped).
+
+    Usage:
+        builder = docs_client.document_builder(doc_id)
+        builder.add_markdown(content, key="report")
+        builder.build()
+    """
+
+    MAX_REQUESTS = 1000
+
+    def __init__(
+        self,
+        document_id: str,
+        client: Optional[DocsClient] = None,
+        start_index: int = 1,
+        max_requests: int = MAX_REQUESTS,
+    ):
+        """
+        Initialize the builder.
+
+        Args:
+            document_id: The document ID
+            client: DocsClient to submit through (defaults to global client)
+            start_index: Document index to insert at (1 is the start of the body)
+            max_requests: Maximum requests per batchUpdate
+        """
+        self.document_id = document_id
+        self.client = client or docs_client
+        self.start_index = start_index
+        self.max_requests = max_requests
+        self.requests_made = 0
+
+        # Section key -> (start, end) document index range
+        self.section_ranges: Dict[str, Tuple[int, int]] = {}
+
+        self._paragraphs: List[Dict[str, Any]] = []
+        self._length = 0
+
+    @property
+    def end_index(self) -> int:
+        """Document index just past the content added so far"""
+        return self.start_index + self._length
+
+    def add_paragraph(
+        self,
+        text: str,
+        style: str = "NORMAL_TEXT",
+        bullet: Optional[str] = None,
+        italic: bool = False,
+    ) -> None:
+        """
+        Add a paragraph, turning "**bold**" spans into bold ranges.
+
+        Args:
+            text: Paragraph text (a single line)
+            style: Named paragraph style (e.g. HEADING_1)
+            bullet: Bullet preset for list items
+            italic: Italicize the whole paragraph
+        """
+        plain_parts = []
+        bold_spans = []
+        cursor = 0
+        offset = 0
+
+        for match in BOLD_MARKUP.finditer(text):
+            before = text[cursor:match.start()]
+            plain_parts.append(before)
+            offset += utf16_len(before)
+            bold_text = match.group(1)
+            bold_spans.append((offset, offset + utf16_len(bold_text)))
+            plain_parts.append(bold_text)
+            offset += utf16_len(bold_text)
+            cursor = match.end()
+        plain_parts.append(text[cursor:])
+
+        plain = "".join(plain_parts)
+        self._paragraphs.append({
+            "start": self._length,
+            "text": plain,
+            "style": style,
+            "bullet": bullet,
+            "italic": italic,
+            "bold": bold_spans,
+        })
+        self._length += utf16_len(plain) + 1
+
+    def add_markdown(self, text: str, key: Optional[str] = None) -> Tuple[int, int]:
+        """
+        Add markdown-style text, one paragraph per line.
+
+        Args:
+            text: Markdown-style content
+            key: Record the resulting range in section_ranges under this key
+
+        Returns:
+            (start, end) document index range of the added content
+        """
+        start = self.end_index
+
+        for line in text.split("\n"):
+            stripped = line.strip()
+
+            if stripped == "---":
+                continue
+
+            heading = re.match(r"^(#{1,6})\s+(.*)$", stripped)
+            if heading:
+                self.add_paragraph(
+                    heading.group(2), style=f"HEADING_{len(heading.group(1))}"
+                )
+            elif stripped.startswith("- [ ] "):
+                self.add_paragraph(stripped[6:], bullet="BULLET_CHECKBOX")
+            elif stripped.startswith("- "):
+                self.add_paragraph(stripped[2:], bullet="BULLET_DISC_CIRCLE_SQUARE")
+            elif NUMBERED_ITEM.match(stripped):
+                self.add_paragraph(
+                    NUMBERED_ITEM.sub("", stripped), bullet="NUMBERED_DECIMAL_ALPHA_ROMAN"
+                )
+            elif stripped.startswith("> "):
+                self.add_paragraph(stripped[2:], italic=True)
+            else:
+                self.add_paragraph(stripped)
+
+        end = self.end_index
+        if key:
+            self.section_ranges[key] = (start, end)
+        return start, end
+
+    def _range(self, start: int, end: int) -> Dict[str, int]:
+        return {"startIndex": self.start_index + start, "endIndex": self.start_index + end}
+
+    def build_requests(self) -> List[Dict[str, Any]]:
+        """
+        Compute the batchUpdate requests for everything added.
+
+        Returns:
+            Request dicts: one insertText followed by style ranges
+        """
+        if not self._paragraphs:
+            return []
+
+        text = "".join(p["text"] + "\n" for p in self._paragraphs)
+        whole = self._range(0, self._length)
+
+        # Reset inherited formatting so inserts next to headings or lists stay clean
+        requests: List[Dict[str, Any]] = [
+            {"insertText": {"location": {"index": self.start_index}, "text": text}},
+            {
+                "updateParagraphStyle": {
+                    "range": whole,
+                    "paragraphStyle": {"namedStyleType": "NORMAL_TEXT"},
+                    "fields": "namedStyleType",
+                }
+            },
+            {"deleteParagraphBullets": {"range": whole}},
+            {
+                "updateTextStyle": {
+                    "range": whole,
+                    "textStyle": {},
+                    "fields": "bold,italic",
+                }
+            },
+        ]
+
+        bullet_run: Optional[Tuple[str, int, int]] = None
+        bullet_requests = []
+
+        for paragraph in self._paragraphs:
+            start = paragraph["start"]
+            end = start + utf16_len(paragraph["text"]) + 1
+
+            if paragraph["style"] != "NORMAL_TEXT":
+                requests.append({
+                    "updateParagraphStyle": {
+                        "range": self._range(start, end),
+                        "paragraphStyle": {"namedStyleType": paragraph["style"]},
+                        "fields": "namedStyleType",
+                    }
+                })
+
+            if paragraph["italic"] and paragraph["text"]:
+                requests.append({
+                    "updateTextStyle": {
+                        "range": self._range(start, end - 1),
+                        "textStyle": {"italic": True},
+                        "fields": "italic",
+                    }
+                })
+
+            for bold_start, bold_end in paragraph["bold"]:
+                if bold_end > bold_start:
+                    requests.append({
+                        "updateTextStyle": {
+                            "range": self._range(start + bold_start, start + bold_end),
+                            "textStyle": {"bold": True},
+                            "fields": "bold",
+                        }
+                    })
+
+            # Consecutive paragraphs with the same preset form one list
+            preset = paragraph["bullet"]
+            if bullet_run and (preset != bullet_run[0] or start != bullet_run[2]):
+                bullet_requests.append(bullet_run)
+                bullet_run = None
+            if preset:
+                bullet_run = (preset, bullet_run[1] if bullet_run else start, end)
+
+        if bullet_run:
+            bullet_requests.append(bullet_run)
+
+        for preset, start, end in bullet_requests:
+            requests.append({
+                "createParagraphBullets": {
+                    "range": self._range(start, end),
+                    "bulletPreset": preset,
+                }
+            })
+
+        return requests
+
+    def build(self) -> bool:
+        """
+        Submit the content.
+
+        Returns:
+            True if every chunk was applied
+        """
+        requests = self.build_requests()
+        if not requests:
+            return True
+
+        for start in range(0, len(requests), self.max_requests):
+            replies = self.client.batch_update(
+                self.document_id, requests[start:start + self.max_requests]
+            )
+            self.requests_made += 1
+            if replies is None:
+                return False
+
+        logger.info(
+            f"Wrote {len(self._paragraphs)} paragraphs with {len(requests)} requests "
+            f"in {self.requests_made} batchUpdate call(s)"
+        )
+        return True
+
+
 if __name__ == "__main__":
     print("Testing Google Docs Client...")
     print("=" * 50)
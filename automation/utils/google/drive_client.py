@@ -2,12 +2,16 @@
 Google Drive Client - File storage and management
 """
 
-from typing import Optional, List, Dict, Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterator
 from datetime import datetime
 from loguru import logger
 
+import google_auth_httplib2
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
+from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload, build_http
 from googleapiclient.errors import HttpError
 
 from utils.google.base_client import google_base_client
@@ -17,8 +21,28 @@ from config import settings
 class DriveClient:
     """Client for Google Drive operations"""
 
+    # Drive batch endpoints accept up to 100 calls per request
+    BATCH_SIZE = 100
+
+    # Longer q strings are rejected by Drive, so search plans split them
+    MAX_QUERY_LENGTH = 2000
+
+    LIST_FIELDS = "nextPageToken, files(id, name, mimeType, modifiedTime, createdTime, owners, webViewLink, parents)"
+
+    TYPE_MIME = {
+        "docs": "application/vnd.google-apps.document",
+        "sheets": "application/vnd.google-apps.spreadsheet",
+        "slides": "application/vnd.google-apps.presentation",
+        "pdf": "application/pdf",
+        "folder": "application/vnd.google-apps.folder",
+    }
+
     def __init__(self):
         self._service = None
+        self._local = threading.local()
+        self._prefetch: Optional[ThreadPoolExecutor] = None
+        self._prefetch_lock = threading.Lock()
+        self.last_query_cost: Dict[str, Any] = {}
 
     @property
     def service(self):
@@ -29,6 +53,26 @@ class DriveClient:
             )
         return self._service
 
+    def _thread_http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Authorized HTTP connection for the current thread (httplib2 is not thread-safe)"""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(google_base_client.credentials, http=build_http())
+            self._local.http = http
+        return http
+
+    def _prefetch_pool(self) -> ThreadPoolExecutor:
+        """
+        Long-lived single worker that fetches listing pages ahead of the caller.
+
+        Sharing one worker keeps its thread's HTTP connection in use across
+        listings, including every subfolder of a recursive iter_folder.
+        """
+        with self._prefetch_lock:
+            if self._prefetch is None:
+                self._prefetch = ThreadPoolExecutor(max_workers=1, thread_name_prefix="drive-prefetch")
+            return self._prefetch
+
     def list_files(
         self,
         folder_id: Optional[str] = None,
@@ -50,46 +94,98 @@ class DriveClient:
         Returns:
             List of file metadata dicts
         """
+        try:
+            results = list(self.iter_files(
+                folder_id=folder_id,
+                query=query,
+                mime_type=mime_type,
+                max_results=max_results,
+                order_by=order_by,
+            ))
+        except HttpError as e:
+            logger.error(f"Drive API error: {e}")
+            return []
+
+        logger.info(f"Listed {len(results)} files from Drive")
+        return results
+
+    def iter_files(
+        self,
+        folder_id: Optional[str] = None,
+        query: Optional[str] = None,
+        mime_type: Optional[str] = None,
+        max_results: Optional[int] = None,
+        order_by: str = "modifiedTime desc",
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily list files in Drive or a specific folder.
+
+        Files are yielded page by page, and the next page is requested in
+        the background while the caller works through the current one.
+        An API error part way through is raised rather than ending the
+        listing early, so a partial listing is never taken as complete.
+
+        Args:
+            folder_id: ID of folder to list (None for root)
+            query: Additional query string
+            mime_type: Filter by MIME type
+            max_results: Maximum number of results (None for all)
+            order_by: Sort order
+
+        Yields:
+            File metadata dicts
+        """
         if not self.service:
             logger.warning("Drive service not initialized")
-            return []
+            return
 
-        try:
-            # Build query
-            q_parts = []
-            if folder_id:
-                q_parts.append(f"'{folder_id}' in parents")
-            if mime_type:
-                q_parts.append(f"mimeType='{mime_type}'")
-            if query:
-                q_parts.append(query)
-
-            q = " and ".join(q_parts) if q_parts else None
-
-            results = []
-            page_token = None
-
-            while True:
-                response = self.service.files().list(
-                    q=q,
-                    pageSize=min(max_results - len(results), 100),
-                    fields="nextPageToken, files(id, name, mimeType, modifiedTime, createdTime, owners, webViewLink, parents)",
-                    orderBy=order_by,
-                    pageToken=page_token,
-                ).execute()
+        q_parts = []
+        if folder_id:
+            q_parts.append(f"'{folder_id}' in parents")
+        if mime_type:
+            q_parts.append(f"mimeType='{mime_type}'")
+        if query:
+            q_parts.append(query)
 
-                results.extend(response.get("files", []))
+        q = " and ".join(q_parts) if q_parts else None
 
-                page_token = response.get("nextPageToken")
-                if not page_token or len(results) >= max_results:
-                    break
+        for page in self._list_pages(q, max_results, order_by):
+            yield from page
 
-            logger.info(f"Listed {len(results)} files from Drive")
-            return results[:max_results]
+    def _list_pages(
+        self,
+        q: Optional[str],
+        max_results: Optional[int],
+        order_by: str = "modifiedTime desc",
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield pages of a files.list query until max_results or the last page.
 
-        except HttpError as e:
-            logger.error(f"Drive API error: {e}")
-            return []
+        Each next page is fetched on the prefetch worker (with its own HTTP
+        connection) as soon as the current page's token is known.
+        """
+        def fetch(page_token: Optional[str], fetched: int) -> Dict[str, Any]:
+            page_size = 100 if max_results is None else min(max_results - fetched, 100)
+            return self.service.files().list(
+                q=q,
+                pageSize=page_size,
+                fields=self.LIST_FIELDS,
+                orderBy=order_by,
+                pageToken=page_token,
+            ).execute(http=self._thread_http())
+
+        pool = self._prefetch_pool()
+        fetched = 0
+        future = pool.submit(fetch, None, 0)
+        while future is not None:
+            response = future.result()
+            files = response.get("files", [])
+            fetched += len(files)
+
+            page_token = response.get("nextPageToken")
+            more = page_token and (max_results is None or fetched < max_results)
+            future = pool.submit(fetch, page_token, fetched) if more else None
+            yield files
 
     def search_files(
         self,
@@ -114,47 +210,252 @@ class DriveClient:
         Returns:
             List of matching files
         """
-        if not self.service:
+        try:
+            return list(self.iter_search(
+                keywords=keywords,
+                folder_id=folder_id,
+                file_types=file_types,
+                date_from=date_from,
+                date_to=date_to,
+                max_results=max_results,
+            ))
+        except HttpError as e:
+            logger.error(f"Drive search error: {e}")
             return []
 
+    def iter_search(
+        self,
+        keywords: str,
+        folder_id: Optional[str] = None,
+        file_types: Optional[List[str]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        max_results: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily search for files by keywords and filters (see search_files).
+
+        Args:
+            keywords: Search keywords
+            folder_id: Limit search to folder
+            file_types: List of file types ("docs", "sheets", "slides", "pdf")
+            date_from: Modified after this date
+            date_to: Modified before this date
+            max_results: Maximum results (None for all)
+
+        Yields:
+            Matching files, a page at a time with the next page prefetched
+        """
+        q_parts = [f"fullText contains '{keywords}'"]
+        q_parts.extend(self._search_filters(folder_id, file_types, date_from, date_to))
+
+        yield from self.iter_files(query=" and ".join(q_parts), max_results=max_results)
+
+    def search_any(
+        self,
+        keywords: List[str],
+        folder_id: Optional[str] = None,
+        file_types: Optional[List[str]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        max_results: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for files matching any of several keywords.
+
+        The keywords are OR'd into a single fullText query, paginated up to
+        max_results. If that query would be too long, the keywords are split
+        into sub-queries that are paged together in batch requests. The
+        plan and its cost are stored in last_query_cost.
+
+        Args:
+            keywords: Keywords, any of which may match
+            folder_id: Limit search to folder
+            file_types: List of file types ("docs", "sheets", "slides", "pdf")
+            date_from: Modified after this date
+            date_to: Modified before this date
+            max_results: Maximum results
+
+        Returns:
+            Matching files, most recently modified first
+        """
         try:
-            # Build query parts
-            q_parts = [f"fullText contains '{keywords}'"]
-
-            if folder_id:
-                q_parts.append(f"'{folder_id}' in parents")
-
-            if file_types:
-                mime_types = []
-                type_map = {
-                    "docs": "application/vnd.google-apps.document",
-                    "sheets": "application/vnd.google-apps.spreadsheet",
-                    "slides": "application/vnd.google-apps.presentation",
-                    "pdf": "application/pdf",
-                    "folder": "application/vnd.google-apps.folder",
-                }
-                for ft in file_types:
-                    if ft in type_map:
-                        mime_types.append(f"mimeType='{type_map[ft]}'")
-                if mime_types:
-                    q_parts.append(f"({' or '.join(mime_types)})")
-
-            if date_from:
-                q_parts.append(f"modifiedTime >= '{date_from.isoformat()}Z'")
-            if date_to:
-                q_parts.append(f"modifiedTime <= '{date_to.isoformat()}Z'")
-
-            q_parts.append("trashed = false")
-
-            return self.list_files(
-                query=" and ".join(q_parts),
+            return list(self.iter_search_any(
+                keywords=keywords,
+                folder_id=folder_id,
+                file_types=file_types,
+                date_from=date_from,
+                date_to=date_to,
                 max_results=max_results,
-            )
-
-        except Exception as e:
-            logger.error(f"Search error: {e}")
+            ))
+        except HttpError as e:
+            logger.error(f"Drive search error: {e}")
             return []
 
+    def iter_search_any(
+        self,
+        keywords: List[str],
+        folder_id: Optional[str] = None,
+        file_types: Optional[List[str]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        max_results: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily search for files matching any of several keywords (see search_any).
+
+        A single combined query is streamed page by page with the next page
+        prefetched. Batched sub-queries must be merged before the newest
+        files are known, so they are yielded once all pages are in.
+        last_query_cost is set when the iterator is exhausted. API errors,
+        including a failed sub-query, are raised as in iter_files.
+
+        Args:
+            keywords: Keywords, any of which may match
+            folder_id: Limit search to folder
+            file_types: List of file types ("docs", "sheets", "slides", "pdf")
+            date_from: Modified after this date
+            date_to: Modified before this date
+            max_results: Maximum results
+
+        Yields:
+            Matching files, most recently modified first
+        """
+        self.last_query_cost = {}
+        if not self.service or not keywords:
+            return
+
+        started = time.monotonic()
+        queries = self._plan_queries(keywords, self._search_filters(folder_id, file_types, date_from, date_to))
+        yielded = 0
+
+        if len(queries) == 1:
+            api_calls = 0
+            for page in self._list_pages(queries[0], max_results):
+                api_calls += 1
+                yielded += len(page)
+                yield from page
+            round_trips = api_calls
+        else:
+            results, api_calls, round_trips = self._batch_list(queries, max_results)
+            results = results[:max_results]
+            yielded = len(results)
+            yield from results
+
+        self.last_query_cost = {
+            "strategy": "combined" if len(queries) == 1 else "batched",
+            "queries": len(queries),
+            "api_calls": api_calls,
+            "round_trips": round_trips,
+            "results": yielded,
+            "elapsed_seconds": round(time.monotonic() - started, 3),
+        }
+        logger.info(
+            f"Searched {len(keywords)} keywords with {len(queries)} queries: "
+            f"{api_calls} API calls in {round_trips} round trips, {yielded} files"
+        )
+
+    def _search_filters(
+        self,
+        folder_id: Optional[str] = None,
+        file_types: Optional[List[str]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+    ) -> List[str]:
+        """Build the non-keyword clauses of a search query"""
+        q_parts = []
+
+        if folder_id:
+            q_parts.append(f"'{folder_id}' in parents")
+
+        if file_types:
+            mime_types = [f"mimeType='{self.TYPE_MIME[ft]}'" for ft in file_types if ft in self.TYPE_MIME]
+            if mime_types:
+                q_parts.append(f"({' or '.join(mime_types)})")
+
+        if date_from:
+            q_parts.append(f"modifiedTime >= '{date_from.isoformat()}Z'")
+        if date_to:
+            q_parts.append(f"modifiedTime <= '{date_to.isoformat()}Z'")
+
+        q_parts.append("trashed = false")
+        return q_parts
+
+    def _plan_queries(self, keywords: List[str], filters: List[str]) -> List[str]:
+        """Pack OR'd keyword clauses into as few queries as fit MAX_QUERY_LENGTH"""
+        clauses = [
+            "fullText contains '{}'".format(k.replace("\\", "\\\\").replace("'", "\\'"))
+            for k in keywords
+        ]
+
+        def build(group: List[str]) -> str:
+            return " and ".join([f"({' or '.join(group)})", *filters])
+
+        queries, group = [], []
+        for clause in clauses:
+            if group and len(build(group + [clause])) > self.MAX_QUERY_LENGTH:
+                queries.append(build(group))
+                group = []
+            group.append(clause)
+        queries.append(build(group))
+        return queries
+
+    def _batch_list(self, queries: List[str], max_results: int) -> tuple:
+        """
+        Page several queries together, one batch request per round.
+
+        Each query is paged until it is exhausted or has returned
+        max_results files, so the merged newest max_results are exact.
+
+        Returns:
+            (files newest first, API calls, round trips)
+        """
+        state = {str(i): {"token": None, "count": 0, "done": False} for i in range(len(queries))}
+        found: Dict[str, Dict[str, Any]] = {}
+        errors: List[HttpError] = []
+        api_calls = round_trips = 0
+
+        def handle(request_id, response, exception):
+            query_state = state[request_id]
+            if exception is not None:
+                logger.error(f"Drive search sub-query failed: {exception}")
+                errors.append(exception)
+                return
+            files = response.get("files", [])
+            for f in files:
+                found.setdefault(f["id"], f)
+            query_state["count"] += len(files)
+            query_state["token"] = response.get("nextPageToken")
+            query_state["done"] = not query_state["token"]
+
+        while True:
+            pending = [i for i, st in state.items() if not st["done"] and st["count"] < max_results]
+            if not pending:
+                break
+
+            for start in range(0, len(pending), self.BATCH_SIZE):
+                batch = self.service.new_batch_http_request(callback=handle)
+                for request_id in pending[start:start + self.BATCH_SIZE]:
+                    batch.add(
+                        self.service.files().list(
+                            q=queries[int(request_id)],
+                            pageSize=min(max_results - state[request_id]["count"], 100),
+                            fields=self.LIST_FIELDS,
+                            orderBy="modifiedTime desc",
+                            pageToken=state[request_id]["token"],
+                        ),
+                        request_id=request_id,
+                    )
+                # Listings run next to document reads, so not on the shared connection
+                batch.execute(http=self._thread_http())
+                round_trips += 1
+                if errors:
+                    raise errors[0]
+            api_calls += len(pending)
+
+        results = sorted(found.values(), key=lambda f: f.get("modifiedTime", ""), reverse=True)
+        return results, api_calls, round_trips
+
     def get_file(self, file_id: str) -> Optional[Dict[str, Any]]:
         """
         Get file metadata by ID.
@@ -178,6 +479,49 @@ class DriveClient:
             logger.error(f"Failed to get file {file_id}: {e}")
             return None
 
+    def get_files_metadata(
+        self,
+        file_ids: List[str],
+        fields: str = "id, name, mimeType, modifiedTime, headRevisionId",
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get metadata for many files using batched HTTP requests.
+
+        Args:
+            file_ids: File IDs (duplicates are fetched once)
+            fields: Fields to return for each file
+
+        Returns:
+            Dict mapping file ID to metadata (missing or failed files omitted)
+        """
+        if not self.service or not file_ids:
+            return {}
+
+        # Batch request IDs must be unique
+        file_ids = list(dict.fromkeys(file_ids))
+        metadata: Dict[str, Dict[str, Any]] = {}
+
+        def on_response(request_id: str, response: Dict[str, Any], exception: Exception) -> None:
+            if exception is not None:
+                logger.warning(f"Failed to get metadata for {request_id}: {exception}")
+            else:
+                metadata[request_id] = response
+
+        for offset in range(0, len(file_ids), self.BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for file_id in file_ids[offset:offset + self.BATCH_SIZE]:
+                batch.add(
+                    self.service.files().get(fileId=file_id, fields=fields),
+                    request_id=file_id,
+                )
+
+            try:
+                batch.execute()
+            except HttpError as e:
+                logger.error(f"Batch metadata request failed: {e}")
+
+        return metadata
+
     def get_folder_path(self, folder_id: str) -> str:
         """
         Get the full path of a folder.
@@ -291,34 +635,41 @@ class DriveClient:
         Returns:
             List of file metadata
         """
-        files = []
+        try:
+            return list(self.iter_folder(folder_id, recursive=recursive, file_types=file_types))
+        except HttpError as e:
+            logger.error(f"Drive API error: {e}")
+            return []
+
+    def iter_folder(
+        self,
+        folder_id: str,
+        recursive: bool = False,
+        file_types: Optional[List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield all files in a folder, optionally recursive.
 
-        # Get direct files
-        direct_files = self.list_files(folder_id=folder_id)
+        Every page of the folder is listed (not just the first 100 files),
+        and subfolders are descended into as they are reached. API errors
+        are raised as in iter_files.
 
-        for f in direct_files:
-            if f.get("mimeType") == "application/vnd.google-apps.folder":
+        Args:
+            folder_id: Folder ID
+            recursive: Include subfolders
+            file_types: Filter by file types
+
+        Yields:
+            File metadata dicts
+        """
+        mime_types = {self.TYPE_MIME[ft] for ft in file_types or [] if ft in self.TYPE_MIME}
+
+        for f in self.iter_files(folder_id=folder_id):
+            if f.get("mimeType") == self.TYPE_MIME["folder"]:
                 if recursive:
-                    # Recursively get files from subfolders
-                    files.extend(
-                        self.get_files_in_folder(
-                            f["id"], recursive=True, file_types=file_types
-                        )
-                    )
-            else:
-                # Apply file type filter
-                if file_types:
-                    mime_type = f.get("mimeType", "")
-                    type_map = {
-                        "docs": "application/vnd.google-apps.document",
-                        "sheets": "application/vnd.google-apps.spreadsheet",
-                        "slides": "application/vnd.google-apps.presentation",
-                    }
-                    if not any(type_map.get(ft) == mime_type for ft in file_types):
-                        continue
-                files.append(f)
-
-        return files
+                    yield from self.iter_folder(f["id"], recursive=True, file_types=file_types)
+            elif not file_types or f.get("mimeType") in mime_types:
+                yield f
 
 
 # Global Drive client instance
@@ -0,0 +1,157 @@
+"""
+Free/Busy Engine - Interval merging and slot search over calendar busy times
+"""
+
+from typing import List, Tuple, Dict, Optional
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+Interval = Tuple[datetime, datetime]
+
+
+def to_utc(dt: datetime) -> datetime:
+    """Make a datetime timezone-aware in UTC (naive values are treated as UTC)"""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def merge_intervals(intervals: List[Interval]) -> List[Interval]:
+    """
+    Merge overlapping or touching intervals.
+
+    Sorts once and sweeps, so merging busy times for many calendars is
+    O(n log n) in the total number of busy blocks.
+
+    Args:
+        intervals: (start, end) pairs in any order
+
+    Returns:
+        Sorted, non-overlapping intervals
+    """
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def working_windows(
+    time_min: datetime,
+    time_max: datetime,
+    working_hours: Tuple[int, int] = (9, 17),
+    time_zone: str = "UTC",
+    include_weekends: bool = False,
+) -> List[Interval]:
+    """
+    Build the working-hour windows between two instants.
+
+    Working hours are interpreted in the given time zone, so DST changes
+    shift the UTC windows correctly.
+
+    Args:
+        time_min: Range start
+        time_max: Range end
+        working_hours: (start_hour, end_hour) in local time
+        time_zone: IANA time zone name
+        include_weekends: Include Saturday and Sunday
+
+    Returns:
+        Sorted UTC windows clipped to [time_min, time_max]
+    """
+    tz = ZoneInfo(time_zone)
+    time_min, time_max = to_utc(time_min), to_utc(time_max)
+    start_hour, end_hour = working_hours
+
+    windows: List[Interval] = []
+    day = time_min.astimezone(tz).date()
+    last_day = time_max.astimezone(tz).date()
+
+    while day <= last_day:
+        if include_weekends or day.weekday() < 5:
+            local_start = datetime(day.year, day.month, day.day, tzinfo=tz) + timedelta(hours=start_hour)
+            local_end = datetime(day.year, day.month, day.day, tzinfo=tz) + timedelta(hours=end_hour)
+            start = max(to_utc(local_start), time_min)
+            end = min(to_utc(local_end), time_max)
+            if start < end:
+                windows.append((start, end))
+        day += timedelta(days=1)
+
+    return windows
+
+
+def free_intervals(
+    busy: List[Interval],
+    windows: List[Interval],
+    min_minutes: int = 0,
+) -> List[Interval]:
+    """
+    Subtract merged busy intervals from sorted windows.
+
+    Both inputs are sorted, so a single two-pointer pass suffices.
+
+    Args:
+        busy: Merged busy intervals (see merge_intervals)
+        windows: Sorted availability windows
+        min_minutes: Drop free intervals shorter than this
+
+    Returns:
+        Free intervals of at least min_minutes
+    """
+    min_length = timedelta(minutes=min_minutes)
+    free: List[Interval] = []
+    i = 0
+
+    for window_start, window_end in windows:
+        # Skip busy blocks that end before this window
+        while i < len(busy) and busy[i][1] <= window_start:
+            i += 1
+
+        cursor = window_start
+        j = i
+        while j < len(busy) and busy[j][0] < window_end:
+            if busy[j][0] > cursor and busy[j][0] - cursor >= min_length:
+                free.append((cursor, busy[j][0]))
+            cursor = max(cursor, busy[j][1])
+            j += 1
+
+        if window_end > cursor and window_end - cursor >= min_length:
+            free.append((cursor, window_end))
+
+    return free
+
+
+def split_into_slots(
+    free: List[Interval],
+    duration_minutes: int,
+    count: Optional[int] = None,
+    step_minutes: Optional[int] = None,
+) -> List[Dict[str, datetime]]:
+    """
+    Cut free intervals into fixed-length meeting slots.
+
+    Args:
+        free: Free intervals
+        duration_minutes: Slot length
+        count: Maximum number of slots (None for all)
+        step_minutes: Gap between candidate slot starts (defaults to duration)
+
+    Returns:
+        List of {start, end} dicts
+    """
+    duration = timedelta(minutes=duration_minutes)
+    step = timedelta(minutes=step_minutes or duration_minutes)
+    slots: List[Dict[str, datetime]] = []
+
+    for start, end in free:
+        slot_start = start
+        while slot_start + duration <= end:
+            slots.append({"start": slot_start, "end": slot_start + duration})
+            if count is not None and len(slots) >= count:
+                return slots
+            slot_start += step
+
+    return slots
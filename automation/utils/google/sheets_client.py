@@ -2,8 +2,11 @@
 Google Sheets Client - Spreadsheet operations
 """
 
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Tuple, Iterator
+import re
+import time
 from loguru import logger
+import pandas as pd
 
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -73,13 +76,7 @@ class SheetsClient:
             return []
 
         try:
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueRenderOption=value_render_option,
-            ).execute()
-
-            values = result.get("values", [])
+            values = self._fetch_values(spreadsheet_id, range_name, value_render_option)
             logger.info(f"Retrieved {len(values)} rows from {range_name}")
             return values
 
@@ -87,6 +84,110 @@ class SheetsClient:
             logger.error(f"Failed to get values: {e}")
             return []
 
+    def _fetch_values(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        value_render_option: str = "FORMATTED_VALUE",
+    ) -> List[List[Any]]:
+        """Get values from a range, raising HttpError instead of returning []"""
+        result = self.service.spreadsheets().values().get(
+            spreadsheetId=spreadsheet_id,
+            range=range_name,
+            valueRenderOption=value_render_option,
+        ).execute()
+        return result.get("values", [])
+
+    def get_ranges(
+        self,
+        spreadsheet_id: str,
+        ranges: List[str],
+        value_render_option: str = "FORMATTED_VALUE",
+        major_dimension: str = "ROWS",
+    ) -> Dict[str, List[List[Any]]]:
+        """
+        Get values from several ranges in a single request.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            ranges: A1 notation ranges (e.g., ["Metrics!A:F", "Feedback!A:C"])
+            value_render_option: How values should be rendered
+            major_dimension: "ROWS" or "COLUMNS"
+
+        Returns:
+            Dict mapping each requested range to its 2D list of values
+        """
+        if not self.service or not ranges:
+            return {}
+
+        try:
+            result = self.service.spreadsheets().values().batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=ranges,
+                valueRenderOption=value_render_option,
+                majorDimension=major_dimension,
+            ).execute()
+
+            # valueRanges come back in request order; key by the requested
+            # range because the API normalizes names (e.g. "Sheet1!A1:Z1000")
+            value_ranges = result.get("valueRanges", [])
+            values_by_range = {
+                requested: value_range.get("values", [])
+                for requested, value_range in zip(ranges, value_ranges)
+            }
+
+            logger.info(f"Retrieved {len(values_by_range)} ranges from {spreadsheet_id}")
+            return values_by_range
+
+        except HttpError as e:
+            logger.error(f"Failed to batch get values: {e}")
+            return {}
+
+    def get_frame(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        header: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Get a range as a pandas DataFrame with typed columns.
+
+        Values are fetched column-major and unformatted, so numbers arrive as
+        numbers and each column is built directly without a per-row loop.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            range_name: A1 notation range
+            header: Whether the first row holds column names
+
+        Returns:
+            DataFrame (empty if the range has no values)
+        """
+        columns = self.get_ranges(
+            spreadsheet_id,
+            [range_name],
+            value_render_option="UNFORMATTED_VALUE",
+            major_dimension="COLUMNS",
+        ).get(range_name, [])
+
+        if not columns:
+            return pd.DataFrame()
+
+        data = {}
+        for i, column in enumerate(columns):
+            name = str(column[0]) if header and column and column[0] != "" else ""
+            if not name or name in data:
+                name = f"column_{i + 1}"
+
+            # Columns are ragged (trailing blanks are trimmed); Series
+            # alignment pads them with NaN
+            series = pd.Series(column[1:] if header else column, dtype=object)
+            data[name] = series.mask(series == "")
+
+        frame = pd.DataFrame(data).infer_objects()
+        logger.info(f"Loaded {len(frame)} rows x {len(frame.columns)} columns from {range_name}")
+        return frame
+
     def get_all_values(self, spreadsheet_id: str, sheet_name: str = "Sheet1") -> List[List[Any]]:
         """
         Get all values from a sheet.
@@ -100,6 +201,157 @@ class SheetsClient:
         """
         return self.get_values(spreadsheet_id, sheet_name)
 
+    def get_row_count(self, spreadsheet_id: str, sheet_name: str) -> Optional[int]:
+        """
+        Get the grid row count of a sheet without reading any values.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            sheet_name: Name of the sheet
+
+        Returns:
+            Row count or None if unavailable
+        """
+        if not self.service:
+            return None
+
+        try:
+            spreadsheet = self.service.spreadsheets().get(
+                spreadsheetId=spreadsheet_id,
+                fields="sheets.properties(title,gridProperties.rowCount)",
+            ).execute()
+        except HttpError as e:
+            logger.error(f"Failed to get row count for {sheet_name}: {e}")
+            return None
+
+        for sheet in spreadsheet.get("sheets", []):
+            properties = sheet.get("properties", {})
+            if properties.get("title") == sheet_name:
+                return properties.get("gridProperties", {}).get("rowCount")
+        return None
+
+    def iter_windows(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str = "Sheet1",
+        window_rows: int = 1000,
+        start_row: int = 1,
+        row_count: Optional[int] = None,
+        value_render_option: str = "FORMATTED_VALUE",
+    ) -> Iterator[List[List[Any]]]:
+        """
+        Page through a sheet in fixed row windows.
+
+        Only one window is held in memory at a time. Blank rows between
+        values in a window come back as empty lists, but the API trims a
+        window's trailing blank rows and windows without values are
+        skipped, so positions in the output do not map to sheet rows.
+        A window that fails to load raises HttpError rather than being
+        skipped or taken as the end of the sheet, so a partial sheet is
+        never returned as complete.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            sheet_name: Name of the sheet
+            window_rows: Rows fetched per request
+            start_row: First row to read (1-based)
+            row_count: Sheet row count if already known (skips a metadata call)
+            value_render_option: How values should be rendered
+
+        Yields:
+            2D list of values for each window
+        """
+        if not self.service:
+            return
+
+        if row_count is None:
+            row_count = self.get_row_count(spreadsheet_id, sheet_name)
+
+        sheet = "'" + sheet_name.replace("'", "''") + "'"
+        row = start_row
+
+        while row_count is None or row <= row_count:
+            end_row = row + window_rows - 1
+            if row_count is not None:
+                end_row = min(end_row, row_count)
+
+            values = self._fetch_values(
+                spreadsheet_id,
+                f"{sheet}!{row}:{end_row}",
+                value_render_option=value_render_option,
+            )
+
+            # Without a known row count, a successfully read empty window marks the end
+            if not values and row_count is None:
+                break
+
+            if values:
+                yield values
+            row = end_row + 1
+
+    def iter_rows(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str = "Sheet1",
+        window_rows: int = 1000,
+        row_count: Optional[int] = None,
+    ) -> Iterator[List[Any]]:
+        """
+        Stream the rows of a sheet one at a time.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            sheet_name: Name of the sheet
+            window_rows: Rows fetched per request
+            row_count: Sheet row count if already known
+
+        Yields:
+            Row values
+        """
+        for window in self.iter_windows(
+            spreadsheet_id, sheet_name, window_rows, row_count=row_count
+        ):
+            yield from window
+
+    def iter_frames(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str = "Sheet1",
+        window_rows: int = 1000,
+        row_count: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream a sheet as a sequence of small DataFrames.
+
+        The first row is used as column names for every frame.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            sheet_name: Name of the sheet
+            window_rows: Rows per frame
+            row_count: Sheet row count if already known
+
+        Yields:
+            DataFrame for each window of rows
+        """
+        headers: Optional[List[str]] = None
+
+        for window in self.iter_windows(
+            spreadsheet_id,
+            sheet_name,
+            window_rows,
+            row_count=row_count,
+            value_render_option="UNFORMATTED_VALUE",
+        ):
+            if headers is None:
+                headers = [str(h) for h in window[0]]
+                window = window[1:]
+
+            width = len(headers)
+            rows = [(row + [None] * (width - len(row)))[:width] for row in window]
+            if rows:
+                yield pd.DataFrame(rows, columns=headers).infer_objects()
+
     def get_as_dict(
         self,
         spreadsheet_id: str,
@@ -122,15 +374,13 @@ class SheetsClient:
             return []
 
         headers = values[header_row]
-        result = []
-
-        for row in values[header_row + 1:]:
-            row_dict = {}
-            for i, header in enumerate(headers):
-                row_dict[header] = row[i] if i < len(row) else ""
-            result.append(row_dict)
+        width = len(headers)
 
-        return result
+        # Pad short rows once instead of bounds-checking every cell
+        return [
+            dict(zip(headers, row + [""] * (width - len(row))))
+            for row in values[header_row + 1:]
+        ]
 
     def update_values(
         self,
@@ -201,15 +451,7 @@ class SheetsClient:
             return False
 
         try:
-            body = {"values": values}
-            self.service.spreadsheets().values().append(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueInputOption=value_input_option,
-                insertDataOption="INSERT_ROWS",
-                body=body,
-            ).execute()
-
+            self._send_append(spreadsheet_id, range_name, values, value_input_option)
             logger.info(f"Appended {len(values)} rows to {range_name}")
             return True
 
@@ -217,6 +459,82 @@ class SheetsClient:
             logger.error(f"Failed to append values: {e}")
             return False
 
+    def _send_append(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        values: List[List[Any]],
+        value_input_option: str = "USER_ENTERED",
+    ) -> None:
+        """Append values to a sheet, raising HttpError on failure"""
+        self.service.spreadsheets().values().append(
+            spreadsheetId=spreadsheet_id,
+            range=range_name,
+            valueInputOption=value_input_option,
+            insertDataOption="INSERT_ROWS",
+            body={"values": values},
+        ).execute()
+
+    def batch_update_values(
+        self,
+        spreadsheet_id: str,
+        data: List[Dict[str, Any]],
+        value_input_option: str = "USER_ENTERED",
+    ) -> bool:
+        """
+        Update several ranges in a single request.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            data: List of {"range": A1 range, "values": 2D list} dicts
+            value_input_option: How input data should be interpreted
+
+        Returns:
+            True if successful
+        """
+        if settings.dry_run:
+            logger.info(f"[DRY RUN] Would update {len(data)} ranges in {spreadsheet_id}")
+            return True
+
+        if not self.service:
+            return False
+
+        if not data:
+            return True
+
+        try:
+            self._send_batch_update(spreadsheet_id, data, value_input_option)
+            logger.info(f"Updated {len(data)} ranges in {spreadsheet_id}")
+            return True
+
+        except HttpError as e:
+            logger.error(f"Failed to batch update values: {e}")
+            return False
+
+    def _send_batch_update(
+        self,
+        spreadsheet_id: str,
+        data: List[Dict[str, Any]],
+        value_input_option: str = "USER_ENTERED",
+    ) -> None:
+        """Update several ranges in a single request, raising HttpError on failure"""
+        self.service.spreadsheets().values().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={"valueInputOption": value_input_option, "data": data},
+        ).execute()
+
+    def writer(self, **kwargs) -> "SheetsWriter":
+        """
+        Get a buffered writer that coalesces appends and updates.
+
+        Args:
+            **kwargs: SheetsWriter options (max_rows, max_interval, value_input_option)
+
+        Returns:
+            SheetsWriter bound to this client
+        """
+        return SheetsWriter(client=self, **kwargs)
+
     def create_spreadsheet(
         self,
         title: str,
@@ -354,6 +672,288 @@ class SheetsClient:
             return False
 
 
+_A1_CELL = re.compile(r"^([A-Za-z]+)(\d+)(?::[A-Za-z]*\d*)?$")
+
+
+def _column_to_index(letters: str) -> int:
+    """Convert column letters to a 1-based index (A -> 1, AA -> 27)"""
+    index = 0
+    for char in letters.upper():
+        index = index * 26 + (ord(char) - ord("A") + 1)
+    return index
+
+
+def _index_to_column(index: int) -> str:
+    """Convert a 1-based column index to letters (1 -> A, 27 -> AA)"""
+    letters = ""
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def _parse_a1(range_name: str) -> Optional[Tuple[str, int, int]]:
+    """
+    Parse the top-left cell of an A1 range.
+
+    Only sheet-qualified ranges are parsed, since a bare name like "Sheet1"
+    is indistinguishable from a cell reference.
+
+    Returns:
+        (sheet, row, column) with 1-based row/column, or None if the range
+        has no explicit start cell (e.g. just a sheet name)
+    """
+    sheet, separator, cells = range_name.rpartition("!")
+    match = _A1_CELL.match(cells)
+    if not separator or not match:
+        return None
+    return sheet, int(match.group(2)), _column_to_index(match.group(1))
+
+
+class SheetsWriter:
+    """
+    Buffered writer that coalesces Sheets appends and updates.
+
+    Writes are held per spreadsheet and flushed when the buffer reaches
+    max_rows, when max_interval seconds have passed since the first buffered
+    write, or when the context exits. Each flush issues one values.batchUpdate
+    per spreadsheet (adjacent update ranges merged into one block) plus one
+    append per target range.
+
+    A failed write is kept for retry only when retrying is safe: updates
+    (which overwrite) on rate limits, server errors and network errors, and
+    appends only on rate limits, since a timed-out append may already have
+    been applied. Retries back off and are capped at MAX_RETRIES. Other
+    failures, including any other 4xx, are dropped and counted in
+    failed_rows.
+
+    Usage:
+        with sheets_client.writer() as writer:
+            for item in items:
+                writer.append(spreadsheet_id, "Log", [[item.title, item.status]])
+    """
+
+    # Flushes a failed write is retried in before it is dropped
+    MAX_RETRIES = 3
+    # Seconds before the first retry, doubled after each failed flush
+    RETRY_BACKOFF = 5.0
+
+    def __init__(
+        self,
+        client: Optional[SheetsClient] = None,
+        max_rows: int = 500,
+        max_interval: float = 10.0,
+        value_input_option: str = "USER_ENTERED",
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            client: SheetsClient to flush through (defaults to global client)
+            max_rows: Buffered row count that triggers a flush
+            max_interval: Seconds after the first buffered write that trigger a flush
+            value_input_option: How input data should be interpreted
+        """
+        self.client = client or sheets_client
+        self.max_rows = max_rows
+        self.max_interval = max_interval
+        self.value_input_option = value_input_option
+
+        # spreadsheet_id -> list of pending update blocks
+        self._updates: Dict[str, List[Dict[str, Any]]] = {}
+        # spreadsheet_id -> {range_name: rows}
+        self._appends: Dict[str, Dict[str, List[List[Any]]]] = {}
+        self._pending_rows = 0
+        self._first_write: Optional[float] = None
+        # ("update", spreadsheet_id) or (spreadsheet_id, range_name) -> failed attempts
+        self._attempts: Dict[Tuple[str, str], int] = {}
+        self._retry_at: Optional[float] = None
+        self.requests_made = 0
+        self.failed_rows = 0
+
+    def __enter__(self) -> "SheetsWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
+
+    def append(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        values: List[List[Any]],
+    ) -> None:
+        """
+        Buffer rows to append to a sheet.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            range_name: A1 notation range (usually just sheet name)
+            values: 2D list of values to append
+        """
+        if not values:
+            return
+        pending = self._appends.setdefault(spreadsheet_id, {})
+        pending.setdefault(range_name, []).extend(values)
+        self._buffered(len(values))
+
+    def update(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        values: List[List[Any]],
+    ) -> None:
+        """
+        Buffer an update to a range.
+
+        A write that starts directly below a pending block in the same columns
+        is merged into that block.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            range_name: A1 notation range
+            values: 2D list of values to write
+        """
+        if not values:
+            return
+
+        blocks = self._updates.setdefault(spreadsheet_id, [])
+        start = _parse_a1(range_name)
+
+        if start and blocks:
+            last = blocks[-1]
+            sheet, row, column = start
+            if (
+                last["start"]
+                and last["start"][0] == sheet
+                and last["start"][2] == column
+                and last["start"][1] + len(last["values"]) == row
+            ):
+                last["values"].extend(values)
+                self._buffered(len(values))
+                return
+
+        blocks.append({"range": range_name, "start": start, "values": list(values)})
+        self._buffered(len(values))
+
+    def _buffered(self, rows: int) -> None:
+        """Track buffered rows and flush when a threshold is reached"""
+        self._pending_rows += rows
+        if self._first_write is None:
+            self._first_write = time.monotonic()
+
+        # After a failed flush, wait for the backoff instead of retrying on every write
+        if self._retry_at is not None and time.monotonic() < self._retry_at:
+            return
+
+        if (
+            self._pending_rows >= self.max_rows
+            or time.monotonic() - self._first_write >= self.max_interval
+        ):
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        Write all buffered values.
+
+        Updates are sent before appends for each spreadsheet. Values whose
+        request failed with a retryable error stay buffered for the next
+        flush; the rest are dropped and counted in failed_rows.
+
+        Returns:
+            True if every request succeeded
+        """
+        failed_updates: Dict[str, List[Dict[str, Any]]] = {}
+        failed_appends: Dict[str, Dict[str, List[List[Any]]]] = {}
+        written = dropped = 0
+
+        for spreadsheet_id, blocks in self._updates.items():
+            data = []
+            for block in blocks:
+                range_name = block["range"]
+                if block["start"]:
+                    sheet, row, column = block["start"]
+                    range_name = f"{sheet}!{_index_to_column(column)}{row}"
+                data.append({"range": range_name, "values": block["values"]})
+
+            rows = sum(len(block["values"]) for block in blocks)
+            if self._send(("update", spreadsheet_id), rows, False, spreadsheet_id, data):
+                written += rows
+            elif self._attempts.get(("update", spreadsheet_id)):
+                failed_updates[spreadsheet_id] = blocks
+            else:
+                dropped += rows
+
+        for spreadsheet_id, ranges in self._appends.items():
+            for range_name, rows in ranges.items():
+                if self._send((spreadsheet_id, range_name), len(rows), True, spreadsheet_id, range_name, rows):
+                    written += len(rows)
+                elif self._attempts.get((spreadsheet_id, range_name)):
+                    failed_appends.setdefault(spreadsheet_id, {})[range_name] = rows
+                else:
+                    dropped += len(rows)
+
+        remaining = self._pending_rows - written - dropped
+        if written:
+            logger.info(f"Flushed {written} buffered rows to Sheets")
+        if remaining:
+            backoff = self.RETRY_BACKOFF * 2 ** (max(self._attempts.values()) - 1)
+            logger.warning(f"Keeping {remaining} buffered rows for a retry in {backoff:.0f}s")
+            self._retry_at = time.monotonic() + backoff
+        else:
+            self._retry_at = None
+
+        self._updates = failed_updates
+        self._appends = failed_appends
+        self._pending_rows = remaining
+        self._first_write = time.monotonic() if remaining else None
+        return not remaining and not dropped
+
+    def _send(self, key: Tuple[str, str], rows: int, append: bool, *args: Any) -> bool:
+        """
+        Issue one buffered append or batch update and record its outcome.
+
+        Returns True on success. On failure the attempt count under key is
+        kept if the write should be retried and cleared if it was dropped.
+        """
+        self.requests_made += 1
+        args = (*args, self.value_input_option)
+
+        if settings.dry_run or not self.client.service:
+            method = self.client.append_values if append else self.client.batch_update_values
+            if method(*args):
+                self._attempts.pop(key, None)
+                return True
+            error, retryable = "Sheets service not initialized", True
+        else:
+            try:
+                send = self.client._send_append if append else self.client._send_batch_update
+                send(*args)
+                self._attempts.pop(key, None)
+                return True
+            except HttpError as e:
+                status = e.resp.status
+                error = str(e)
+                # Rate-limited requests are rejected unapplied; other server
+                # errors may have applied an append already
+                retryable = status == 429 or (not append and status >= 500)
+            except OSError as e:
+                # Timeouts and dropped connections leave an append's outcome unknown
+                error, retryable = str(e), not append
+
+        target = f"{key[1]} in {key[0]}" if append else key[1]
+        attempts = self._attempts.get(key, 0) + 1
+        if retryable and attempts <= self.MAX_RETRIES:
+            self._attempts[key] = attempts
+            logger.warning(f"Sheets write to {target} failed (attempt {attempts}): {error}")
+            return False
+
+        self._attempts.pop(key, None)
+        self.failed_rows += rows
+        logger.error(f"Dropping {rows} buffered rows for {target}: {error}")
+        return False
+
+
 # Global Sheets client instance
 sheets_client = SheetsClient()
 
@@ -2,6 +2,7 @@
 Google Slides Client - Presentation management
 """
 
+import uuid
 from typing import Optional, List, Dict, Any
 from loguru import logger
 
@@ -28,6 +29,52 @@ class SlidesClient:
             )
         return self._service
 
+    def batch_update(
+        self,
+        presentation_id: str,
+        requests: List[Dict[str, Any]],
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Apply a list of requests in a single presentations.batchUpdate.
+
+        Args:
+            presentation_id: The presentation ID
+            requests: Slides API request dicts
+
+        Returns:
+            List of replies or None on failure
+        """
+        if settings.dry_run:
+            logger.info(f"[DRY RUN] Would apply {len(requests)} requests to {presentation_id}")
+            return []
+
+        if not self.service:
+            return None
+
+        try:
+            response = self.service.presentations().batchUpdate(
+                presentationId=presentation_id,
+                body={"requests": requests},
+            ).execute()
+            return response.get("replies", [])
+
+        except HttpError as e:
+            logger.error(f"Failed to update presentation {presentation_id}: {e}")
+            return None
+
+    def deck_builder(self, presentation_id: str, **kwargs) -> "SlideDeckBuilder":
+        """
+        Get a builder that accumulates slide requests for one batchUpdate.
+
+        Args:
+            presentation_id: The presentation ID
+            **kwargs: SlideDeckBuilder options (max_requests)
+
+        Returns:
+            SlideDeckBuilder bound to this client
+        """
+        return SlideDeckBuilder(presentation_id, client=self, **kwargs)
+
     def get_presentation(self, presentation_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a presentation by ID.
@@ -377,6 +424,276 @@ class SlidesClient:
 slides_client = SlidesClient()
 
 
+class SlideDeckBuilder:
+    """
+    Builder that accumulates slide requests and submits them together.
+
+    Object IDs are assigned up front, so later requests can reference
+    slides and shapes created earlier in the same batch. build() sends
+    everything in one presentations.batchUpdate, or in chunks of
+    max_requests for very large decks.
+
+    Usage:
+        builder = slides_client.deck_builder(presentation_id)
+        slide_id = builder.add_slide()
+        builder.add_title(slide_id, "Findings")
+        builder.add_bullets(slide_id, ["First", "Second"])
+        builder.build()
+    """
+
+    # Default 16:9 page size in points
+    PAGE_WIDTH = 720
+    PAGE_HEIGHT = 405
+    MARGIN = 40
+
+    def __init__(
+        self,
+        presentation_id: str,
+        client: Optional[SlidesClient] = None,
+        max_requests: int = 500,
+    ):
+        """
+        Initialize the builder.
+
+        Args:
+            presentation_id: The presentation ID
+            client: SlidesClient to submit through (defaults to global client)
+            max_requests: Maximum requests per batchUpdate
+        """
+        self.presentation_id = presentation_id
+        self.client = client or slides_client
+        self.max_requests = max_requests
+        self.requests: List[Dict[str, Any]] = []
+        self.slide_ids: List[str] = []
+        self.requests_made = 0
+
+        self._prefix = uuid.uuid4().hex[:8]
+        self._counter = 0
+
+    def _new_id(self, kind: str) -> str:
+        """Generate a unique object ID (Slides requires 5-50 word characters)"""
+        self._counter += 1
+        return f"{kind}_{self._prefix}_{self._counter:04d}"
+
+    def add_slide(
+        self,
+        layout: str = "BLANK",
+        insertion_index: Optional[int] = None,
+    ) -> str:
+        """
+        Queue a new slide.
+
+        Args:
+            layout: Predefined slide layout
+            insertion_index: Position to insert (None for end)
+
+        Returns:
+            Pre-assigned slide ID
+        """
+        slide_id = self._new_id("slide")
+        request: Dict[str, Any] = {
+            "objectId": slide_id,
+            "slideLayoutReference": {"predefinedLayout": layout},
+        }
+        if insertion_index is not None:
+            request["insertionIndex"] = insertion_index
+
+        self.requests.append({"createSlide": request})
+        self.slide_ids.append(slide_id)
+        return slide_id
+
+    def add_text_box(
+        self,
+        slide_id: str,
+        text: str,
+        x: float = 100,
+        y: float = 100,
+        width: float = 400,
+        height: float = 100,
+        font_size: Optional[float] = None,
+        bold: bool = False,
+    ) -> str:
+        """
+        Queue a text box with optional styling.
+
+        Args:
+            slide_id: Slide to place the box on
+            text: Text content
+            x, y: Position in points
+            width, height: Size in points
+            font_size: Font size in points
+            bold: Bold text
+
+        Returns:
+            Pre-assigned shape ID
+        """
+        element_id = self._new_id("text")
+        self.requests.append({
+            "createShape": {
+                "objectId": element_id,
+                "shapeType": "TEXT_BOX",
+                "elementProperties": {
+                    "pageObjectId": slide_id,
+                    "size": {
+                        "width": {"magnitude": width, "unit": "PT"},
+                        "height": {"magnitude": height, "unit": "PT"},
+                    },
+                    "transform": {
+                        "scaleX": 1,
+                        "scaleY": 1,
+                        "translateX": x,
+                        "translateY": y,
+                        "unit": "PT",
+                    },
+                },
+            }
+        })
+
+        if not text:
+            return element_id
+
+        self.requests.append({"insertText": {"objectId": element_id, "text": text}})
+
+        style: Dict[str, Any] = {}
+        fields = []
+        if font_size:
+            style["fontSize"] = {"magnitude": font_size, "unit": "PT"}
+            fields.append("fontSize")
+        if bold:
+            style["bold"] = True
+            fields.append("bold")
+
+        if fields:
+            self.requests.append({
+                "updateTextStyle": {
+                    "objectId": element_id,
+                    "textRange": {"type": "ALL"},
+                    "style": style,
+                    "fields": ",".join(fields),
+                }
+            })
+
+        return element_id
+
+    def add_title(self, slide_id: str, text: str, font_size: float = 28) -> str:
+        """
+        Queue a bold title across the top of a slide.
+
+        Args:
+            slide_id: Slide ID
+            text: Title text
+            font_size: Font size in points
+
+        Returns:
+            Pre-assigned shape ID
+        """
+        return self.add_text_box(
+            slide_id,
+            text,
+            x=self.MARGIN,
+            y=self.MARGIN / 2,
+            width=self.PAGE_WIDTH - 2 * self.MARGIN,
+            height=60,
+            font_size=font_size,
+            bold=True,
+        )
+
+    def add_bullets(
+        self,
+        slide_id: str,
+        items: List[str],
+        y: float = 90,
+        height: Optional[float] = None,
+        font_size: float = 14,
+    ) -> Optional[str]:
+        """
+        Queue a bulleted list below the title.
+
+        Args:
+            slide_id: Slide ID
+            items: One bullet per item
+            y: Top of the list in points
+            height: Box height (defaults to the rest of the page)
+            font_size: Font size in points
+
+        Returns:
+            Pre-assigned shape ID or None if there are no items
+        """
+        items = [item.replace("\n", " ").strip() for item in items if item and item.strip()]
+        if not items:
+            return None
+
+        element_id = self.add_text_box(
+            slide_id,
+            "\n".join(items),
+            x=self.MARGIN,
+            y=y,
+            width=self.PAGE_WIDTH - 2 * self.MARGIN,
+            height=height or self.PAGE_HEIGHT - y - self.MARGIN / 2,
+            font_size=font_size,
+        )
+        self.requests.append({
+            "createParagraphBullets": {
+                "objectId": element_id,
+                "textRange": {"type": "ALL"},
+                "bulletPreset": "BULLET_DISC_CIRCLE_SQUARE",
+            }
+        })
+        return element_id
+
+    def replace_text(
+        self,
+        find_text: str,
+        replace_text: str,
+        match_case: bool = False,
+    ) -> None:
+        """
+        Queue a find-and-replace across the presentation.
+
+        Args:
+            find_text: Text to find
+            replace_text: Replacement text
+            match_case: Case-sensitive matching
+        """
+        self.requests.append({
+            "replaceAllText": {
+                "containsText": {"text": find_text, "matchCase": match_case},
+                "replaceText": replace_text,
+            }
+        })
+
+    def delete_object(self, object_id: str) -> None:
+        """Queue deletion of a slide or page element"""
+        self.requests.append({"deleteObject": {"objectId": object_id}})
+
+    def build(self) -> bool:
+        """
+        Submit all queued requests.
+
+        Returns:
+            True if every chunk was applied
+        """
+        if not self.requests:
+            return True
+
+        total = len(self.requests)
+        for start in range(0, total, self.max_requests):
+            chunk = self.requests[start:start + self.max_requests]
+            replies = self.client.batch_update(self.presentation_id, chunk)
+            self.requests_made += 1
+            if replies is None:
+                # Keep unsent requests so the caller can retry
+                self.requests = self.requests[start:]
+                return False
+
+        logger.info(
+            f"Built {len(self.slide_ids)} slides with {total} requests "
+            f"in {self.requests_made} batchUpdate call(s)"
+        )
+        self.requests = []
+        return True
+
+
 if __name__ == "__main__":
     print("Testing Google Slides Client...")
     print("=" * 50)
@@ -0,0 +1,232 @@
+"""
+Task Index - Local index of Google Tasks kept current with updatedMin delta syncs
+"""
+
+import hashlib
+import json
+import re
+from typing import Optional, List, Dict, Any, Set
+
+from utils.local_store import SQLiteStore
+
+
+def normalize_title(title: str) -> str:
+    """
+    Normalize a task title for matching.
+
+    Lowercases, drops punctuation and collapses whitespace, so
+    "Follow up with Sam:  budget" and "follow up with sam - budget" match.
+
+    Args:
+        title: Task title
+
+    Returns:
+        Normalized title
+    """
+    return " ".join(re.sub(r"[^\w\s]", " ", title.lower()).split())
+
+
+IDEMPOTENCY_MARKER = re.compile(r"\[pos:([0-9a-f]{12})\]")
+
+
+def idempotency_key(*parts: str) -> str:
+    """
+    Derive a stable idempotency key from identifying parts.
+
+    Each part is normalized first, so casing and punctuation changes in
+    the source text produce the same key.
+
+    Args:
+        *parts: e.g. source doc ID, stakeholder name, task title
+
+    Returns:
+        12-character hex key
+    """
+    joined = "|".join(normalize_title(part or "") for part in parts)
+    return hashlib.sha1(joined.encode("utf-8")).hexdigest()[:12]
+
+
+def format_idempotency_marker(key: str) -> str:
+    """Format the marker line stored in task notes"""
+    return f"[pos:{key}]"
+
+
+def extract_idempotency_key(notes: Optional[str]) -> Optional[str]:
+    """Extract the idempotency key from task notes, if present"""
+    match = IDEMPOTENCY_MARKER.search(notes or "")
+    return match.group(1) if match else None
+
+
+class TaskIndex(SQLiteStore):
+    """
+    Local task index keyed by task ID and normalized title.
+
+    Tasks are persisted in SQLite and mirrored in memory on first use, so
+    status lookups and title queries never touch the API. Tasks whose notes
+    carry an idempotency marker are also indexed by that key.
+    """
+
+    DB_NAME = "tasks_index.db"
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            task_id TEXT PRIMARY KEY,
+            task_list_id TEXT NOT NULL,
+            norm_title TEXT NOT NULL,
+            status TEXT,
+            payload TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_title ON tasks (task_list_id, norm_title);
+        CREATE TABLE IF NOT EXISTS sync_state (
+            task_list_id TEXT PRIMARY KEY,
+            last_sync TEXT
+        );
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        super().__init__(db_path)
+        self._by_id: Optional[Dict[str, Dict[str, Any]]] = None
+        self._by_title: Dict[str, Set[str]] = {}
+        self._by_key: Dict[str, str] = {}
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load the in-memory mirror from SQLite on first use"""
+        if self._by_id is None:
+            self._by_id = {}
+            self._by_title = {}
+            self._by_key = {}
+            for row in self.query("SELECT task_id, task_list_id, payload FROM tasks"):
+                task = json.loads(row["payload"])
+                task["_task_list_id"] = row["task_list_id"]
+                self._remember(task)
+        return self._by_id
+
+    def _remember(self, task: Dict[str, Any]) -> None:
+        """Add a task to the in-memory mirror"""
+        self._by_id[task["id"]] = task
+        self._by_title.setdefault(normalize_title(task.get("title", "")), set()).add(task["id"])
+        key = extract_idempotency_key(task.get("notes"))
+        if key:
+            self._by_key[key] = task["id"]
+
+    def _forget(self, task_id: str) -> None:
+        """Remove a task from the in-memory mirror"""
+        task = self._by_id.pop(task_id, None)
+        if task:
+            ids = self._by_title.get(normalize_title(task.get("title", "")), set())
+            ids.discard(task_id)
+            key = extract_idempotency_key(task.get("notes"))
+            if key and self._by_key.get(key) == task_id:
+                del self._by_key[key]
+
+    def apply_changes(
+        self,
+        task_list_id: str,
+        tasks: List[Dict[str, Any]],
+        last_sync: Optional[str] = None,
+    ) -> None:
+        """
+        Upsert changed tasks and drop deleted ones.
+
+        Args:
+            task_list_id: Task list the tasks belong to
+            tasks: Task resources from tasks.list / tasks.insert
+            last_sync: RFC 3339 time to record as the list's last sync
+        """
+        self._load()
+        with self.transaction() as conn:
+            for task in tasks:
+                self._forget(task["id"])
+
+                if task.get("deleted"):
+                    conn.execute("DELETE FROM tasks WHERE task_id = ?", (task["id"],))
+                    continue
+
+                conn.execute(
+                    "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?)",
+                    (
+                        task["id"],
+                        task_list_id,
+                        normalize_title(task.get("title", "")),
+                        task.get("status"),
+                        json.dumps(task),
+                    ),
+                )
+                self._remember(dict(task, _task_list_id=task_list_id))
+
+            if last_sync:
+                conn.execute(
+                    "INSERT OR REPLACE INTO sync_state VALUES (?, ?)",
+                    (task_list_id, last_sync),
+                )
+
+    def get_last_sync(self, task_list_id: str) -> Optional[str]:
+        """Get the RFC 3339 time of the last delta sync for a list"""
+        rows = self.query(
+            "SELECT last_sync FROM sync_state WHERE task_list_id = ?", (task_list_id,)
+        )
+        return rows[0]["last_sync"] if rows else None
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get a task by ID"""
+        return self._load().get(task_id)
+
+    def find_by_key(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the task carrying an idempotency key"""
+        by_id = self._load()
+        task_id = self._by_key.get(key)
+        return by_id.get(task_id) if task_id else None
+
+    def find_by_title(
+        self,
+        title: str,
+        task_list_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find tasks whose normalized title matches exactly.
+
+        Args:
+            title: Title (normalized before lookup)
+            task_list_id: Restrict to a task list
+
+        Returns:
+            Matching tasks
+        """
+        by_id = self._load()
+        tasks = [by_id[i] for i in self._by_title.get(normalize_title(title), ())]
+        if task_list_id:
+            tasks = [t for t in tasks if t["_task_list_id"] == task_list_id]
+        return tasks
+
+    def list_tasks(
+        self,
+        task_list_id: Optional[str] = None,
+        pending_only: bool = False,
+        title_contains: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Query indexed tasks.
+
+        Args:
+            task_list_id: Restrict to a task list
+            pending_only: Exclude completed tasks
+            title_contains: Substring of the normalized title
+
+        Returns:
+            Matching tasks
+        """
+        by_id = self._load()
+        needle = normalize_title(title_contains) if title_contains else None
+        results = []
+
+        for norm_title, ids in self._by_title.items():
+            if needle and needle not in norm_title:
+                continue
+            for task_id in ids:
+                task = by_id[task_id]
+                if task_list_id and task["_task_list_id"] != task_list_id:
+                    continue
+                if pending_only and task.get("status") == "completed":
+                    continue
+                results.append(task)
+
+        return results
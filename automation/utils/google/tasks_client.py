@@ -2,22 +2,29 @@
 Google Tasks Client - Task management
 """
 
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple
+from datetime import datetime, timedelta
 from loguru import logger
 
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from utils.google.base_client import google_base_client
+from utils.google.task_index import TaskIndex
 from config import settings
 
 
 class TasksClient:
     """Client for Google Tasks operations"""
 
+    # Google batch endpoints accept up to 1000 calls, but Tasks rate-limits
+    # large batches; 50 keeps each batch well under the per-user quota
+    BATCH_SIZE = 50
+
     def __init__(self):
         self._service = None
+        self._task_lists: Optional[List[Dict[str, Any]]] = None
+        self.index = TaskIndex()
 
     @property
     def service(self):
@@ -28,13 +35,22 @@ class TasksClient:
             )
         return self._service
 
-    def list_task_lists(self) -> List[Dict[str, Any]]:
+    def list_task_lists(self, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         List all task lists.
 
+        Results are cached for the life of the client and invalidated when
+        a task list is created.
+
+        Args:
+            refresh: Bypass the cache
+
         Returns:
             List of task list metadata dicts
         """
+        if self._task_lists is not None and not refresh:
+            return list(self._task_lists)
+
         if not self.service:
             logger.warning("Tasks service not initialized")
             return []
@@ -55,7 +71,8 @@ class TasksClient:
                     break
 
             logger.info(f"Listed {len(task_lists)} task lists")
-            return task_lists
+            self._task_lists = task_lists
+            return list(task_lists)
 
         except HttpError as e:
             logger.error(f"Failed to list task lists: {e}")
@@ -65,14 +82,23 @@ class TasksClient:
         """
         Get the default task list ID.
 
+        Uses the configured list if set, otherwise the first task list.
+
         Returns:
             Task list ID or None
         """
+        if settings.google_tasks_list_id:
+            return settings.google_tasks_list_id
+
         task_lists = self.list_task_lists()
         if task_lists:
             return task_lists[0].get("id")
         return None
 
+    def _resolve_list_id(self, task_list_id: Optional[str]) -> str:
+        """Resolve an explicit, default or @default task list ID"""
+        return task_list_id or self.get_default_task_list() or "@default"
+
     def create_task_list(self, title: str) -> Optional[str]:
         """
         Create a new task list.
@@ -97,6 +123,7 @@ class TasksClient:
 
             list_id = task_list.get("id")
             logger.info(f"Created task list '{title}' with ID: {list_id}")
+            self._task_lists = None
             return list_id
 
         except HttpError as e:
@@ -126,7 +153,7 @@ class TasksClient:
             return []
 
         try:
-            list_id = task_list_id or self.get_default_task_list() or "@default"
+            list_id = self._resolve_list_id(task_list_id)
 
             tasks = []
             page_token = None
@@ -153,6 +180,85 @@ class TasksClient:
             logger.error(f"Failed to get tasks: {e}")
             return []
 
+    def sync_task_index(self, task_list_id: Optional[str] = None) -> bool:
+        """
+        Refresh the local task index with tasks changed since the last sync.
+
+        Uses tasks.list(updatedMin=...) including completed, hidden and
+        deleted tasks, so one delta call keeps the index complete.
+
+        Args:
+            task_list_id: Task list ID
+
+        Returns:
+            True if the index was refreshed
+        """
+        if not self.service:
+            return False
+
+        list_id = self._resolve_list_id(task_list_id)
+        # Small overlap guards against clock skew; re-applying a task is harmless
+        sync_started = (datetime.utcnow() - timedelta(minutes=1)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+        params = {
+            "tasklist": list_id,
+            "showCompleted": True,
+            "showHidden": True,
+            "showDeleted": True,
+            "maxResults": 100,
+        }
+        last_sync = self.index.get_last_sync(list_id)
+        if last_sync:
+            params["updatedMin"] = last_sync
+
+        try:
+            tasks = []
+            page_token = None
+
+            while True:
+                response = self.service.tasks().list(pageToken=page_token, **params).execute()
+                tasks.extend(response.get("items", []))
+                page_token = response.get("nextPageToken")
+
+                if not page_token:
+                    break
+
+        except HttpError as e:
+            logger.error(f"Failed to sync task index: {e}")
+            return False
+
+        self.index.apply_changes(list_id, tasks, last_sync=sync_started)
+        logger.info(f"Synced {len(tasks)} changed tasks into local index")
+        return True
+
+    def find_tasks(
+        self,
+        task_list_id: Optional[str] = None,
+        pending_only: bool = False,
+        title_contains: Optional[str] = None,
+        sync: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Query the local task index.
+
+        Args:
+            task_list_id: Task list ID
+            pending_only: Exclude completed tasks
+            title_contains: Substring of the normalized title
+            sync: Run a delta sync first
+
+        Returns:
+            Matching task dicts
+        """
+        if sync:
+            self.sync_task_index(task_list_id)
+
+        return self.index.list_tasks(
+            task_list_id=self._resolve_list_id(task_list_id),
+            pending_only=pending_only,
+            title_contains=title_contains,
+        )
+
     def get_pending_tasks(
         self,
         task_list_id: Optional[str] = None,
@@ -188,7 +294,7 @@ class TasksClient:
             return None
 
         try:
-            list_id = task_list_id or self.get_default_task_list() or "@default"
+            list_id = self._resolve_list_id(task_list_id)
 
             task = self.service.tasks().get(
                 tasklist=list_id,
@@ -230,21 +336,16 @@ class TasksClient:
             return None
 
         try:
-            list_id = task_list_id or self.get_default_task_list() or "@default"
+            list_id = self._resolve_list_id(task_list_id)
 
-            task_body = {"title": title}
-
-            if notes:
-                task_body["notes"] = notes
-            if due_date:
-                # Google Tasks expects RFC 3339 format with date only
-                task_body["due"] = due_date.strftime("%Y-%m-%dT00:00:00.000Z")
+            task_body = self._build_task_body(title, notes, due_date)
 
             params = {"tasklist": list_id, "body": task_body}
             if parent_task_id:
                 params["parent"] = parent_task_id
 
             task = self.service.tasks().insert(**params).execute()
+            self.index.apply_changes(list_id, [task])
 
             task_id = task.get("id")
             logger.info(f"Created task '{title}' with ID: {task_id}")
@@ -254,6 +355,90 @@ class TasksClient:
             logger.error(f"Failed to create task: {e}")
             return None
 
+    def _build_task_body(
+        self,
+        title: str,
+        notes: Optional[str] = None,
+        due_date: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Build a task resource body"""
+        task_body = {"title": title}
+
+        if notes:
+            task_body["notes"] = notes
+        if due_date:
+            # Google Tasks expects RFC 3339 format with date only
+            task_body["due"] = due_date.strftime("%Y-%m-%dT00:00:00.000Z")
+
+        return task_body
+
+    def create_tasks_bulk(
+        self,
+        tasks: List[Dict[str, Any]],
+        task_list_id: Optional[str] = None,
+    ) -> Tuple[List[Optional[str]], Dict[int, str]]:
+        """
+        Create many tasks using batched HTTP requests.
+
+        Args:
+            tasks: Task specs with keys title, notes, due_date, parent_task_id
+            task_list_id: Task list ID
+
+        Returns:
+            Tuple of (task IDs in input order with None for failures,
+            dict mapping failed input index to error message)
+        """
+        if settings.dry_run:
+            logger.info(f"[DRY RUN] Would create {len(tasks)} tasks")
+            return ["dry_run_task_id"] * len(tasks), {}
+
+        if not self.service:
+            return [None] * len(tasks), {i: "Tasks service not initialized" for i in range(len(tasks))}
+
+        list_id = self._resolve_list_id(task_list_id)
+        task_ids: List[Optional[str]] = [None] * len(tasks)
+        failures: Dict[int, str] = {}
+        created: List[Dict[str, Any]] = []
+
+        def on_response(request_id: str, response: Dict[str, Any], exception: Exception) -> None:
+            index = int(request_id)
+            if exception is not None:
+                failures[index] = str(exception)
+            else:
+                task_ids[index] = response.get("id")
+                created.append(response)
+
+        for offset in range(0, len(tasks), self.BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=on_response)
+
+            for index in range(offset, min(offset + self.BATCH_SIZE, len(tasks))):
+                spec = tasks[index]
+                params = {
+                    "tasklist": list_id,
+                    "body": self._build_task_body(
+                        spec["title"], spec.get("notes"), spec.get("due_date")
+                    ),
+                }
+                if spec.get("parent_task_id"):
+                    params["parent"] = spec["parent_task_id"]
+                batch.add(self.service.tasks().insert(**params), request_id=str(index))
+
+            try:
+                batch.execute()
+            except HttpError as e:
+                logger.error(f"Batch task creation failed: {e}")
+                for index in range(offset, min(offset + self.BATCH_SIZE, len(tasks))):
+                    if task_ids[index] is None:
+                        failures.setdefault(index, str(e))
+
+        self.index.apply_changes(list_id, created)
+
+        for index, error in failures.items():
+            logger.warning(f"Failed to create task '{tasks[index]['title']}': {error}")
+
+        logger.info(f"Created {len(tasks) - len(failures)}/{len(tasks)} tasks in bulk")
+        return task_ids, failures
+
     def update_task(
         self,
         task_id: str,
@@ -279,7 +464,7 @@ class TasksClient:
             return False
 
         try:
-            list_id = task_list_id or self.get_default_task_list() or "@default"
+            list_id = self._resolve_list_id(task_list_id)
 
             # Get existing task
             task = self.get_task(task_id, list_id)
@@ -293,11 +478,12 @@ class TasksClient:
                 else:
                     task[key] = value
 
-            self.service.tasks().update(
+            updated = self.service.tasks().update(
                 tasklist=list_id,
                 task=task_id,
                 body=task,
             ).execute()
+            self.index.apply_changes(list_id, [updated])
 
             logger.info(f"Updated task {task_id}")
             return True
@@ -363,12 +549,13 @@ class TasksClient:
             return False
 
         try:
-            list_id = task_list_id or self.get_default_task_list() or "@default"
+            list_id = self._resolve_list_id(task_list_id)
 
             self.service.tasks().delete(
                 tasklist=list_id,
                 task=task_id,
             ).execute()
+            self.index.apply_changes(list_id, [{"id": task_id, "deleted": True}])
 
             logger.info(f"Deleted task {task_id}")
             return True
@@ -404,7 +591,7 @@ class TasksClient:
             return False
 
         try:
-            list_id = task_list_id or self.get_default_task_list() or "@default"
+            list_id = self._resolve_list_id(task_list_id)
 
             params = {
                 "tasklist": list_id,
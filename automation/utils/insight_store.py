@@ -0,0 +1,95 @@
+"""
+Insight Store - Persistent cache of LLM-extracted stakeholder insights
+"""
+
+import json
+from datetime import datetime
+from typing import Optional
+
+from utils.local_store import SQLiteStore
+from models.stakeholder import StakeholderInsight
+
+
+class InsightStore(SQLiteStore):
+    """
+    Cache of extracted insights keyed by document.
+
+    An entry is valid only for the content hash, model and prompt version
+    it was extracted with, so editing a document, switching models or
+    changing the extraction prompt all invalidate it. One entry is kept
+    per document.
+    """
+
+    DB_NAME = "insights.db"
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS insights (
+            doc_id TEXT PRIMARY KEY,
+            content_hash TEXT NOT NULL,
+            model TEXT NOT NULL,
+            prompt_hash TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            stored_at TEXT NOT NULL
+        );
+    """
+
+    def get(
+        self,
+        doc_id: str,
+        content_hash: str,
+        model: str,
+        prompt_hash: str,
+    ) -> Optional[StakeholderInsight]:
+        """
+        Get a cached insight if it was extracted under the same inputs.
+
+        Args:
+            doc_id: Source document ID
+            content_hash: Hash of the content sent to the model
+            model: Model name
+            prompt_hash: Version hash of the extraction prompt
+
+        Returns:
+            StakeholderInsight or None
+        """
+        rows = self.query(
+            "SELECT payload FROM insights "
+            "WHERE doc_id = ? AND content_hash = ? AND model = ? AND prompt_hash = ?",
+            (doc_id, content_hash, model, prompt_hash),
+        )
+        if not rows:
+            return None
+        return StakeholderInsight.from_dict(json.loads(rows[0]["payload"]))
+
+    def put(
+        self,
+        insight: StakeholderInsight,
+        content_hash: str,
+        model: str,
+        prompt_hash: str,
+    ) -> None:
+        """
+        Store an extracted insight, replacing any older entry for the document.
+
+        Args:
+            insight: Extracted insight
+            content_hash: Hash of the content sent to the model
+            model: Model name
+            prompt_hash: Version hash of the extraction prompt
+        """
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO insights VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    insight.source_doc_id,
+                    content_hash,
+                    model,
+                    prompt_hash,
+                    json.dumps(insight.to_dict()),
+                    datetime.utcnow().isoformat(),
+                ),
+            )
+
+    def delete(self, doc_id: str) -> None:
+        """Remove the cached insight for a document"""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM insights WHERE doc_id = ?", (doc_id,))
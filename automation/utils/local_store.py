@@ -0,0 +1,68 @@
+"""
+Local Store - SQLite persistence for caches, indexes and sync state
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Iterator, List, Sequence, Any
+from loguru import logger
+
+from config import settings
+
+
+class SQLiteStore:
+    """
+    Base class for a small SQLite-backed local store.
+
+    Subclasses set DB_NAME and SCHEMA. The database file lives under
+    settings.local_store_path and is opened lazily on first use, so
+    constructing a store has no side effects.
+    """
+
+    DB_NAME = "personal_os.db"
+    SCHEMA = ""
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            db_path: Path to the SQLite file (defaults to DB_NAME under the local store dir)
+        """
+        self.db_path = Path(db_path) if db_path else settings.local_store_path / self.DB_NAME
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Lazy connection with schema applied"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            if self.SCHEMA:
+                self._conn.executescript(self.SCHEMA)
+            logger.debug(f"Opened local store {self.db_path}")
+        return self._conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in a single locked transaction"""
+        with self._lock:
+            with self.conn:
+                yield self.conn
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        """Run a read query and fetch all rows"""
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def close(self) -> None:
+        """Close the underlying connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
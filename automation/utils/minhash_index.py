@@ -0,0 +1,267 @@
+"""
+MinHash Index - Near-duplicate and superset detection with LSH banding
+"""
+
+import re
+import zlib
+from typing import Optional, List, Dict, Any
+
+import numpy as np
+
+from utils.local_store import SQLiteStore
+from models.document import DocumentContent
+
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# Mersenne prime for the universal hash family h(x) = (a*x + b) mod p
+_PRIME = (1 << 31) - 1
+
+
+def shingle_hashes(text: str, size: int = 5) -> np.ndarray:
+    """
+    Hash the word shingles of a text.
+
+    Args:
+        text: Text to shingle
+        size: Words per shingle
+
+    Returns:
+        Unique 31-bit shingle hashes as uint64
+    """
+    words = WORD_PATTERN.findall(text.lower())
+    if not words:
+        return np.zeros(0, dtype=np.uint64)
+
+    shingles = {
+        " ".join(words[i:i + size])
+        for i in range(max(len(words) - size + 1, 1))
+    }
+    return np.fromiter(
+        (zlib.crc32(s.encode("utf-8")) & _PRIME for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+
+
+class MinHashIndex(SQLiteStore):
+    """
+    MinHash signatures of document shingles with an LSH banding index.
+
+    Candidates are found by looking up a document's band buckets, so
+    queries touch only documents sharing a bucket rather than the whole
+    corpus. Candidates are then classified from the signatures:
+
+    - duplicate: estimated Jaccard similarity >= DUPLICATE_JACCARD
+    - subset / superset: estimated containment of the smaller document in
+      the larger >= CONTAINMENT (e.g. notes pasted into a longer doc)
+
+    With 32 bands of 4 rows, pairs at Jaccard 0.5 are found ~87% of the
+    time, so a copy that is less than about a third of its superset may be
+    missed.
+    """
+
+    DB_NAME = "minhash.db"
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS signatures (
+            doc_id TEXT PRIMARY KEY,
+            version TEXT,
+            shingles INTEGER NOT NULL,
+            signature BLOB NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS bands (
+            band INTEGER NOT NULL,
+            bucket INTEGER NOT NULL,
+            doc_id TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_bands_bucket ON bands (band, bucket);
+        CREATE INDEX IF NOT EXISTS idx_bands_doc ON bands (doc_id);
+    """
+
+    NUM_PERM = 128
+    BANDS = 32
+    ROWS = 4
+    SHINGLE_SIZE = 5
+
+    DUPLICATE_JACCARD = 0.8
+    CONTAINMENT = 0.9
+
+    # Fixed seed so signatures stay comparable across runs
+    _rng = np.random.RandomState(20240601)
+    _A = _rng.randint(1, _PRIME, size=NUM_PERM).astype(np.uint64)
+    _B = _rng.randint(0, _PRIME, size=NUM_PERM).astype(np.uint64)
+
+    def signature(self, text: str) -> tuple:
+        """
+        Compute the MinHash signature of a text.
+
+        Returns:
+            (signature as uint32 array, number of shingles)
+        """
+        hashes = shingle_hashes(text, self.SHINGLE_SIZE)
+        if not hashes.size:
+            return np.full(self.NUM_PERM, _PRIME, dtype=np.uint32), 0
+
+        # a < 2^31 and x < 2^31, so a*x + b fits in uint64
+        permuted = (self._A[:, None] * hashes[None, :] + self._B[:, None]) % _PRIME
+        return permuted.min(axis=1).astype(np.uint32), int(hashes.size)
+
+    def get_version(self, doc_id: str) -> Optional[str]:
+        """Get the version a document was signed at"""
+        rows = self.query("SELECT version FROM signatures WHERE doc_id = ?", (doc_id,))
+        return rows[0]["version"] if rows else None
+
+    def add(self, document: DocumentContent, version: Optional[str] = None) -> bool:
+        """
+        Sign a document and add it to the LSH buckets.
+
+        Args:
+            document: Document content
+            version: Version the content was read at
+
+        Returns:
+            True if the index changed
+        """
+        if version and self.get_version(document.id) == version:
+            return False
+
+        signature, shingles = self.signature(document.content)
+        buckets = self._buckets(signature)
+
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM bands WHERE doc_id = ?", (document.id,))
+            conn.execute(
+                "INSERT OR REPLACE INTO signatures VALUES (?, ?, ?, ?)",
+                (document.id, version, shingles, signature.tobytes()),
+            )
+            if shingles:
+                conn.executemany(
+                    "INSERT INTO bands VALUES (?, ?, ?)",
+                    [(band, bucket, document.id) for band, bucket in enumerate(buckets)],
+                )
+        return True
+
+    def remove(self, doc_id: str) -> None:
+        """Remove a document from the index"""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM bands WHERE doc_id = ?", (doc_id,))
+            conn.execute("DELETE FROM signatures WHERE doc_id = ?", (doc_id,))
+
+    def matches(self, doc_id: str) -> List[Dict[str, Any]]:
+        """
+        Find near-duplicates, supersets and subsets of an indexed document.
+
+        Args:
+            doc_id: Indexed document ID
+
+        Returns:
+            Dicts with doc_id, jaccard, containment and relation, where
+            relation is "duplicate", "subset" (doc_id is contained in the
+            match) or "superset" (the match is contained in doc_id)
+        """
+        own = self._load([doc_id]).get(doc_id)
+        if not own or not own["shingles"]:
+            return []
+
+        candidates = [
+            row["doc_id"]
+            for row in self.query(
+                "SELECT DISTINCT b.doc_id FROM bands a "
+                "JOIN bands b ON b.band = a.band AND b.bucket = a.bucket "
+                "WHERE a.doc_id = ? AND b.doc_id != ?",
+                (doc_id, doc_id),
+            )
+        ]
+
+        results = []
+        for other_id, other in self._load(candidates).items():
+            match = self._classify(own, other)
+            if match:
+                results.append({"doc_id": other_id, **match})
+
+        return sorted(results, key=lambda m: m["jaccard"], reverse=True)
+
+    def clusters(self, doc_ids: List[str]) -> List[List[str]]:
+        """
+        Group documents into duplicate clusters.
+
+        Documents are linked if they are near-duplicates or one contains the
+        other. Documents that are not indexed form singleton clusters.
+
+        Args:
+            doc_ids: Documents to group
+
+        Returns:
+            Clusters (lists of doc IDs), each in input order
+        """
+        parent = {doc_id: doc_id for doc_id in doc_ids}
+
+        def find(doc_id: str) -> str:
+            while parent[doc_id] != doc_id:
+                parent[doc_id] = parent[parent[doc_id]]
+                doc_id = parent[doc_id]
+            return doc_id
+
+        for doc_id in doc_ids:
+            for match in self.matches(doc_id):
+                if match["doc_id"] in parent:
+                    parent[find(match["doc_id"])] = find(doc_id)
+
+        groups: Dict[str, List[str]] = {}
+        for doc_id in doc_ids:
+            groups.setdefault(find(doc_id), []).append(doc_id)
+        return list(groups.values())
+
+    def get_sizes(self, doc_ids: List[str]) -> Dict[str, int]:
+        """Get the shingle counts of indexed documents"""
+        return {doc_id: data["shingles"] for doc_id, data in self._load(doc_ids).items()}
+
+    def _buckets(self, signature: np.ndarray) -> List[int]:
+        """Hash each band of a signature to a bucket"""
+        return [
+            zlib.crc32(signature[band * self.ROWS:(band + 1) * self.ROWS].tobytes())
+            for band in range(self.BANDS)
+        ]
+
+    def _load(self, doc_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Load signatures and shingle counts"""
+        loaded = {}
+        # Chunked to stay under SQLite's bound parameter limit
+        for i in range(0, len(doc_ids), 500):
+            chunk = doc_ids[i:i + 500]
+            rows = self.query(
+                "SELECT doc_id, version, shingles, signature FROM signatures "
+                f"WHERE doc_id IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            for row in rows:
+                loaded[row["doc_id"]] = {
+                    "version": row["version"],
+                    "shingles": row["shingles"],
+                    "signature": np.frombuffer(row["signature"], dtype=np.uint32),
+                }
+        return loaded
+
+    def _classify(self, own: Dict[str, Any], other: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Estimate similarity and containment of two signed documents"""
+        if not other["shingles"]:
+            return None
+
+        jaccard = float(np.mean(own["signature"] == other["signature"]))
+        # |A ∩ B| from Jaccard and set sizes, then containment in the larger set
+        intersection = jaccard * (own["shingles"] + other["shingles"]) / (1 + jaccard)
+        smaller = min(own["shingles"], other["shingles"])
+        containment = min(intersection / smaller, 1.0)
+
+        if jaccard >= self.DUPLICATE_JACCARD:
+            relation = "duplicate"
+        elif containment >= self.CONTAINMENT:
+            relation = "subset" if own["shingles"] <= other["shingles"] else "superset"
+        else:
+            return None
+
+        return {
+            "jaccard": round(jaccard, 4),
+            "containment": round(containment, 4),
+            "relation": relation,
+        }
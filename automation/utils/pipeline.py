@@ -0,0 +1,172 @@
+"""
+Pipeline - Streaming stages connected by bounded queues
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+from loguru import logger
+
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """A pipeline stage: a function applied to each item by one or more workers"""
+
+    name: str
+    func: Callable[[Any], Any]    # Returns the output item, or None to drop it
+    workers: int = 1
+
+
+class Pipeline:
+    """
+    Streaming pipeline with bounded queues between stages.
+
+    Each stage runs in its own worker threads, so item N+1 can be in one
+    stage while item N is in the next, and total time approaches the
+    slowest stage rather than the sum of all stages. Bounded queues apply
+    backpressure, so a fast stage never runs far ahead of a slow one.
+    Items whose stage function raises are logged and dropped. If the
+    source itself raises, the items already fed in are finished and then
+    the error is raised to the caller, so a partial input is never taken
+    as complete.
+
+    Usage:
+        pipeline = Pipeline([Stage("read", read), Stage("extract", extract, workers=4)])
+        for result in pipeline.run(document_ids):
+            ...
+    """
+
+    def __init__(self, stages: List[Stage], queue_size: int = 8):
+        """
+        Initialize the pipeline.
+
+        Args:
+            stages: Stages in order
+            queue_size: Capacity of each queue between stages
+        """
+        self.stages = stages
+        self.queue_size = queue_size
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    def run(self, source: Iterable[Any]) -> Iterator[Any]:
+        """
+        Stream items from source through all stages.
+
+        The source is consumed in a feeder thread, and outputs are yielded
+        in the caller's thread in completion order. An error raised by the
+        source is raised here after the last output.
+
+        Args:
+            source: Input items (may be a lazy generator)
+
+        Yields:
+            Outputs of the last stage
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        stop = threading.Event()
+        lock = threading.Lock()
+        remaining = [stage.workers for stage in self.stages]
+        source_errors: List[Exception] = []
+        self.stats = {
+            stage.name: {"items": 0, "errors": 0, "busy_seconds": 0.0} for stage in self.stages
+        }
+
+        def put(q: queue.Queue, item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def get(q: queue.Queue) -> Any:
+            while not stop.is_set():
+                try:
+                    return q.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+            return _DONE
+
+        def feed() -> None:
+            try:
+                for item in source:
+                    if not put(queues[0], item):
+                        return
+            except Exception as e:
+                logger.error(f"Pipeline source failed: {e}")
+                source_errors.append(e)
+            finally:
+                for _ in range(self.stages[0].workers):
+                    put(queues[0], _DONE)
+
+        def work(index: int) -> None:
+            stage = self.stages[index]
+            stats = self.stats[stage.name]
+            inbox, outbox = queues[index], queues[index + 1]
+
+            while True:
+                item = get(inbox)
+                if item is _DONE:
+                    break
+
+                started = time.monotonic()
+                try:
+                    result = stage.func(item)
+                except Exception as e:
+                    logger.error(f"Pipeline stage '{stage.name}' failed: {e}")
+                    result = None
+                    with lock:
+                        stats["errors"] += 1
+
+                with lock:
+                    stats["items"] += 1
+                    stats["busy_seconds"] += time.monotonic() - started
+
+                if result is not None and not put(outbox, result):
+                    return
+
+            # The last worker of a stage closes the next stage's input
+            with lock:
+                remaining[index] -= 1
+                last = remaining[index] == 0
+            if last:
+                downstream = self.stages[index + 1].workers if index + 1 < len(self.stages) else 1
+                for _ in range(downstream):
+                    put(outbox, _DONE)
+
+        threads = [threading.Thread(target=feed, name="pipeline-source", daemon=True)]
+        for index, stage in enumerate(self.stages):
+            for n in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=work, args=(index,), name=f"pipeline-{stage.name}-{n}", daemon=True
+                ))
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = get(queues[-1])
+                if item is _DONE:
+                    break
+                yield item
+
+            if source_errors:
+                raise source_errors[0]
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join(timeout=1)
+
+            for name, stats in self.stats.items():
+                logger.info(
+                    f"Pipeline stage '{name}': {stats['items']:.0f} items, "
+                    f"{stats['errors']:.0f} errors, {stats['busy_seconds']:.1f}s busy"
+                )
@@ -0,0 +1,100 @@
+"""
+Revision Store - Last processed revision of each extracted document
+"""
+
+import json
+import zlib
+from datetime import datetime
+from typing import Optional, Dict, Any
+
+from utils.local_store import SQLiteStore
+from models.stakeholder import StakeholderInsight
+
+
+class RevisionStore(SQLiteStore):
+    """
+    Text and cumulative insight of the last revision each document was
+    extracted at.
+
+    Running notes documents grow by a section every week. Keeping the text
+    that was last sent for extraction lets the next revision be diffed
+    against it, so only the newly added sections go to the model. One
+    entry is kept per document, with the text stored compressed.
+    """
+
+    DB_NAME = "revisions.db"
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS revisions (
+            doc_id TEXT PRIMARY KEY,
+            model TEXT NOT NULL,
+            prompt_hash TEXT NOT NULL,
+            content BLOB NOT NULL,
+            insight TEXT NOT NULL,
+            stored_at TEXT NOT NULL
+        );
+    """
+
+    def get(
+        self,
+        doc_id: str,
+        model: str,
+        prompt_hash: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the last processed revision of a document.
+
+        Revisions extracted with another model or prompt version are
+        ignored, since their insight is not comparable.
+
+        Args:
+            doc_id: Document ID
+            model: Model name
+            prompt_hash: Version hash of the extraction prompt
+
+        Returns:
+            Dict with content and insight, or None
+        """
+        rows = self.query(
+            "SELECT content, insight FROM revisions WHERE doc_id = ? AND model = ? AND prompt_hash = ?",
+            (doc_id, model, prompt_hash),
+        )
+        if not rows:
+            return None
+        return {
+            "content": zlib.decompress(rows[0]["content"]).decode("utf-8"),
+            "insight": StakeholderInsight.from_dict(json.loads(rows[0]["insight"])),
+        }
+
+    def put(
+        self,
+        content: str,
+        insight: StakeholderInsight,
+        model: str,
+        prompt_hash: str,
+    ) -> None:
+        """
+        Record the revision a document was just extracted at.
+
+        Args:
+            content: Full document text of the revision
+            insight: Cumulative insight of the whole revision
+            model: Model name
+            prompt_hash: Version hash of the extraction prompt
+        """
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO revisions VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    insight.source_doc_id,
+                    model,
+                    prompt_hash,
+                    zlib.compress(content.encode("utf-8"), 6),
+                    json.dumps(insight.to_dict()),
+                    datetime.utcnow().isoformat(),
+                ),
+            )
+
+    def delete(self, doc_id: str) -> None:
+        """Forget the processed revision of a document"""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM revisions WHERE doc_id = ?", (doc_id,))
@@ -0,0 +1,226 @@
+"""
+Run Checkpoint - Stage outputs of a discovery run, for resuming after failures
+"""
+
+import json
+import os
+import shutil
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+from loguru import logger
+
+from config import settings
+
+
+class RunCheckpoint:
+    """
+    Run directory holding the output of each completed stage.
+
+    Whole-stage outputs are written to <stage>.json when the stage
+    completes. Per-document outputs are appended to <stage>.jsonl as they
+    are produced, so an interrupted stage resumes at document granularity.
+    run.json records the run parameters and the completed stages.
+
+    Usage:
+        run = RunCheckpoint.create({"report_title": "Q3 Discovery"})
+        run.append_record("insights", doc_id, insight.to_dict())
+        run.save_stage("profiles", [p.to_dict() for p in profiles])
+        ...
+        run = RunCheckpoint.load(run.run_id)
+    """
+
+    def __init__(self, run_id: str, root: Optional[Path] = None):
+        """
+        Initialize a checkpoint handle (use create() or load()).
+
+        Args:
+            run_id: Run ID
+            root: Directory containing run directories (defaults to the local store)
+        """
+        self.run_id = run_id
+        self.path = (root or self.default_root()) / run_id
+        self._meta: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def default_root() -> Path:
+        """Directory containing all run directories"""
+        return settings.local_store_path / "runs"
+
+    @classmethod
+    def create(cls, params: Dict[str, Any], root: Optional[Path] = None) -> "RunCheckpoint":
+        """
+        Start a new run.
+
+        Args:
+            params: JSON-serializable run parameters, restored on resume
+            root: Directory containing run directories
+
+        Returns:
+            RunCheckpoint for the new run
+        """
+        started_at = datetime.utcnow()
+        run = cls(f"{started_at.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}", root)
+        run.path.mkdir(parents=True, exist_ok=True)
+        run._meta = {
+            "run_id": run.run_id,
+            "params": params,
+            "started_at": started_at.isoformat(),
+            "completed": [],
+            "finished": False,
+        }
+        run._write_meta()
+        return run
+
+    @classmethod
+    def load(cls, run_id: str, root: Optional[Path] = None) -> Optional["RunCheckpoint"]:
+        """
+        Open an existing run.
+
+        Args:
+            run_id: Run ID
+            root: Directory containing run directories
+
+        Returns:
+            RunCheckpoint or None if the run does not exist
+        """
+        run = cls(run_id, root)
+        meta_file = run.path / "run.json"
+        if not meta_file.exists():
+            return None
+
+        run._meta = json.loads(meta_file.read_text())
+        return run
+
+    @classmethod
+    def prune(cls, keep: int, root: Optional[Path] = None) -> int:
+        """
+        Delete the oldest finished runs, keeping the newest ones.
+
+        Unfinished runs are kept so they can still be resumed.
+
+        Args:
+            keep: Number of finished runs to keep
+            root: Directory containing run directories
+
+        Returns:
+            Number of runs deleted
+        """
+        root = root or cls.default_root()
+        if not root.exists():
+            return 0
+
+        finished = []
+        for path in sorted(root.iterdir(), reverse=True):
+            run = cls.load(path.name, root)
+            if run and run.finished:
+                finished.append(run)
+
+        for run in finished[keep:]:
+            shutil.rmtree(run.path, ignore_errors=True)
+
+        deleted = max(len(finished) - keep, 0)
+        if deleted:
+            logger.debug(f"Pruned {deleted} finished discovery runs")
+        return deleted
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        """Parameters the run was started with"""
+        return self._meta["params"]
+
+    @property
+    def started_at(self) -> datetime:
+        """When the run was first started"""
+        return datetime.fromisoformat(self._meta["started_at"])
+
+    @property
+    def completed(self) -> List[str]:
+        """Completed stages in order"""
+        return list(self._meta["completed"])
+
+    @property
+    def finished(self) -> bool:
+        """Whether the whole run completed"""
+        return self._meta["finished"]
+
+    def is_complete(self, stage: str) -> bool:
+        """Check whether a stage's output was saved"""
+        return stage in self._meta["completed"]
+
+    def save_stage(self, stage: str, data: Any) -> None:
+        """
+        Save a stage's output and mark it complete.
+
+        Args:
+            stage: Stage name
+            data: JSON-serializable output
+        """
+        self._write_json(self.path / f"{stage}.json", data)
+        with self._lock:
+            if stage not in self._meta["completed"]:
+                self._meta["completed"].append(stage)
+            self._write_meta()
+
+    def load_stage(self, stage: str) -> Optional[Any]:
+        """Load a completed stage's output"""
+        stage_file = self.path / f"{stage}.json"
+        return json.loads(stage_file.read_text()) if stage_file.exists() else None
+
+    def append_record(self, stage: str, key: str, data: Any) -> None:
+        """
+        Append one per-document output (thread-safe).
+
+        Args:
+            stage: Stage name
+            key: Record key, typically the document ID
+            data: JSON-serializable output
+        """
+        line = json.dumps({"key": key, "data": data})
+        with self._lock:
+            with open(self.path / f"{stage}.jsonl", "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def load_records(self, stage: str) -> Dict[str, Any]:
+        """
+        Load per-document outputs, later records replacing earlier ones.
+
+        A line cut short by a crash is skipped.
+
+        Returns:
+            Dict mapping record key to output
+        """
+        records_file = self.path / f"{stage}.jsonl"
+        if not records_file.exists():
+            return {}
+
+        records = {}
+        with open(records_file, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                records[record["key"]] = record["data"]
+        return records
+
+    def finish(self) -> None:
+        """Mark the whole run as completed"""
+        with self._lock:
+            self._meta["finished"] = True
+            self._meta["finished_at"] = datetime.utcnow().isoformat()
+            self._write_meta()
+
+    def _write_meta(self) -> None:
+        """Write run.json"""
+        self._write_json(self.path / "run.json", self._meta)
+
+    @staticmethod
+    def _write_json(path: Path, data: Any) -> None:
+        """Write JSON atomically so a crash never leaves a truncated file"""
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data))
+        os.replace(tmp_path, path)
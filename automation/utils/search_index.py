@@ -0,0 +1,226 @@
+"""
+Search Index - Local BM25 inverted index over cached documents
+"""
+
+import json
+import math
+import re
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Tuple
+
+from utils.local_store import SQLiteStore
+from models.document import DocumentContent
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset("""
+    a an and are as at be but by for from has have if in into is it its of on or
+    so that the their them there they this to was we were will with you your
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase index terms.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Terms in order, without stopwords
+    """
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS]
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    """Epoch seconds, treating naive datetimes as UTC like the Drive client does"""
+    if not value:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class SearchIndex(SQLiteStore):
+    """
+    Inverted index with BM25 ranking.
+
+    Each document is indexed at the version it was read at, so re-adding
+    an unchanged document is a no-op and an edited one replaces its
+    postings. The Drive listing metadata is stored alongside, so results
+    have the same shape as a Drive search.
+    """
+
+    DB_NAME = "search_index.db"
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS docs (
+            doc_id TEXT PRIMARY KEY,
+            version TEXT,
+            doc_type TEXT,
+            modified_at REAL,
+            length INTEGER NOT NULL,
+            metadata TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS postings (
+            term TEXT NOT NULL,
+            doc_id TEXT NOT NULL,
+            tf INTEGER NOT NULL,
+            PRIMARY KEY (term, doc_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_postings_doc ON postings (doc_id);
+    """
+
+    # BM25 parameters
+    K1 = 1.2
+    B = 0.75
+
+    def get_version(self, doc_id: str) -> Optional[str]:
+        """Get the version a document was indexed at"""
+        rows = self.query("SELECT version FROM docs WHERE doc_id = ?", (doc_id,))
+        return rows[0]["version"] if rows else None
+
+    def add(
+        self,
+        document: DocumentContent,
+        version: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        Index a document, replacing any older version.
+
+        Args:
+            document: Document content
+            version: Version the content was read at
+            metadata: Drive metadata to return in results
+
+        Returns:
+            True if the index changed
+        """
+        if version and self.get_version(document.id) == version:
+            return False
+
+        terms = Counter(tokenize(f"{document.title}\n{document.content}"))
+        metadata = metadata or {
+            "id": document.id,
+            "name": document.title,
+            "webViewLink": document.url,
+            "modifiedTime": document.modified_at.isoformat() if document.modified_at else None,
+        }
+
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM postings WHERE doc_id = ?", (document.id,))
+            conn.executemany(
+                "INSERT INTO postings VALUES (?, ?, ?)",
+                [(term, document.id, tf) for term, tf in terms.items()],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO docs VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    document.id,
+                    version,
+                    document.doc_type.value,
+                    _timestamp(document.modified_at),
+                    sum(terms.values()),
+                    json.dumps(metadata),
+                ),
+            )
+        return True
+
+    def remove(self, doc_id: str) -> None:
+        """Remove a document from the index"""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+            conn.execute("DELETE FROM docs WHERE doc_id = ?", (doc_id,))
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = 50,
+        require_all: bool = False,
+        doc_types: Optional[List[str]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank documents against a query with BM25.
+
+        Args:
+            query: Free-text query
+            limit: Maximum results (None for all)
+            require_all: Only match documents containing every query term
+                         (e.g. all parts of a name)
+            doc_types: Restrict to these doc types ("docs", "sheets", ...)
+            date_from: Modified after this date
+            date_to: Modified before this date
+
+        Returns:
+            (doc_id, score) pairs, best first
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        stats = self.query("SELECT COUNT(*) AS n, AVG(length) AS avgdl FROM docs")[0]
+        total, avgdl = stats["n"], stats["avgdl"] or 1.0
+        if not total:
+            return []
+
+        filters, params = [], []
+        if doc_types:
+            filters.append(f"d.doc_type IN ({', '.join('?' * len(doc_types))})")
+            params.extend(doc_types)
+        if date_from:
+            filters.append("d.modified_at >= ?")
+            params.append(_timestamp(date_from))
+        if date_to:
+            filters.append("d.modified_at <= ?")
+            params.append(_timestamp(date_to))
+        where = "".join(f" AND {f}" for f in filters)
+
+        scores: Dict[str, float] = {}
+        matched: Counter = Counter()
+        for term in terms:
+            rows = self.query(
+                "SELECT p.doc_id, p.tf, d.length FROM postings p "
+                f"JOIN docs d ON d.doc_id = p.doc_id WHERE p.term = ?{where}",
+                [term, *params],
+            )
+            if not rows:
+                if require_all:
+                    return []
+                continue
+
+            df = len(rows)
+            idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+            for row in rows:
+                tf = row["tf"]
+                norm = tf + self.K1 * (1 - self.B + self.B * row["length"] / avgdl)
+                scores[row["doc_id"]] = scores.get(row["doc_id"], 0.0) + idf * tf * (self.K1 + 1) / norm
+                matched[row["doc_id"]] += 1
+
+        if require_all:
+            scores = {d: s for d, s in scores.items() if matched[d] == len(terms)}
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit] if limit else ranked
+
+    def get_metadata(self, doc_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the stored Drive metadata of documents"""
+        metadata = {}
+        # Chunked to stay under SQLite's bound parameter limit
+        for i in range(0, len(doc_ids), 500):
+            chunk = doc_ids[i:i + 500]
+            rows = self.query(
+                f"SELECT doc_id, metadata FROM docs WHERE doc_id IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            metadata.update((row["doc_id"], json.loads(row["metadata"])) for row in rows)
+        return metadata
+
+    def stats(self) -> Dict[str, int]:
+        """Get document and term counts"""
+        docs = self.query("SELECT COUNT(*) AS n FROM docs")[0]["n"]
+        terms = self.query("SELECT COUNT(DISTINCT term) AS n FROM postings")[0]["n"]
+        return {"documents": docs, "terms": terms}
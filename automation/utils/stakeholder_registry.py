@@ -0,0 +1,340 @@
+"""
+Stakeholder Registry - Indexed lookup and entity resolution of stakeholder profiles
+"""
+
+import difflib
+import re
+from typing import Optional, List, Dict, FrozenSet, Iterator, Set, Tuple
+
+from models.stakeholder import StakeholderProfile
+
+
+PARENTHETICAL_PATTERN = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+TRAILING_NOTE_PATTERN = re.compile(r"[(\[]([^)\]]+)[)\]]\s*$")
+NAME_TOKEN_PATTERN = re.compile(r"[^\W_]+", re.UNICODE)
+
+HONORIFICS = frozenset({"mr", "mrs", "ms", "miss", "mx", "dr", "prof", "sir"})
+SUFFIXES = frozenset({"jr", "sr", "ii", "iii", "iv", "phd", "md"})
+
+# Known short forms of first names. Short forms shared by several names
+# ("Sam" for Samuel or Samantha, "Alex", "Chris") are left out, so they only
+# match when the email or department agrees.
+NICKNAMES: Dict[str, FrozenSet[str]] = {
+    "abigail": frozenset({"abby"}),
+    "alexander": frozenset({"xander"}),
+    "andrew": frozenset({"andy", "drew"}),
+    "anthony": frozenset({"tony"}),
+    "benjamin": frozenset({"ben", "benji"}),
+    "catherine": frozenset({"cathy", "cat"}),
+    "charles": frozenset({"charlie", "chuck"}),
+    "daniel": frozenset({"dan", "danny"}),
+    "david": frozenset({"dave"}),
+    "edward": frozenset({"ed", "eddie", "ted"}),
+    "elizabeth": frozenset({"liz", "beth", "betsy", "eliza"}),
+    "jacob": frozenset({"jake"}),
+    "james": frozenset({"jim", "jimmy", "jamie"}),
+    "jennifer": frozenset({"jen", "jenny"}),
+    "jonathan": frozenset({"jon", "jonny"}),
+    "joseph": frozenset({"joe", "joey"}),
+    "katherine": frozenset({"kate", "katie", "kathy"}),
+    "kenneth": frozenset({"ken", "kenny"}),
+    "margaret": frozenset({"maggie", "meg", "peggy"}),
+    "matthew": frozenset({"matt"}),
+    "michael": frozenset({"mike", "mikey"}),
+    "nicholas": frozenset({"nick"}),
+    "patricia": frozenset({"patty", "trish"}),
+    "rebecca": frozenset({"becky"}),
+    "richard": frozenset({"rick", "rich"}),
+    "robert": frozenset({"rob", "bob", "bobby"}),
+    "samuel": frozenset({"sammy"}),
+    "stephen": frozenset({"steve"}),
+    "steven": frozenset({"steve"}),
+    "susan": frozenset({"sue", "susie"}),
+    "thomas": frozenset({"tom", "tommy"}),
+    "timothy": frozenset({"tim"}),
+    "victoria": frozenset({"vicky", "tori"}),
+    "william": frozenset({"will", "bill", "billy", "liam"}),
+}
+
+
+def name_tokens(name: str) -> List[str]:
+    """
+    Split a person's name into normalized tokens.
+
+    Parenthesized notes ("S. Lee (Finance)"), honorifics, suffixes and
+    punctuation are dropped, so "Dr. Samuel Lee, Jr." gives ["samuel", "lee"].
+
+    Args:
+        name: Name as written in notes
+
+    Returns:
+        Lowercase name tokens in order
+    """
+    tokens = NAME_TOKEN_PATTERN.findall(PARENTHETICAL_PATTERN.sub(" ", name).lower())
+    return [t for t in tokens if t not in HONORIFICS and t not in SUFFIXES]
+
+
+def normalize_name(name: str) -> str:
+    """Normalized form of a name, used as an exact-match key"""
+    return " ".join(name_tokens(name))
+
+
+def name_department(name: str) -> str:
+    """
+    Department hint written after a name, e.g. "Finance" in "S. Lee (Finance)".
+
+    Args:
+        name: Name as written in notes
+
+    Returns:
+        Text of a trailing parenthetical, or "" if there is none
+    """
+    match = TRAILING_NOTE_PATTERN.search(name)
+    return match.group(1).strip() if match else ""
+
+
+class StakeholderRegistry:
+    """
+    In-memory store of stakeholder profiles with name and email indexes.
+
+    Lookups go from cheap to expensive:
+
+    1. email
+    2. exact name (case-insensitive) and every name a profile was matched under
+    3. normalized name ("Dr. Sam Lee" == "sam lee")
+    4. fuzzy match within blocks of candidates sharing a last name or a
+       first initial and last name, so "Robert Lee" and "S. Lee (Finance)"
+       resolve to "Bob Lee" and "Sam Lee" without comparing against every
+       profile
+
+    Fuzzy matches must be unambiguous: if "S. Lee" fits both "Sam Lee" and
+    "Sarah Lee", nothing is returned, unless the email or department
+    (also read from a trailing note, as in "S. Lee (Finance)") agrees with
+    only one of them. A first name that is only a prefix of another
+    ("Dan" / "Dana") or a lone first name ("Sam") matches only when the
+    email or department agrees, and a conflicting email or department
+    rules a candidate out.
+    """
+
+    # Minimum similarity for a fuzzy match
+    MATCH_THRESHOLD = 0.85
+    # Minimum length for a first name to match as a prefix ("Sam" ~ "Samuel")
+    MIN_PREFIX = 3
+
+    def __init__(self):
+        self._profiles: Dict[str, StakeholderProfile] = {}
+        self._by_name: Dict[str, str] = {}
+        self._by_key: Dict[str, str] = {}
+        self._by_email: Dict[str, str] = {}
+        self._blocks: Dict[str, Set[str]] = {}
+        self._keys: Dict[str, Set[Tuple[str, str]]] = {}  # (index, key) owned by each profile ID
+
+    def __contains__(self, profile_id: str) -> bool:
+        return profile_id in self._profiles
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def __iter__(self) -> Iterator[StakeholderProfile]:
+        return iter(list(self._profiles.values()))
+
+    def get(self, profile_id: str) -> Optional[StakeholderProfile]:
+        """Get a profile by ID"""
+        return self._profiles.get(profile_id)
+
+    def add(self, profile: StakeholderProfile) -> None:
+        """
+        Add or re-index a profile under its name and email.
+
+        Args:
+            profile: Profile to store
+        """
+        self._profiles[profile.id] = profile
+        self.add_alias(profile.id, profile.name)
+        if profile.email:
+            self._own(self._by_email, profile.email.strip().lower(), profile.id, "email")
+
+    def add_alias(self, profile_id: str, name: str) -> None:
+        """
+        Index another name a profile is known under.
+
+        Args:
+            profile_id: Profile ID
+            name: Name as written in notes
+        """
+        if not name or profile_id not in self._profiles:
+            return
+
+        self._own(self._by_name, name.strip().lower(), profile_id, "name")
+        key = normalize_name(name)
+        if not key:
+            return
+        if self._own(self._by_key, key, profile_id, "key"):
+            for block in self._block_keys(key.split()):
+                self._blocks.setdefault(block, set()).add(profile_id)
+
+    def remove(self, profile_id: str) -> Optional[StakeholderProfile]:
+        """
+        Remove a profile and all of its index entries.
+
+        Args:
+            profile_id: Profile ID
+
+        Returns:
+            Removed profile or None
+        """
+        profile = self._profiles.pop(profile_id, None)
+        if not profile:
+            return None
+
+        indexes = {"name": self._by_name, "key": self._by_key, "email": self._by_email}
+        for kind, key in self._keys.pop(profile_id, set()):
+            if indexes[kind].get(key) == profile_id:
+                del indexes[kind][key]
+            if kind != "key":
+                continue
+            for block in self._block_keys(key.split()):
+                members = self._blocks.get(block)
+                if members:
+                    members.discard(profile_id)
+                    if not members:
+                        del self._blocks[block]
+        return profile
+
+    def resolve(
+        self,
+        name: str,
+        email: str = "",
+        department: str = "",
+        fuzzy: bool = True,
+    ) -> Optional[StakeholderProfile]:
+        """
+        Find the profile of the person a name (and email) refers to.
+
+        Args:
+            name: Name as written in notes
+            email: Email address, if known
+            department: Department, if known
+            fuzzy: Whether to fall back to a fuzzy match
+
+        Returns:
+            Matching profile or None
+        """
+        if email:
+            profile_id = self._by_email.get(email.strip().lower())
+            if profile_id:
+                return self._profiles[profile_id]
+
+        if not name:
+            return None
+
+        profile_id = self._by_name.get(name.strip().lower())
+        if profile_id:
+            return self._profiles[profile_id]
+
+        tokens = name_tokens(name)
+        if not tokens:
+            return None
+
+        profile_id = self._by_key.get(" ".join(tokens))
+        if profile_id:
+            return self._profiles[profile_id]
+
+        if not fuzzy:
+            return None
+        department = normalize_name(department or name_department(name))
+        return self._fuzzy_match(tokens, email.strip().lower(), department)
+
+    def _fuzzy_match(self, tokens: List[str], email: str, department: str) -> Optional[StakeholderProfile]:
+        """Best unambiguous match among the profiles sharing a block"""
+        candidates: Set[str] = set()
+        for block in self._block_keys(tokens):
+            candidates |= self._blocks.get(block, set())
+
+        matches: List[Tuple[bool, float, str]] = []
+        for profile_id in candidates:
+            profile = self._profiles[profile_id]
+            profile_email = profile.email.strip().lower()
+            if email and profile_email and email != profile_email:
+                continue
+
+            # A note after the name may give the role rather than the department
+            known = {normalize_name(profile.department), normalize_name(profile.role)} - {""}
+            if department and profile.department and department not in known:
+                continue
+
+            corroborated = bool((email and email == profile_email) or (department and department in known))
+            score = max(
+                (
+                    self._similarity(tokens, key.split(), corroborated)
+                    for kind, key in self._keys.get(profile_id, ())
+                    if kind == "key"
+                ),
+                default=0.0,
+            )
+            if score >= self.MATCH_THRESHOLD:
+                matches.append((corroborated, score, profile_id))
+
+        # A candidate with an agreeing email or department comes first, so
+        # equally close names are told apart by it
+        matches.sort(reverse=True)
+        if not matches or (len(matches) > 1 and matches[1][:2] == matches[0][:2]):
+            return None
+        return self._profiles[matches[0][2]]
+
+    def _own(self, index: Dict[str, str], key: str, profile_id: str, kind: str) -> bool:
+        """Point an index key at a profile unless another profile already has it"""
+        if index.setdefault(key, profile_id) != profile_id:
+            return False
+        self._keys.setdefault(profile_id, set()).add((kind, key))
+        return True
+
+    def _block_keys(self, tokens: List[str]) -> List[str]:
+        """Blocking keys: last name, first initial + last name, and a lone first name"""
+        if len(tokens) == 1:
+            return [f"last:{tokens[0]}", f"first:{tokens[0][:self.MIN_PREFIX]}"]
+        return [
+            f"last:{tokens[-1]}",
+            f"initial:{tokens[0][0]}:{tokens[-1]}",
+            f"first:{tokens[0][:self.MIN_PREFIX]}",
+        ]
+
+    def _similarity(self, tokens: List[str], other: List[str], corroborated: bool) -> float:
+        """
+        Similarity of two tokenized names in [0, 1].
+
+        Last names must agree (allowing a typo); first names may be equal,
+        an initial of one another, or a known short form ("Bob" / "Robert").
+        Lone first names and plain prefixes ("Dan" / "Dana") need the email
+        or department to agree.
+        """
+        if len(tokens) == 1 or len(other) == 1:
+            # A lone first name only matches the first name of a full name
+            single, full = (tokens, other) if len(tokens) == 1 else (other, tokens)
+            if len(full) == 1:
+                return self._first_name_similarity(single[0], full[0], corroborated)
+            if not corroborated:
+                return 0.0
+            return self._first_name_similarity(single[0], full[0], corroborated) * 0.95
+
+        last = difflib.SequenceMatcher(None, tokens[-1], other[-1]).ratio()
+        if last < self.MATCH_THRESHOLD:
+            return 0.0
+        return min(last, self._first_name_similarity(tokens[0], other[0], corroborated))
+
+    def _first_name_similarity(self, first: str, other: str, corroborated: bool) -> float:
+        """Similarity of two first names, treating initials and short forms as matches"""
+        if first == other:
+            return 1.0
+        shorter, longer = sorted((first, other), key=len)
+        if len(shorter) == 1:
+            return 0.9 if longer.startswith(shorter) else 0.0
+        if shorter in NICKNAMES.get(longer, ()):
+            return 0.9
+        if NICKNAMES.get(first, frozenset()) & NICKNAMES.get(other, frozenset()):
+            # Spelling variants sharing a short form ("Stephen" / "Steven")
+            return 0.9
+        if longer.startswith(shorter):
+            # "Dan" may be Daniel or Dana, so only trust a prefix with corroboration
+            return 0.9 if corroborated and len(shorter) >= self.MIN_PREFIX else 0.0
+        return difflib.SequenceMatcher(None, first, other).ratio()
@@ -0,0 +1,264 @@
+"""
+Vector Index - Local TF-IDF similarity index over cached documents
+"""
+
+import zlib
+from collections import Counter
+from typing import Optional, List, Dict, Iterable, Tuple
+
+import numpy as np
+
+from utils.local_store import SQLiteStore
+from utils.search_index import tokenize
+from models.document import DocumentContent
+
+
+def hash_features(text: str, dimensions: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Hash the terms of a text into a sparse term-frequency vector.
+
+    CRC32 is used rather than hash() so buckets are stable across processes.
+
+    Args:
+        text: Text to vectorize
+        dimensions: Number of hash buckets
+
+    Returns:
+        (sorted bucket indices, counts) as int32 / float32 arrays
+    """
+    buckets = Counter(zlib.crc32(term.encode("utf-8")) % dimensions for term in tokenize(text))
+    if not buckets:
+        return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32)
+
+    indices = np.fromiter(sorted(buckets), dtype=np.int32, count=len(buckets))
+    counts = np.fromiter((buckets[i] for i in indices), dtype=np.float32, count=len(buckets))
+    return indices, counts
+
+
+class VectorIndex(SQLiteStore):
+    """
+    Hashed TF-IDF vectors with cosine top-k queries.
+
+    Term counts are stored per document and version, and kept in memory as
+    a CSR matrix (indptr/indices/data NumPy arrays). IDF weights are
+    recomputed from the current document frequencies whenever the matrix
+    changes, so adding documents incrementally keeps scores consistent.
+    """
+
+    DB_NAME = "vectors.db"
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS vectors (
+            doc_id TEXT PRIMARY KEY,
+            version TEXT,
+            indices BLOB NOT NULL,
+            counts BLOB NOT NULL
+        );
+    """
+
+    DIMENSIONS = 2 ** 18
+
+    def __init__(self, db_path: Optional[str] = None):
+        super().__init__(db_path)
+        self._rows: Optional[Dict[str, Tuple[Optional[str], np.ndarray, np.ndarray]]] = None
+        self._matrix: Optional[Dict[str, np.ndarray]] = None
+        self._doc_ids: List[str] = []
+
+    @property
+    def rows(self) -> Dict[str, Tuple[Optional[str], np.ndarray, np.ndarray]]:
+        """Lazily loaded (version, indices, counts) by doc ID"""
+        with self._lock:
+            if self._rows is None:
+                self._rows = {
+                    row["doc_id"]: (
+                        row["version"],
+                        np.frombuffer(row["indices"], dtype=np.int32),
+                        np.frombuffer(row["counts"], dtype=np.float32),
+                    )
+                    for row in self.query("SELECT doc_id, version, indices, counts FROM vectors")
+                }
+            return self._rows
+
+    def get_version(self, doc_id: str) -> Optional[str]:
+        """Get the version a document was indexed at"""
+        row = self.rows.get(doc_id)
+        return row[0] if row else None
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def add(self, document: DocumentContent, version: Optional[str] = None) -> bool:
+        """
+        Index a document, replacing any older version.
+
+        Args:
+            document: Document content
+            version: Version the content was read at
+
+        Returns:
+            True if the index changed
+        """
+        if version and self.get_version(document.id) == version:
+            return False
+
+        indices, counts = hash_features(f"{document.title}\n{document.content}", self.DIMENSIONS)
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO vectors VALUES (?, ?, ?, ?)",
+                (document.id, version, indices.tobytes(), counts.tobytes()),
+            )
+            self.rows[document.id] = (version, indices, counts)
+            self._matrix = None
+        return True
+
+    def remove(self, doc_id: str) -> None:
+        """Remove a document from the index"""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM vectors WHERE doc_id = ?", (doc_id,))
+            self.rows.pop(doc_id, None)
+            self._matrix = None
+
+    def most_similar(
+        self,
+        doc_id: str,
+        k: int = 10,
+        min_score: float = 0.0,
+        among: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Find the indexed documents most similar to an indexed document.
+
+        Args:
+            doc_id: Indexed document ID
+            k: Maximum results
+            min_score: Minimum cosine similarity
+            among: Only rank these document IDs (default: the whole index)
+
+        Returns:
+            (doc_id, cosine similarity) pairs, best first, excluding doc_id itself
+        """
+        with self._lock:
+            matrix = self._build_matrix()
+            if doc_id not in matrix["positions"]:
+                return []
+
+            row = matrix["positions"][doc_id]
+            start, end = matrix["indptr"][row], matrix["indptr"][row + 1]
+            query = np.zeros(self.DIMENSIONS, dtype=np.float32)
+            query[matrix["indices"][start:end]] = matrix["data"][start:end]
+
+            candidates = None
+            if among is not None:
+                positions = matrix["positions"]
+                candidates = np.fromiter(
+                    (positions[d] for d in set(among) if d in positions), dtype=np.int64
+                )
+            return self._top_k(matrix, query, k, min_score, exclude=row, candidates=candidates)
+
+    def similar_to_text(
+        self,
+        text: str,
+        k: int = 10,
+        min_score: float = 0.0,
+    ) -> List[Tuple[str, float]]:
+        """
+        Find the indexed documents most similar to a piece of text.
+
+        Args:
+            text: Query text
+            k: Maximum results
+            min_score: Minimum cosine similarity
+
+        Returns:
+            (doc_id, cosine similarity) pairs, best first
+        """
+        indices, counts = hash_features(text, self.DIMENSIONS)
+        if not len(indices):
+            return []
+
+        with self._lock:
+            matrix = self._build_matrix()
+            weights = (1 + np.log(counts)) * matrix["idf"][indices]
+            query = np.zeros(self.DIMENSIONS, dtype=np.float32)
+            query[indices] = weights / np.linalg.norm(weights)
+            return self._top_k(matrix, query, k, min_score)
+
+    def _build_matrix(self) -> Dict[str, np.ndarray]:
+        """Build the L2-normalized TF-IDF CSR matrix if the index changed"""
+        if self._matrix is not None:
+            return self._matrix
+
+        doc_ids = list(self.rows)
+        lengths = np.array([len(self.rows[d][1]) for d in doc_ids], dtype=np.int64)
+        indptr = np.zeros(len(doc_ids) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+
+        if doc_ids:
+            indices = np.concatenate([self.rows[d][1] for d in doc_ids])
+            counts = np.concatenate([self.rows[d][2] for d in doc_ids])
+        else:
+            indices = np.zeros(0, dtype=np.int32)
+            counts = np.zeros(0, dtype=np.float32)
+
+        # Each row holds a bucket at most once, so bincount gives document frequency
+        df = np.bincount(indices, minlength=self.DIMENSIONS)
+        idf = (np.log((1 + len(doc_ids)) / (1 + df)) + 1).astype(np.float32)
+
+        data = (1 + np.log(counts)) * idf[indices]
+        norms = np.sqrt(self._row_sums(data * data, indptr))
+        data /= np.repeat(np.where(norms > 0, norms, 1), lengths)
+
+        self._matrix = {
+            "indptr": indptr,
+            "indices": indices,
+            "data": data,
+            "idf": idf,
+            "positions": {doc_id: i for i, doc_id in enumerate(doc_ids)},
+        }
+        self._doc_ids = doc_ids
+        return self._matrix
+
+    def _top_k(
+        self,
+        matrix: Dict[str, np.ndarray],
+        query: np.ndarray,
+        k: int,
+        min_score: float,
+        exclude: Optional[int] = None,
+        candidates: Optional[np.ndarray] = None,
+    ) -> List[Tuple[str, float]]:
+        """Cosine scores of all rows (or only candidate rows) against a dense normalized query, best k first"""
+        scores = self._row_sums(matrix["data"] * query[matrix["indices"]], matrix["indptr"])
+        if candidates is not None:
+            allowed = np.full(len(scores), -1.0, dtype=scores.dtype)
+            allowed[candidates] = scores[candidates]
+            scores = allowed
+        if exclude is not None:
+            scores[exclude] = -1.0
+
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            (self._doc_ids[i], float(scores[i]))
+            for i in top
+            if scores[i] > 0 and scores[i] >= min_score
+        ]
+
+    @staticmethod
+    def _row_sums(values: np.ndarray, indptr: np.ndarray) -> np.ndarray:
+        """Sum values per CSR row (rows without entries sum to 0)"""
+        sums = np.zeros(len(indptr) - 1, dtype=np.float32)
+        nonempty = indptr[:-1] < indptr[1:]
+        if values.size:
+            sums[nonempty] = np.add.reduceat(values, indptr[:-1][nonempty])
+        return sums
+
+
+# Global instance (shared so every user sees the same in-memory matrix)
+vector_index = VectorIndex()